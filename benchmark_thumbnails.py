@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Thumbnail decode micro-benchmark - old full decode + LANCZOS vs. draft decode of the smallest variant
+
+Usage:
+    python benchmark_thumbnails.py [--iterations N] [--video-id ID]
+
+Without --video-id the thumbnails are synthesized locally (no network). With
+--video-id the real YouTube variants of that video are downloaded once first.
+"""
+
+import sys
+import time
+import argparse
+from io import BytesIO
+from PIL import Image, ImageFilter
+
+from core.thumbnail_cache import ThumbnailCache, THUMBNAIL_VARIANTS
+
+TARGET_SIZES = [(80, 60), (120, 90)]
+
+
+def synthesize_jpeg(size):
+    """Create a photo-like JPEG (noise plus gradient) of the given size"""
+    width, height = size
+    noise = Image.effect_noise(size, 64).convert('RGB')
+    gradient = Image.linear_gradient('L').resize(size).convert('RGB')
+    image = Image.blend(noise, gradient, 0.5).filter(ImageFilter.SMOOTH)
+    buffer = BytesIO()
+    image.save(buffer, format='JPEG', quality=90)
+    return buffer.getvalue()
+
+
+def download_variants(video_id):
+    """Download every thumbnail variant of a video (missing ones are skipped)"""
+    from utils.network import network_manager
+    session = network_manager.get_session()
+    variants = {}
+    for name, _ in THUMBNAIL_VARIANTS:
+        response = session.get(f"https://i.ytimg.com/vi/{video_id}/{name}.jpg", timeout=10)
+        if response.status_code == 200:
+            variants[name] = response.content
+    return variants
+
+
+def legacy_decode(data, size):
+    """The previous pipeline: decode at native resolution, then LANCZOS"""
+    return Image.open(BytesIO(data)).resize(size, Image.LANCZOS)
+
+
+def time_per_call(func, data, size, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func(data, size)
+    return (time.perf_counter() - start) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--video-id', help='benchmark the real thumbnails of this YouTube video')
+    args = parser.parse_args()
+
+    if args.video_id:
+        variants = download_variants(args.video_id)
+    else:
+        variants = {name: synthesize_jpeg(size) for name, size in THUMBNAIL_VARIANTS}
+
+    source = 'maxresdefault' if 'maxresdefault' in variants else 'hqdefault'
+    if source not in variants:
+        print("❌ No full-size thumbnail available")
+        return 1
+
+    print("🖼️ Thumbnail decode benchmark")
+    print("=" * 72)
+    print(f"{'target':>8} | {'old (' + source + ')':>26} | {'new':>26} | {'speedup':>7}")
+    for size in TARGET_SIZES:
+        url = ThumbnailCache.variant_url(f"https://i.ytimg.com/vi/x/{source}.jpg", size)
+        variant = url.rsplit('/', 1)[1].rsplit('.', 1)[0]
+        new_data = variants.get(variant, variants[source])
+
+        old_ms = time_per_call(legacy_decode, variants[source], size, args.iterations)
+        new_ms = time_per_call(ThumbnailCache.decode, new_data, size, args.iterations)
+        old = f"{old_ms:6.2f} ms {len(variants[source]) / 1024:7.1f} KB"
+        new = f"{new_ms:6.2f} ms {len(new_data) / 1024:7.1f} KB"
+        label = f"{size[0]}x{size[1]}"
+        print(f"{label:>8} | {old:>26} | {new:>26} | {old_ms / new_ms:6.1f}x")
+
+    # Draft mode alone (same full-size source, reduced-scale decode)
+    size = TARGET_SIZES[0]
+    old_ms = time_per_call(legacy_decode, variants[source], size, args.iterations)
+    draft_ms = time_per_call(ThumbnailCache.decode, variants[source], size, args.iterations)
+    print("-" * 72)
+    print(f"Draft decode of {source} to {size[0]}x{size[1]}: {old_ms:.2f} ms -> {draft_ms:.2f} ms "
+          f"({old_ms / draft_ms:.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+YouTube Downloader - Headless Command Line Entry Point
+
+Downloads videos and playlists without a GUI (no tkinter needed) and reports
+progress as JSON lines on stdout, one event per line. Log messages go to stderr.
+
+Usage:
+    python cli.py URL [URL ...] [-f urls.txt] [-q 1080p] [--audio] [-o DIR] [-j 3]
+
+Events:
+    {"event": "resolved", "url": ..., "video_id": ..., "title": ..., "quality": ...}
+    {"event": "resolve_error", "url": ..., "error": ...}
+    {"event": "progress", "downloaded": ..., "total": ..., "percent": ..., "speed": ..., "eta": ..., "elapsed": ..., "text": ...}
+    {"event": "item", "position": ..., "total": ..., "status": ..., "title": ...}  (status "skipped": already downloaded)
+    {"event": "done", "ok": ..., "completed": ..., "skipped": ..., "failed": ..., "message": ...}
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import APP_VERSION, BATCH_CONCURRENCY, PLAYLIST_RESOLVE_WORKERS, CLI_PROGRESS_INTERVAL
+from core import file_manager, DownloadManager
+
+
+class JsonLinesReporter:
+    """Writes download events as JSON lines (safe to call from any thread)"""
+
+    def __init__(self, stream, progress_interval=CLI_PROGRESS_INTERVAL):
+        """
+        Args:
+            stream: Text stream the events are written to
+            progress_interval (float): Minimum seconds between two progress events
+        """
+        self.stream = stream
+        self.progress_interval = progress_interval
+        self._lock = threading.Lock()
+        self._last_progress = 0
+        self._last_text = None
+        self.completed = 0
+        self.skipped = 0
+        self.failed = 0
+
+    def emit(self, event, **fields):
+        """Write one event"""
+        line = json.dumps(dict(event=event, time=round(time.time(), 3), **fields), ensure_ascii=False)
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def on_progress(self, downloaded, total, percentage, speed, elapsed, custom_text=None):
+        """DownloadManager progress callback (throttled, status text changes always pass)"""
+        now = time.monotonic()
+        with self._lock:
+            if custom_text == self._last_text and now - self._last_progress < self.progress_interval:
+                return
+            self._last_progress = now
+            self._last_text = custom_text
+        eta = None
+        if speed > 0 and total > 0:
+            eta = int(max(total - downloaded, 0) / (speed * 1024 * 1024))
+        self.emit(
+            "progress", downloaded=downloaded, total=total, percent=round(percentage, 1),
+            speed=round(speed, 2), eta=eta, elapsed=elapsed, text=custom_text
+        )
+
+    def on_item(self, video_index, status, video_title, current, total):
+        """DownloadManager batch progress callback"""
+        with self._lock:
+            if status == 'completed':
+                self.completed += 1
+            elif status == 'skipped':
+                self.skipped += 1  # already in the download archive
+            elif status == 'error':
+                self.failed += 1
+        self.emit("item", position=current, total=total, status=status, title=video_title)
+
+
+def read_urls(args):
+    """
+    Collect the URLs given on the command line and in URL-list files
+
+    Returns:
+        list: URLs in order, duplicates removed (blank lines and # comments are skipped)
+    """
+    urls = list(args.urls)
+    for path in args.file or []:
+        with (sys.stdin if path == '-' else open(path, encoding='utf-8')) as f:
+            urls.extend(line.strip() for line in f)
+    unique = []
+    for url in urls:
+        if url and not url.startswith('#') and url not in unique:
+            unique.append(url)
+    return unique
+
+
+def expand_urls(handler, urls, reporter):
+    """
+    Replace playlist URLs with the URLs of their videos
+
+    Returns:
+        list: Video URLs
+    """
+    video_urls = []
+    for url in urls:
+        if handler.is_playlist(url):
+            try:
+                video_urls.extend(handler.load_playlist(url).video_urls)
+            except Exception as e:
+                reporter.emit("resolve_error", url=url, error=str(e))
+        else:
+            video_urls.append(url)
+    return video_urls
+
+
+def resolve_videos(handler, video_urls, quality, audio, reporter, workers=PLAYLIST_RESOLVE_WORKERS):
+    """
+    Load the videos concurrently and build the batch for DownloadManager
+
+    Returns:
+        list: Video dictionaries with video, quality, audio, index, title (input order)
+    """
+    def resolve(url):
+        video = handler.safe_load_video_from_url(url)
+        if video is None:
+            raise Exception("Video could not be loaded")
+        video_quality = quality
+        if quality == 'best' and not audio:
+            resolutions = handler.get_stream_index(video).resolutions
+            video_quality = resolutions[0] if resolutions else '1080p'
+        return video, video.title, video_quality
+
+    selected = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(video_urls))), thread_name_prefix="cli-resolve") as pool:
+        futures = [pool.submit(resolve, url) for url in video_urls]
+        for url, future in zip(video_urls, futures):
+            try:
+                video, title, video_quality = future.result()
+            except Exception as e:
+                reporter.emit("resolve_error", url=url, error=str(e))
+                continue
+            reporter.emit("resolved", url=url, video_id=video.video_id, title=title, quality=video_quality)
+            selected.append({
+                'video': video, 'quality': video_quality, 'audio': audio,
+                'index': len(selected), 'title': title
+            })
+    return selected
+
+
+def parse_args(argv=None):
+    """Parse and validate the command line"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Download YouTube videos and playlists without a GUI (JSON lines on stdout)"
+    )
+    parser.add_argument('urls', nargs='*', metavar='URL', help='video or playlist URL')
+    parser.add_argument('-f', '--file', action='append', metavar='PATH',
+                        help='file with one URL per line ("-" reads stdin); can be repeated')
+    parser.add_argument('-q', '--quality', default='best',
+                        help='best, or a resolution such as 1080p, 720p, 2K, 4K (closest available is used)')
+    parser.add_argument('-a', '--audio', action='store_true', help='download audio only as MP3')
+    parser.add_argument('-o', '--output', default='.', help='output directory (default: current directory)')
+    parser.add_argument('-j', '--concurrency', type=int, default=BATCH_CONCURRENCY,
+                        help=f'videos downloaded at the same time (default: {BATCH_CONCURRENCY})')
+    parser.add_argument('--version', action='version', version=f"%(prog)s {APP_VERSION}")
+    args = parser.parse_args(argv)
+    if not args.urls and not args.file:
+        parser.error("no URLs given (pass URLs or --file)")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+def main(argv=None):
+    """Command line entry point"""
+    args = parse_args(argv)
+
+    # stdout carries the JSON events only; the library's log messages go to stderr
+    reporter = JsonLinesReporter(sys.stdout)
+    sys.stdout = sys.stderr
+
+    output_path = os.path.abspath(args.output)
+    os.makedirs(output_path, exist_ok=True)
+    file_manager.set_download_path_direct(output_path)
+
+    download_manager = DownloadManager()
+    handler = download_manager.youtube_handler  # share its stream caches
+    download_manager.set_progress_callback(reporter.on_progress)
+    download_manager.set_batch_progress_callback(reporter.on_item)
+
+    try:
+        video_urls = expand_urls(handler, read_urls(args), reporter)
+        selected = resolve_videos(handler, video_urls, args.quality, args.audio, reporter)
+    except KeyboardInterrupt:
+        reporter.emit("done", ok=False, completed=0, failed=0, message="Download cancelled")
+        return 130
+
+    if not selected:
+        reporter.emit("done", ok=False, completed=0, failed=0, message="Nothing to download")
+        return 1
+
+    result = {}
+    download_manager.download_selected_videos(
+        selected,
+        success_callback=lambda message: result.update(message=message),
+        error_callback=lambda message: result.update(message=message, error=True),
+        concurrency=args.concurrency
+    )
+
+    cancelled = False
+    while download_manager.is_downloading():
+        try:
+            download_manager.current_thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            # Stop at the next chunk; the batch thread cleans up its temp files
+            cancelled = True
+            download_manager.cancel_download()
+
+    ok = not result.get('error') and not cancelled and reporter.failed == 0
+    reporter.emit(
+        "done", ok=ok, completed=reporter.completed, skipped=reporter.skipped, failed=reporter.failed,
+        message=result.get('message', "Download cancelled" if cancelled else "")
+    )
+    if cancelled:
+        return 130
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,97 @@ RETRY_BACKOFF_FACTOR = 0.5
 REQUEST_TIMEOUT = 30
 MERGE_TIMEOUT = 300
 
+# Fetch the video and audio legs of an adaptive download at the same time
+PARALLEL_STREAM_DOWNLOAD = True
+
+# Multi-connection range downloads (each stream is split into byte ranges)
+SEGMENTED_DOWNLOAD = True
+SEGMENT_CONNECTIONS = 4
+SEGMENT_SIZE = 10 * 1024 * 1024  # 10 MB per range request
+SEGMENT_READ_SIZE = 64 * 1024
+
+# Progress display - redrawn only when the shown values change
+PROGRESS_MIN_INTERVAL_MS = 50   # at most 20 redraws per second
+PROGRESS_MAX_INTERVAL_MS = 250  # idle back-off limit before the UI loop stops
+PROGRESS_LOAD_FACTOR = 10       # frame interval >= 10x the redraw cost
+PROGRESS_BAR_STEP = 0.002       # progress bar moves in 0.2% steps
+
+# Download speed smoothing (time-weighted moving average)
+RATE_HALF_LIFE = 3.0          # seconds after which a speed sample counts half
+RATE_SAMPLE_INTERVAL = 0.25   # minimum seconds between speed samples
+
+# Number of playlist videos downloaded at the same time
+BATCH_CONCURRENCY = 3
+
+# Range requests open at once across all downloads (both legs of every batch job);
+# segmented downloads use their own connection pool of this size
+SEGMENT_POOL_SIZE = SEGMENT_CONNECTIONS * 2 * BATCH_CONCURRENCY
+
+# FFmpeg merges run alongside batch downloads (remuxing is disk bound)
+MERGE_WORKERS = 1
+
+# Pipe adaptive streams straight into FFmpeg instead of writing temp files (POSIX only)
+STREAMING_REMUX = False
+STREAMING_HEADER_PROBE_SIZE = 64 * 1024  # bytes read to find the MP4 index
+
+# Headless CLI - minimum seconds between two JSON progress events
+CLI_PROGRESS_INTERVAL = 0.5
+
+# Download archive - batches skip videos already downloaded to the same folder
+ARCHIVE_DB_FILE = "download_archive.db"  # in the user settings directory
+ARCHIVE_MODE = 'skip'  # 'skip' (size check), 'verify' (also checksum) or 'off'
+ARCHIVE_CHECKSUM_BLOCK = 1024 * 1024  # bytes hashed at the start, middle and end of a file
+
+# Download daemon (job database in the user settings directory)
+DAEMON_HOST = "127.0.0.1"  # local machine only
+DAEMON_PORT = 8765
+DAEMON_WORKERS = 2
+DAEMON_PROGRESS_INTERVAL = 0.5   # minimum seconds between two progress events of a job
+JOB_DB_FILE = "jobs.db"
+JOB_PROGRESS_SAVE_INTERVAL = 2.0  # job progress is written to the database at most this often
+
+# Client strategy statistics (stored in the user settings directory)
+CLIENT_STATS_FILE = "client_stats.json"
+CLIENT_STATS_HALF_LIFE_HOURS = 72  # older results count half as much every 3 days
+CLIENT_STATS_SAVE_INTERVAL = 5.0  # results are written to disk at most this often
+
+# Playlist entries resolved at the same time when a playlist is opened
+PLAYLIST_RESOLVE_WORKERS = 8
+
+# Playlist list view - fixed row height and rows kept alive beyond the viewport
+PLAYLIST_ROW_HEIGHT = 135  # 120px item plus 15px spacing
+PLAYLIST_ROW_OVERSCAN = 3
+PLAYLIST_RENDER_BUDGET_MS = 8  # time spent adding rows per event loop tick
+PLAYLIST_DETAIL_WORKERS = 2  # visible rows whose sized quality options load at the same time
+
+# Playlist thumbnails are fetched in the background for rows near the viewport
+THUMBNAIL_WORKERS = 3
+THUMBNAIL_FLUSH_MS = 50  # finished thumbnails are handed to the UI together
+
+# Thumbnail cache (decoded images in memory, files in the user settings directory)
+THUMBNAIL_CACHE_DIR = "thumbnail_cache"
+THUMBNAIL_MEMORY_ITEMS = 300
+THUMBNAIL_CACHE_TTL_DAYS = 30
+
+# Metadata cache (stored in the user settings directory)
+METADATA_CACHE_DIR = "metadata_cache"
+METADATA_TTL_DAYS = 30  # title, author, length, thumbnail
+PLAYLIST_CACHE_TTL_HOURS = 6
+STREAM_URL_EXPIRY_MARGIN = 600  # seconds before a stream URL's "expire" it is treated as stale
+
+# Resolved streams kept in memory for instant download start
+STREAM_CACHE_MAX_ENTRIES = 256
+STREAM_CACHE_DEFAULT_TTL = 5 * 3600  # for stream URLs without an "expire" parameter
+
+# Quality menu sizes missing from the manifest are probed with parallel HEAD requests
+SIZE_PROBE_WORKERS = 8  # stays below POOL_MAX_SIZE
+SIZE_PROBE_TIMEOUT = 5
+SIZE_PROBE_MAX_ENTRIES = 2048  # cached sizes (a video has a few dozen streams)
+
+# Resume journals kept next to partial downloads
+RESUME_JOURNAL_SUFFIX = '.resume.json'
+RESUME_JOURNAL_MAX_AGE_DAYS = 7
+
 # Network settings
 POOL_CONNECTIONS = 10
 POOL_MAX_SIZE = 10
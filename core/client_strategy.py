@@ -0,0 +1,169 @@
+"""
+Client strategy scoring - try the pytubefix clients that worked recently first
+"""
+
+import os
+import json
+import time
+import atexit
+import tempfile
+import threading
+from config.user_settings import user_settings
+from config.settings import CLIENT_STATS_FILE, CLIENT_STATS_HALF_LIFE_HOURS, CLIENT_STATS_SAVE_INTERVAL
+
+
+class ClientStrategyScorer:
+    """Records per-client success, latency and 403 rate and orders client lists by them"""
+
+    def __init__(self, stats_file=None, save_interval=CLIENT_STATS_SAVE_INTERVAL):
+        """
+        Args:
+            stats_file (Path, optional): JSON file the statistics persist in
+            save_interval (float): Minimum seconds between two writes of the file
+        """
+        self.stats_file = stats_file or (user_settings.settings_dir / CLIENT_STATS_FILE)
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._stats = self._load()
+        self._dirty = False
+        self._last_save = 0
+        self._save_timer = None
+        atexit.register(self.flush)
+
+    def _load(self):
+        """Load persisted statistics (empty on any error)"""
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _schedule_save(self, now):
+        """Save now, or once the save interval has passed (caller holds the lock)"""
+        self._dirty = True
+        if self._save_timer is not None:
+            return
+        delay = self._last_save + self.save_interval - now
+        if delay <= 0:
+            self._save_timer = threading.Thread(target=self.flush, daemon=True)
+        else:
+            self._save_timer = threading.Timer(delay, self.flush)
+            self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def flush(self):
+        """Write pending statistics to disk (atomic, safe to call from any thread)"""
+        with self._save_lock:
+            with self._lock:
+                self._save_timer = None
+                if not self._dirty:
+                    return
+                data = json.dumps(self._stats, indent=2)
+                self._dirty = False
+                self._last_save = time.time()
+            temp_path = None
+            try:
+                # A unique temp file per write - other threads and processes never share it
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(self.stats_file),
+                                                 prefix='.client_stats-', suffix='.tmp', delete=False) as f:
+                    temp_path = f.name
+                    f.write(data)
+                os.replace(temp_path, self.stats_file)
+            except OSError:
+                # Statistics are best effort
+                if temp_path:
+                    try:
+                        os.remove(temp_path)
+                    except OSError:
+                        pass
+
+    @staticmethod
+    def client_name(client_config):
+        """Name used for a client config ("DEFAULT" when no client is forced)"""
+        return client_config.get("client", "DEFAULT")
+
+    @staticmethod
+    def _decay(entry, now):
+        """Age the counters of an entry so recent results dominate"""
+        hours = max(now - entry.get('updated', now), 0) / 3600
+        factor = 0.5 ** (hours / CLIENT_STATS_HALF_LIFE_HOURS)
+        for key in ('attempts', 'successes', 'forbidden'):
+            entry[key] = entry.get(key, 0) * factor
+        entry['updated'] = now
+
+    def record(self, client_name, success, latency, error=None):
+        """
+        Record the outcome of one attempt with a client
+
+        Args:
+            client_name (str): Client name (e.g. "IOS")
+            success (bool): Whether the client delivered a usable video
+            latency (float): Seconds the attempt took
+            error (Exception, optional): Failure reason, used to count 403 responses
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._stats.setdefault(client_name, {})
+            self._decay(entry, now)
+            entry['attempts'] += 1
+            if success:
+                entry['successes'] += 1
+                entry['last_success'] = now
+                # Only successful attempts say how fast a client is
+                previous = entry.get('latency')
+                entry['latency'] = latency if previous is None else previous * 0.7 + latency * 0.3
+            else:
+                entry['last_failure'] = now
+                text = str(error or '')
+                if '403' in text or 'Forbidden' in text:
+                    entry['forbidden'] += 1
+            self._schedule_save(now)
+
+    def score(self, client_name):
+        """
+        Score a client between 0 and 1 (unknown clients score 0.5)
+
+        Returns:
+            float: Higher is better
+        """
+        with self._lock:
+            entry = dict(self._stats.get(client_name, {}))
+        if not entry:
+            return 0.5
+        self._decay(entry, time.time())
+        # Laplace-smoothed success rate, penalized for 403s and slowness
+        success_rate = (entry['successes'] + 1) / (entry['attempts'] + 2)
+        forbidden_rate = entry['forbidden'] / entry['attempts'] if entry['attempts'] else 0
+        latency_penalty = min(entry.get('latency') or 0, 10) * 0.01
+        return success_rate * (1 - 0.5 * forbidden_rate) - latency_penalty
+
+    def order(self, client_configs):
+        """
+        Sort client configs by score (ties keep the given order)
+
+        Args:
+            client_configs (list): Client config dicts for pytubefix.YouTube
+
+        Returns:
+            list: Reordered copy of client_configs
+        """
+        scores = [self.score(self.client_name(config)) for config in client_configs]
+        ranked = sorted(range(len(client_configs)), key=lambda i: -round(scores[i], 3))
+        return [client_configs[i] for i in ranked]
+
+    def get_stats(self):
+        """
+        Get the recorded statistics for display or debugging
+
+        Returns:
+            dict: Client name -> stats dict with a computed "score"
+        """
+        with self._lock:
+            names = list(self._stats)
+        return {name: dict(self._stats[name], score=round(self.score(name), 3)) for name in names}
+
+
+# Global client scorer instance
+client_scorer = ClientStrategyScorer()
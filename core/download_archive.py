@@ -0,0 +1,188 @@
+"""
+Download archive - completed downloads indexed by video, so batches skip what is already on disk
+"""
+
+import os
+import re
+import time
+import hashlib
+import sqlite3
+import threading
+from config.user_settings import user_settings
+from config.settings import ARCHIVE_DB_FILE, ARCHIVE_CHECKSUM_BLOCK
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archive (
+    video_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    output_dir TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    quality TEXT,
+    height INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    checksum TEXT NOT NULL,
+    completed REAL NOT NULL,
+    PRIMARY KEY (video_id, kind, output_dir)
+) WITHOUT ROWID;
+"""
+
+_QUALITY_HEIGHTS = {'8K': 4320, '4K': 2160, '2K': 1440}
+
+
+def quality_height(quality_str):
+    """
+    Vertical resolution a quality string asks for
+
+    Args:
+        quality_str (str): "1080p - Adaptive (1.5 GB)", "720p", "4K", ...
+
+    Returns:
+        int: Height in pixels (0 if it cannot be told from the string)
+    """
+    quality = (quality_str or "").split(' - ')[0].strip()
+    if quality in _QUALITY_HEIGHTS:
+        return _QUALITY_HEIGHTS[quality]
+    match = re.match(r'(\d+)p', quality)
+    return int(match.group(1)) if match else 0
+
+
+def quick_checksum(path, block=ARCHIVE_CHECKSUM_BLOCK):
+    """
+    SHA-1 of a file's size and its first, middle and last blocks
+
+    Reads at most three blocks, so multi-gigabyte videos are checked in milliseconds
+    while truncated or replaced files are still caught.
+
+    Returns:
+        str: Hex digest
+    """
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(str(size).encode('ascii'))
+    with open(path, 'rb') as f:
+        for offset in sorted({0, max(size // 2 - block // 2, 0), max(size - block, 0)}):
+            f.seek(offset)
+            digest.update(f.read(block))
+    return digest.hexdigest()
+
+
+class DownloadArchive:
+    """
+    Completed downloads keyed by (video_id, kind, output directory)
+
+    Entries live in SQLite and are looked up by primary key, so opening the
+    archive and checking an item cost the same with ten or ten thousand entries.
+    """
+
+    def __init__(self, db_path=None):
+        """
+        Args:
+            db_path (str | Path, optional): SQLite database file (inside the user settings directory by default)
+        """
+        self.db_path = str(db_path or (user_settings.settings_dir / ARCHIVE_DB_FILE))
+        self._lock = threading.Lock()
+        self._connection = None
+
+    def _db(self):
+        """Open the database on first use (caller holds the lock)"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            self._connection.row_factory = sqlite3.Row
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+    @staticmethod
+    def _key_dir(output_dir):
+        return os.path.normcase(os.path.abspath(output_dir))
+
+    def get(self, video_id, kind, output_dir):
+        """
+        Get the archive entry of a video
+
+        Args:
+            video_id (str): YouTube video id
+            kind (str): "video" or "audio"
+            output_dir (str): Directory the download was saved to
+
+        Returns:
+            dict: Entry, or None if the video was not downloaded there
+        """
+        with self._lock:
+            row = self._db().execute(
+                "SELECT * FROM archive WHERE video_id = ? AND kind = ? AND output_dir = ?",
+                (video_id, kind, self._key_dir(output_dir))
+            ).fetchone()
+        return dict(row) if row else None
+
+    def record(self, video_id, kind, output_dir, file_path, quality=None):
+        """
+        Record a completed download (replaces an earlier entry of the same video)
+
+        Returns:
+            dict: The new entry, or None if the file does not exist
+        """
+        try:
+            size = os.path.getsize(file_path)
+            checksum = quick_checksum(file_path)
+        except OSError:
+            return None
+        entry = {
+            'video_id': video_id, 'kind': kind, 'output_dir': self._key_dir(output_dir),
+            'file_path': os.path.abspath(file_path), 'quality': quality,
+            'height': quality_height(quality) if kind == 'video' else 0,
+            'size': size, 'checksum': checksum, 'completed': time.time()
+        }
+        with self._lock:
+            self._db().execute(
+                "INSERT OR REPLACE INTO archive VALUES "
+                "(:video_id, :kind, :output_dir, :file_path, :quality, :height, :size, :checksum, :completed)",
+                entry
+            )
+        return entry
+
+    def check(self, video_id, kind, output_dir, quality=None, verify=False):
+        """
+        Decide what a batch should do with a video
+
+        Args:
+            video_id (str): YouTube video id
+            kind (str): "video" or "audio"
+            output_dir (str): Download directory
+            quality (str, optional): Requested quality (higher than archived means upgrade)
+            verify (bool): Also compare the checksum (reads three blocks of the file)
+
+        Returns:
+            tuple: (action, entry) - action is "download" (not archived), "skip",
+                "upgrade" (archived at a lower quality) or "redownload"
+                (file missing, resized or changed)
+        """
+        entry = self.get(video_id, kind, output_dir)
+        if entry is None:
+            return "download", None
+        try:
+            if os.path.getsize(entry['file_path']) != entry['size']:
+                return "redownload", entry
+            if verify and quick_checksum(entry['file_path']) != entry['checksum']:
+                return "redownload", entry
+        except OSError:
+            return "redownload", entry
+        if kind == 'video' and quality_height(quality) > entry['height']:
+            return "upgrade", entry
+        return "skip", entry
+
+    def forget(self, video_id, kind, output_dir):
+        """Remove the entry of a video"""
+        with self._lock:
+            self._db().execute(
+                "DELETE FROM archive WHERE video_id = ? AND kind = ? AND output_dir = ?",
+                (video_id, kind, self._key_dir(output_dir))
+            )
+
+    def count(self):
+        """Number of archived downloads"""
+        with self._lock:
+            return self._db().execute("SELECT COUNT(*) FROM archive").fetchone()[0]
+
+
+# Global download archive instance
+download_archive = DownloadArchive()
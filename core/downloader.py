@@ -3,35 +3,61 @@ Download management and progress tracking
 """
 
 import os
-import time
 import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, Future, wait
 from utils.helpers import safe_filename, parse_quality_string
 from utils.ffmpeg_handler import FFmpegHandler
 from core.youtube_handler import YouTubeHandler
 from core.file_manager import file_manager
+from core.progress import CombinedProgress
+from utils.rate_estimator import RateEstimator
+from core.segmented_downloader import SegmentedDownloader, RangeNotSupportedError
+from core.resume_journal import ResumeJournal
+from core.download_archive import download_archive
+from core.stream_muxer import StreamingMuxer, StreamingRemuxError
+from config.settings import (
+    PARALLEL_STREAM_DOWNLOAD, SEGMENTED_DOWNLOAD,
+    SEGMENT_CONNECTIONS, SEGMENT_SIZE, BATCH_CONCURRENCY, MERGE_WORKERS,
+    STREAMING_REMUX, ARCHIVE_MODE
+)
 from config.user_settings import user_settings
 
 
 class DownloadManager:
     """Manages download operations and progress tracking"""
     
+    # Video ids of running jobs (their temp files must survive other jobs' cleanup),
+    # counted per job so a video queued twice stays protected until both finish.
+    # Shared by every manager: several managers may download into the same folder.
+    _active_video_ids = Counter()
+    _active_lock = threading.Lock()
+    
     def __init__(self):
         self.youtube_handler = YouTubeHandler()
         self.ffmpeg_handler = FFmpegHandler()
+        self.stream_muxer = StreamingMuxer()
         self.stop_flag = False
         self.current_thread = None
         
         # Progress tracking
-        self.start_time = 0
-        self.last_time = 0
         self.last_bytes = 0
         self.current_download_size = 0
+        self.stream_rate = RateEstimator()
         self.progress_callback = None
         
         # Batch download tracking
         self.batch_progress_callback = None
         self.current_video_index = -1
         self.total_videos_in_batch = 0
+        self._batch_progress = None
+        
+        # Guards the batch queue depth counters below
+        self._jobs_lock = threading.Lock()
+        
+        # Batch pipeline: finished downloads are merged by a separate pool
+        self._merge_pool = None
+        self._queue_depths = {'download_waiting': 0, 'downloading': 0, 'merge_waiting': 0, 'merging': 0}
         
         # Video caching to prevent re-fetching
         self.cached_video = None
@@ -60,6 +86,20 @@ class DownloadManager:
         """Cancel the current download operation"""
         self.stop_flag = True
     
+    def get_queue_depths(self):
+        """
+        Get the number of batch jobs in each pipeline stage
+        
+        Returns:
+            dict: download_waiting, downloading, merge_waiting and merging counts
+        """
+        with self._jobs_lock:
+            return dict(self._queue_depths)
+    
+    def _update_queue_depth(self, stage, delta):
+        with self._jobs_lock:
+            self._queue_depths[stage] = max(self._queue_depths[stage] + delta, 0)
+    
     def is_downloading(self):
         """
         Check if a download is currently in progress
@@ -78,17 +118,15 @@ class DownloadManager:
             chunk: Downloaded chunk
             bytes_remaining (int): Bytes remaining to download
         """
+        if self._batch_progress is not None:
+            # Concurrent batch - bytes are aggregated across all running jobs
+            self._batch_progress.on_progress(stream, chunk, bytes_remaining)
+            return
+        
         if self.stop_flag:
             # Raise KeyboardInterrupt to force stop the download stream
             raise KeyboardInterrupt("Download cancelled by user")
         
-        current_time = time.time()
-
-        # Initialize timing if not set
-        if not self.start_time:
-            self.start_time = current_time
-            self.last_time = current_time
-
         # Try to resolve total size if unknown
         if self.current_download_size <= 0:
             total = getattr(stream, 'filesize', None) or getattr(stream, 'filesize_approx', None)
@@ -105,17 +143,11 @@ class DownloadManager:
             bytes_downloaded = self.last_bytes + len(chunk)
             percentage = 0
         
-        # Calculate download speed
-        delta_time = current_time - self.last_time
-        delta_bytes = bytes_downloaded - self.last_bytes
+        # Smoothed download speed (time-weighted, not chunk to chunk)
+        speed = self.stream_rate.update(bytes_downloaded, self.current_download_size)
+        speed_mbps = speed / (1024 * 1024)  # MB per second
         
-        if delta_time > 0:
-            speed = delta_bytes / delta_time  # bytes per second
-            speed_mbps = speed / (1024 * 1024)  # MB per second
-        else:
-            speed_mbps = 0
-        
-        elapsed = int(current_time - self.start_time) if self.start_time else 0
+        elapsed = int(self.stream_rate.elapsed)
         
         # Call progress callback immediately for real-time updates
         if self.progress_callback:
@@ -127,15 +159,28 @@ class DownloadManager:
                 elapsed
             )
         
-        self.last_time = current_time
         self.last_bytes = bytes_downloaded
 
     def _reset_progress_tracking(self, total_size):
         """Reset progress tracking for a new stream download."""
         self.current_download_size = total_size or 0
-        self.start_time = time.time()
-        self.last_time = self.start_time
         self.last_bytes = 0
+        self.stream_rate.reset(self.current_download_size)
+    
+    def get_transfer_stats(self):
+        """
+        Get smoothed rate statistics of the running download
+        
+        Returns:
+            dict: 'stream' - the current single-stream download, and 'batch' -
+                the combined bytes of a concurrent batch (None when no batch runs).
+                Each holds downloaded, total, rate, peak, mean (bytes/s), eta and elapsed.
+        """
+        batch_progress = self._batch_progress
+        return {
+            'stream': self.stream_rate.get_stats(),
+            'batch': batch_progress.get_stats() if batch_progress is not None else None
+        }
     
     def download_single_video(self, video, quality_str, is_audio, output_path):
         """
@@ -146,29 +191,167 @@ class DownloadManager:
             quality_str (str): Quality string (e.g., "1080p - Adaptive (1.5 GB)" or "720p")
             is_audio (bool): Whether to download as audio only
             output_path (str): Output directory path
+            
+        Returns:
+            Future: Pending merge when a batch pipeline queued it, otherwise None
+        """
+        video_id = getattr(video, 'video_id', None)
+        with self._active_lock:
+            self._active_video_ids[video_id] += 1
+        merge = None
+        try:
+            merge = self._download_single_video(video, quality_str, is_audio, output_path)
+            if merge is None:
+                self._archive_download(video, quality_str, is_audio, output_path)
+            else:
+                def archive_when_merged(future):
+                    if not future.cancelled() and future.exception() is None:
+                        self._archive_download(video, quality_str, is_audio, output_path)
+                merge.add_done_callback(archive_when_merged)
+            return merge
+        finally:
+            # Temp files stay protected until a queued merge has consumed them
+            if merge is None:
+                self._release_video_id(video_id)
+            else:
+                merge.add_done_callback(lambda _future: self._release_video_id(video_id))
+    
+    def _release_video_id(self, video_id):
+        with self._active_lock:
+            self._active_video_ids[video_id] -= 1
+            if self._active_video_ids[video_id] <= 0:
+                del self._active_video_ids[video_id]
+    
+    def _archive_download(self, video, quality_str, is_audio, output_path):
+        """Record a finished download in the download archive"""
+        video_id = getattr(video, 'video_id', None)
+        if not video_id:
+            return
+        extension = '.mp3' if is_audio else '.mp4'
+        file_path = os.path.join(output_path, safe_filename(video.title) + extension)
+        if download_archive.record(video_id, 'audio' if is_audio else 'video', output_path, file_path,
+                                   None if is_audio else quality_str):
+            print(f"🗂️ Archived {video_id} ({'MP3' if is_audio else quality_str})")
+    
+    def should_skip(self, video, quality_str, is_audio, output_path):
+        """
+        Check the download archive before downloading a video again
+        
+        Args:
+            video (YouTube): YouTube video object
+            quality_str (str): Requested quality
+            is_audio (bool): Whether the download is audio only
+            output_path (str): Output directory path
+            
+        Returns:
+            bool: True if the file is already on disk at the requested (or a higher) quality
         """
+        mode = user_settings.get("archive_mode", ARCHIVE_MODE)
+        video_id = getattr(video, 'video_id', None)
+        if mode == 'off' or not video_id:
+            return False
+        action, entry = download_archive.check(
+            video_id, 'audio' if is_audio else 'video', output_path, quality_str, verify=(mode == 'verify')
+        )
+        if action == 'skip':
+            print(f"⏭️ Already downloaded: {entry['file_path']}")
+            return True
+        if action == 'upgrade':
+            print(f"⬆️ Upgrading {entry['quality']} download to {quality_str}: {entry['file_path']}")
+        elif action == 'redownload':
+            print(f"🔁 Archived file missing or changed, downloading again: {entry['file_path']}")
+        return False
+    
+    def _download_single_video(self, video, quality_str, is_audio, output_path):
+        """Pick the download path for one video (see download_single_video)"""
         if is_audio:
-            self._download_audio(video, output_path)
+            return self._download_audio(video, output_path)
         else:
             # All video downloads now use adaptive streams for best quality
             if ' - ' in quality_str and 'Adaptive' in quality_str:
                 # Detailed adaptive quality string
                 from utils.helpers import parse_quality_string
                 resolution, stream_type = parse_quality_string(quality_str)
-                self._download_adaptive(video, resolution, output_path)
+                return self._download_adaptive(video, resolution, output_path)
             else:
                 # Simplified quality string - get best adaptive stream
                 best_stream = self.youtube_handler.get_best_stream_for_quality(video, quality_str)
                 if not best_stream:
                     # Fallback to any available adaptive stream
-                    streams = video.streams.filter(file_extension='mp4', adaptive=True, only_video=True)
-                    best_stream = streams.first()
+                    best_stream = self.youtube_handler.get_stream_index(video).first_adaptive_video
                 
                 if not best_stream:
                     raise Exception(f"No adaptive stream found for {quality_str}")
                 
                 # Always use adaptive download for best quality
-                self._download_adaptive_stream(best_stream, video, output_path)
+                return self._download_adaptive_stream(best_stream, video, output_path)
+    
+    def _cleanup_stale_temp_files(self, output_path):
+        """Remove leftover temp files without touching those of other running jobs"""
+        with self._active_lock:
+            in_use = list(self._active_video_ids)
+        self.ffmpeg_handler.cleanup_default_temp_files(output_path, in_use=in_use)
+    
+    @staticmethod
+    def _temp_filename(kind, video, stream):
+        """
+        Build a stable temp file name so an interrupted download can be resumed
+        
+        Args:
+            kind (str): "video" or "audio"
+            video (YouTube): YouTube video object
+            stream: YouTube stream object
+            
+        Returns:
+            str: Temp file name like "video_temp_<video_id>_<itag>.mp4"
+        """
+        video_id = getattr(video, 'video_id', None) or 'unknown'
+        itag = getattr(stream, 'itag', None) or 0
+        return f"{kind}_temp_{video_id}_{itag}.mp4"
+    
+    def _fetch_stream(self, stream, output_path, filename, on_progress, video_id=None):
+        """
+        Download one stream, over parallel range requests when possible
+        
+        Args:
+            stream: YouTube stream object
+            output_path (str): Output directory path
+            filename (str): Target file name
+            on_progress (callable): progress_tracker-compatible callback
+            video_id (str, optional): Video id - enables the resume journal for this file
+            
+        Returns:
+            str: Path of the downloaded file
+        """
+        total_size = getattr(stream, 'filesize', None) or 0
+        use_segments = user_settings.get("segmented_download", SEGMENTED_DOWNLOAD)
+        
+        if use_segments and total_size > 0 and not getattr(stream, 'is_sabr', False):
+            file_path = os.path.join(output_path, filename)
+            downloader = SegmentedDownloader(
+                connections=user_settings.get("segment_connections", SEGMENT_CONNECTIONS),
+                segment_size=user_settings.get("segment_size", SEGMENT_SIZE)
+            )
+            journal = None
+            if video_id:
+                journal = ResumeJournal.load(file_path, video_id, getattr(stream, 'itag', None), total_size)
+            try:
+                downloader.download(
+                    stream.url, file_path, total_size,
+                    on_progress=on_progress,
+                    stream=stream,
+                    stop_check=lambda: self.stop_flag,
+                    journal=journal
+                )
+                if journal and journal.is_complete() and os.path.getsize(file_path) == total_size:
+                    journal.discard()
+                return file_path
+            except RangeNotSupportedError as e:
+                # Other errors keep the partial file and journal for the next attempt
+                print(f"⚠️ Segmented download unavailable ({str(e)[:80]}), using single connection")
+                self.ffmpeg_handler.cleanup_temp_files(file_path)
+        
+        return stream.download(output_path=output_path, filename=filename)
     
     def _download_audio(self, video, output_path):
         """Download audio only as MP3 - INSTANT START"""
@@ -189,7 +372,7 @@ class DownloadManager:
         full_output_path = os.path.join(output_path, output_filename)
         
         try:
-            audio_stream.download(output_path=output_path, filename=output_filename)
+            self._fetch_stream(audio_stream, output_path, output_filename, self.progress_tracker)
         except KeyboardInterrupt:
             # User cancelled - propagate the cancellation
             raise
@@ -208,52 +391,32 @@ class DownloadManager:
         if not video_stream or not audio_stream:
             raise Exception("No suitable streams available")
         
-        # Download video - size info fetched lazily during download
-        total_size = getattr(video_stream, 'filesize', None) or getattr(video_stream, 'filesize_approx', None) or 0
-        self._reset_progress_tracking(total_size)
+        output_filename = f"{safe_filename(video.title)}.mp4"
+        final_output_path = os.path.join(output_path, output_filename)
         
-        try:
-            video_path = video_stream.download(output_path=output_path, filename="video_temp.mp4")
-        except KeyboardInterrupt:
-            # User cancelled during video download - clean up and propagate
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
-            raise
+        # Mux while downloading when the containers allow it
+        if self._download_streaming(video, video_stream, audio_stream, final_output_path):
+            return None
         
-        # Check if cancelled between downloads
-        if self.stop_flag:
-            self.ffmpeg_handler.cleanup_temp_files(video_path)
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
-            raise KeyboardInterrupt("Download cancelled")
-        
-        # Download audio (progress callback already registered)
-        total_size = getattr(audio_stream, 'filesize', None) or getattr(audio_stream, 'filesize_approx', None) or 0
-        self._reset_progress_tracking(total_size)
-        
-        try:
-            audio_path = audio_stream.download(output_path=output_path, filename="audio_temp.mp4")
-        except KeyboardInterrupt:
-            # User cancelled during audio download - clean up and propagate
-            self.ffmpeg_handler.cleanup_temp_files(video_path)
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
-            raise
-        
-        # Check if cancelled before merging
-        if self.stop_flag:
-            self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
-            raise KeyboardInterrupt("Download cancelled")
+        # Download both streams (concurrently when enabled)
+        video_path, audio_path = self._download_stream_pair(video, video_stream, audio_stream, output_path)
         
         # Merge with FFmpeg with progress tracking
-        output_filename = f"{safe_filename(video.title)}.mp4"
-        final_output_path = os.path.join(output_path, output_filename)
         
+        # Create FFmpeg progress callback
+        def ffmpeg_progress(percentage, stage):
+            # Batches show download progress instead (merges run in the background)
+            if self.progress_callback and self._batch_progress is None and self._merge_pool is None:
+                # Call with proper signature: downloaded, total, percentage, speed, elapsed, custom_text
+                self.progress_callback(0, 0, percentage, 0, 0, f"🎬 {stage}")
+        
+        return self._submit_merge(
+            self._merge_adaptive, video_path, audio_path, final_output_path, output_path, ffmpeg_progress
+        )
+    
+    def _merge_adaptive(self, video_path, audio_path, final_output_path, output_path, ffmpeg_progress):
+        """Merge the downloaded legs with FFmpeg and remove the temp files"""
         try:
-            # Create FFmpeg progress callback
-            def ffmpeg_progress(percentage, stage):
-                if self.progress_callback:
-                    # Call with proper signature: downloaded, total, percentage, speed, elapsed, custom_text
-                    self.progress_callback(0, 0, percentage, 0, 0, f"🎬 {stage}")
-            
             self.ffmpeg_handler.merge_video_audio(
                 video_path,
                 audio_path,
@@ -264,7 +427,7 @@ class DownloadManager:
             # Handle Windows compatibility errors specifically
             if "WinError 216" in str(e) or "not compatible with the version of Windows" in str(e):
                 self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-                self.ffmpeg_handler.cleanup_default_temp_files(output_path)
+                self._cleanup_stale_temp_files(output_path)
                 raise Exception(
                     "FFmpeg compatibility error detected!\n\n"
                     "This happens when FFmpeg version doesn't match your Windows.\n\n"
@@ -276,11 +439,11 @@ class DownloadManager:
                 )
             else:
                 self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-                self.ffmpeg_handler.cleanup_default_temp_files(output_path)
+                self._cleanup_stale_temp_files(output_path)
                 raise Exception(f"FFmpeg error: {str(e)}")
         except Exception as e:
             self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
+            self._cleanup_stale_temp_files(output_path)
             # Check if it's a compatibility issue
             if "WinError 216" in str(e) or "not compatible" in str(e):
                 raise Exception(
@@ -297,7 +460,188 @@ class DownloadManager:
         finally:
             # Clean up temporary files
             self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
+            self._cleanup_stale_temp_files(output_path)
+    
+    def _merge_workers(self):
+        """Get the number of FFmpeg merges a batch runs at the same time"""
+        try:
+            return max(1, int(user_settings.get("merge_workers", MERGE_WORKERS)))
+        except (TypeError, ValueError):
+            return MERGE_WORKERS
+    
+    def _submit_merge(self, merge_func, video_path, audio_path, *args):
+        """
+        Run a merge now, or queue it on the batch merge pool so the next download can start
+        
+        Args:
+            merge_func (callable): Merge method taking (video_path, audio_path, *args)
+            video_path (str): Downloaded video temp file
+            audio_path (str): Downloaded audio temp file
+            
+        Returns:
+            Future: Pending merge when queued, otherwise None
+        """
+        if self._merge_pool is None:
+            merge_func(video_path, audio_path, *args)
+            return None
+        
+        self._update_queue_depth('merge_waiting', 1)
+        return self._merge_pool.submit(self._run_merge_job, merge_func, video_path, audio_path, *args)
+    
+    def _run_merge_job(self, merge_func, video_path, audio_path, *args):
+        """Merge pool worker - skips queued merges once the batch is cancelled"""
+        self._update_queue_depth('merge_waiting', -1)
+        if self.stop_flag:
+            # Finished legs stay journaled so a later download reuses them
+            self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path, keep_resumable=True)
+            raise KeyboardInterrupt("Download cancelled")
+        
+        self._update_queue_depth('merging', 1)
+        try:
+            merge_func(video_path, audio_path, *args)
+        finally:
+            self._update_queue_depth('merging', -1)
+    
+    def _parallel_streams_enabled(self):
+        """Check whether video and audio legs should be fetched concurrently"""
+        return bool(user_settings.get("parallel_stream_download", PARALLEL_STREAM_DOWNLOAD))
+    
+    def _download_stream_pair(self, video, video_stream, audio_stream, output_path):
+        """
+        Download the video and audio legs of an adaptive download
+        
+        Args:
+            video (YouTube): YouTube video object
+            video_stream: Adaptive video-only stream
+            audio_stream: Adaptive audio-only stream
+            output_path (str): Output directory path
+            
+        Returns:
+            tuple: (video_path, audio_path) of the downloaded temp files
+            
+        Raises:
+            KeyboardInterrupt: If the download was cancelled (resumable partial files are kept)
+        """
+        if self._parallel_streams_enabled():
+            video_path, audio_path = self._download_streams_parallel(video, video_stream, audio_stream, output_path)
+        else:
+            video_path, audio_path = self._download_streams_serial(video, video_stream, audio_stream, output_path)
+        
+        # Check if cancelled before merging
+        if self.stop_flag:
+            self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path, keep_resumable=True)
+            self._cleanup_stale_temp_files(output_path)
+            raise KeyboardInterrupt("Download cancelled")
+        
+        return video_path, audio_path
+    
+    def _download_streams_serial(self, video, video_stream, audio_stream, output_path):
+        """Download video then audio, one after the other"""
+        video.register_on_progress_callback(self.progress_tracker)
+        
+        # Download video - size info fetched lazily during download
+        total_size = getattr(video_stream, 'filesize', None) or getattr(video_stream, 'filesize_approx', None) or 0
+        self._reset_progress_tracking(total_size)
+        
+        try:
+            video_path = self._fetch_stream(
+                video_stream, output_path, self._temp_filename("video", video, video_stream),
+                self.progress_tracker, video.video_id
+            )
+        except KeyboardInterrupt:
+            # User cancelled during video download - clean up and propagate
+            self._cleanup_stale_temp_files(output_path)
+            raise
+        
+        # Check if cancelled between downloads
+        if self.stop_flag:
+            self.ffmpeg_handler.cleanup_temp_files(video_path, keep_resumable=True)
+            self._cleanup_stale_temp_files(output_path)
+            raise KeyboardInterrupt("Download cancelled")
+        
+        # Download audio (progress callback already registered)
+        total_size = getattr(audio_stream, 'filesize', None) or getattr(audio_stream, 'filesize_approx', None) or 0
+        self._reset_progress_tracking(total_size)
+        
+        try:
+            audio_path = self._fetch_stream(
+                audio_stream, output_path, self._temp_filename("audio", video, audio_stream),
+                self.progress_tracker, video.video_id
+            )
+        except KeyboardInterrupt:
+            # User cancelled during audio download - clean up and propagate
+            self.ffmpeg_handler.cleanup_temp_files(video_path, keep_resumable=True)
+            self._cleanup_stale_temp_files(output_path)
+            raise
+        
+        return video_path, audio_path
+    
+    def _new_pair_progress(self, video, video_stream, audio_stream):
+        """Create byte-weighted combined progress for two streams downloading at once"""
+        if self._batch_progress is not None:
+            # Part of a concurrent batch - only the batch aggregator reports to the UI
+            progress = CombinedProgress(None, lambda: self.stop_flag, parent=self._batch_progress)
+        else:
+            progress = CombinedProgress(self.progress_callback, lambda: self.stop_flag)
+        for stream in (video_stream, audio_stream):
+            total_size = getattr(stream, 'filesize', None) or getattr(stream, 'filesize_approx', None) or 0
+            progress.add_stream(stream, total_size)
+        
+        # Both streams report through the video's shared progress hook
+        video.register_on_progress_callback(progress.on_progress)
+        return progress
+    
+    def _download_streaming(self, video, video_stream, audio_stream, output_file):
+        """
+        Download and mux both streams through FFmpeg pipes, without temp files
+        
+        Args:
+            video (YouTube): YouTube video object
+            video_stream: Adaptive video-only stream
+            audio_stream: Adaptive audio-only stream
+            output_file (str): Final output path
+            
+        Returns:
+            bool: True if the file was written, False to use the temp file path instead
+        """
+        if not user_settings.get("streaming_remux", STREAMING_REMUX):
+            return False
+        if not self.stream_muxer.can_stream(video_stream, audio_stream):
+            return False
+        
+        self._new_pair_progress(video, video_stream, audio_stream)
+        try:
+            self.stream_muxer.mux(video_stream, audio_stream, output_file)
+        except StreamingRemuxError as e:
+            print(f"⚠️ Streaming remux failed ({str(e)[:80]}), using temp files")
+            return False
+        print(f"✅ Streamed and muxed: {output_file}")
+        return True
+    
+    def _download_streams_parallel(self, video, video_stream, audio_stream, output_path):
+        """Download video and audio at the same time with byte-weighted combined progress"""
+        progress = self._new_pair_progress(video, video_stream, audio_stream)
+        
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="stream-download") as pool:
+            video_future = pool.submit(
+                self._fetch_stream, video_stream, output_path,
+                self._temp_filename("video", video, video_stream), progress.on_progress, video.video_id
+            )
+            audio_future = pool.submit(
+                self._fetch_stream, audio_stream, output_path,
+                self._temp_filename("audio", video, audio_stream), progress.on_progress, video.video_id
+            )
+            try:
+                video_path = video_future.result()
+                audio_path = audio_future.result()
+            except BaseException:
+                # One leg failed or was cancelled - stop the other one and clean up
+                progress.abort()
+                wait([video_future, audio_future])
+                self._cleanup_stale_temp_files(output_path)
+                raise
+        
+        return video_path, audio_path
     
     def _download_adaptive_stream(self, video_stream, video, output_path):
         """Download adaptive stream and merge with audio"""
@@ -307,38 +651,32 @@ class DownloadManager:
         video_path = None
         audio_path = None
         try:
-            # Download video stream
-            total_size = getattr(video_stream, 'filesize', None) or getattr(video_stream, 'filesize_approx', None) or 0
-            self._reset_progress_tracking(total_size)
-            video.register_on_progress_callback(self.progress_tracker)
-            video_path = video_stream.download(output_path=output_path, filename="video_temp.mp4")
-            
-            if self.stop_flag:
-                self.ffmpeg_handler.cleanup_temp_files(video_path)
-                self.ffmpeg_handler.cleanup_default_temp_files(output_path)
-                raise Exception("Download cancelled")
-            
-            audio_stream = video.streams.filter(only_audio=True, file_extension='mp4').order_by('abr').desc().first()
-            if not audio_stream:
-                audio_stream = video.streams.filter(only_audio=True).order_by('abr').desc().first()
+            audio_stream = self.youtube_handler.get_best_audio_stream(video)
             
             if audio_stream:
-                self.current_download_size = audio_stream.filesize if hasattr(audio_stream, 'filesize') else 0
-                audio_path = audio_stream.download(output_path=output_path, filename="audio_temp.mp4")
+                output_file = os.path.join(output_path, safe_name + '.mp4')
                 
-                if self.stop_flag:
-                    self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-                    self.ffmpeg_handler.cleanup_default_temp_files(output_path)
-                    raise Exception("Download cancelled")
+                # Mux while downloading when the containers allow it
+                if self._download_streaming(video, video_stream, audio_stream, output_file):
+                    return None
                 
-                output_file = os.path.join(output_path, safe_name + '.mp4')
-                self.ffmpeg_handler.merge_video_audio(
-                    video_path,
-                    audio_path,
-                    output_file
-                )
-                print(f"✅ Adaptive video merged: {output_file}")
+                # Download both streams (concurrently when enabled)
+                video_path, audio_path = self._download_stream_pair(video, video_stream, audio_stream, output_path)
+                
+                merge_paths = (video_path, audio_path)
+                # The merge step owns the temp files from here on
+                video_path = audio_path = None
+                return self._submit_merge(self._merge_adaptive_stream, *merge_paths, output_file, output_path)
             else:
+                # No audio available - keep the video-only stream
+                total_size = getattr(video_stream, 'filesize', None) or getattr(video_stream, 'filesize_approx', None) or 0
+                self._reset_progress_tracking(total_size)
+                video.register_on_progress_callback(self.progress_tracker)
+                video_path = self._fetch_stream(
+                    video_stream, output_path, self._temp_filename("video", video, video_stream),
+                    self.progress_tracker, video.video_id
+                )
+
                 final_path = os.path.join(output_path, safe_name + '.mp4')
                 try:
                     os.rename(video_path, final_path)
@@ -346,7 +684,7 @@ class DownloadManager:
                 except:
                     print(f"✅ Video saved: {video_path}")
                 finally:
-                    self.ffmpeg_handler.cleanup_default_temp_files(output_path)
+                    self._cleanup_stale_temp_files(output_path)
         except OSError as e:
             if "WinError 216" in str(e) or "not compatible with the version of Windows" in str(e):
                 raise Exception(
@@ -362,16 +700,44 @@ class DownloadManager:
                 raise Exception(f"FFmpeg error: {str(e)}")
         finally:
             self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
-            self.ffmpeg_handler.cleanup_default_temp_files(output_path)
+            self._cleanup_stale_temp_files(output_path)
     
-    def download_selected_videos(self, selected_videos, success_callback=None, error_callback=None):
+    def _merge_adaptive_stream(self, video_path, audio_path, output_file, output_path):
+        """Merge the legs of an adaptive stream download and remove the temp files"""
+        try:
+            self.ffmpeg_handler.merge_video_audio(
+                video_path,
+                audio_path,
+                output_file
+            )
+            print(f"✅ Adaptive video merged: {output_file}")
+        except OSError as e:
+            if "WinError 216" in str(e) or "not compatible with the version of Windows" in str(e):
+                raise Exception(
+                    "FFmpeg Windows compatibility error!\n\n"
+                    "Your FFmpeg version doesn't match your Windows.\n\n"
+                    "Quick fix:\n"
+                    "1. Close the app\n"
+                    "2. Delete the 'ffmpeg' folder\n"
+                    "3. Restart the app\n\n"
+                    "A compatible FFmpeg will be downloaded automatically."
+                )
+            else:
+                raise Exception(f"FFmpeg error: {str(e)}")
+        finally:
+            self.ffmpeg_handler.cleanup_temp_files(video_path, audio_path)
+            self._cleanup_stale_temp_files(output_path)
+    
+    def download_selected_videos(self, selected_videos, success_callback=None, error_callback=None, concurrency=None):
         """
         Download selected videos from playlist with individual quality settings
         
         Args:
             selected_videos (list): List of video dictionaries with video, quality, index, title
+                                   (and optionally audio=True for an MP3 download)
             success_callback (callable): Called on successful completion
             error_callback (callable): Called on error
+            concurrency (int, optional): Videos downloaded at the same time (user setting if None)
         """
         self.stop_flag = False
         
@@ -383,76 +749,48 @@ class DownloadManager:
         
         self.current_thread = threading.Thread(
             target=self._download_selected_videos_thread,
-            args=(selected_videos, success_callback, error_callback),
+            args=(selected_videos, success_callback, error_callback, concurrency),
             daemon=True
         )
         self.current_thread.start()
     
-    def _download_selected_videos_thread(self, selected_videos, success_callback, error_callback):
-        """Thread function for batch download of selected videos"""
-        completed_count = 0
+    def _batch_concurrency(self):
+        """Get the number of videos a batch downloads at the same time"""
+        try:
+            return max(1, int(user_settings.get("batch_concurrency", BATCH_CONCURRENCY)))
+        except (TypeError, ValueError):
+            return BATCH_CONCURRENCY
+    
+    def _download_selected_videos_thread(self, selected_videos, success_callback, error_callback, concurrency=None):
+        """Thread function for batch download of selected videos (bounded worker pool)"""
+        output_path = file_manager.get_download_path()
+        workers = min(concurrency or self._batch_concurrency(), len(selected_videos)) or 1
+        
+        if workers > 1:
+            # Several jobs share the progress bar - report their combined bytes
+            self._batch_progress = CombinedProgress(self.progress_callback, lambda: self.stop_flag)
+        
+        # Merges run on their own pool so downloads never wait for FFmpeg
+        self._merge_pool = ThreadPoolExecutor(max_workers=self._merge_workers(), thread_name_prefix="merge")
         
         try:
-            for i, video_info in enumerate(selected_videos):
-                if self.stop_flag:
-                    raise KeyboardInterrupt("Download cancelled")
-                
-                self.current_video_index = video_info['index']
-                video = video_info['video']
-                quality_str = video_info['quality']
-                title = video_info['title']
-                
-                # Notify batch progress callback - starting download
-                if self.batch_progress_callback:
-                    self.batch_progress_callback(
-                        self.current_video_index, 
-                        'downloading', 
-                        title,
-                        i + 1,
-                        self.total_videos_in_batch
-                    )
-                
-                # Update main progress
-                if self.progress_callback:
-                    self.progress_callback(
-                        0, 0, 0, 0, 0, 
-                        f"Downloading {i+1}/{self.total_videos_in_batch}: {title[:40]}..."
-                    )
-                
-                # Download the video
-                try:
-                    self.download_single_video(
-                        video, 
-                        quality_str, 
-                        False,  # Not audio-only for now
-                        file_manager.get_download_path()
-                    )
-                    
-                    completed_count += 1
-                    
-                    # Notify batch progress callback - completed
-                    if self.batch_progress_callback:
-                        self.batch_progress_callback(
-                            self.current_video_index, 
-                            'completed', 
-                            title,
-                            i + 1,
-                            self.total_videos_in_batch
-                        )
-                        
-                except Exception as video_error:
-                    # Notify batch progress callback - error
-                    if self.batch_progress_callback:
-                        self.batch_progress_callback(
-                            self.current_video_index, 
-                            'error', 
-                            f"{title} - Error: {str(video_error)}",
-                            i + 1,
-                            self.total_videos_in_batch
-                        )
-                    print(f"Error downloading {title}: {video_error}")
-                    # Continue with next video instead of stopping entire batch
-                    continue
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-download") as pool:
+                futures = []
+                for position, video_info in enumerate(selected_videos, 1):
+                    self._update_queue_depth('download_waiting', 1)
+                    futures.append(pool.submit(self._download_batch_item, position, video_info, output_path))
+                wait(futures)
+            
+            # Wait for the merges still queued behind the last downloads
+            results = [future.result() for future in futures]
+            merges = [result for result in results if isinstance(result, Future)]
+            wait(merges)
+            
+            if self.stop_flag:
+                raise KeyboardInterrupt("Download cancelled")
+            
+            completed_count = sum(1 for result in results if result is True)
+            completed_count += sum(1 for merge in merges if merge.exception() is None)
             
             # Final success callback
             if success_callback:
@@ -460,12 +798,138 @@ class DownloadManager:
         
         except KeyboardInterrupt:
             # Clean up temp files from cancelled batch download
-            self.ffmpeg_handler.cleanup_default_temp_files(file_manager.get_download_path())
+            self._cleanup_stale_temp_files(output_path)
             if error_callback:
                 error_callback("Download cancelled")
         except Exception as e:
             if error_callback:
                 error_callback(str(e))
+        finally:
+            self._merge_pool.shutdown(wait=True)
+            self._merge_pool = None
+            self._batch_progress = None
+            with self._jobs_lock:
+                self._queue_depths = dict.fromkeys(self._queue_depths, 0)
+    
+    def _download_batch_item(self, position, video_info, output_path):
+        """
+        Download one video of a batch (runs on a pool worker)
+        
+        Args:
+            position (int): 1-based position of the video in the batch
+            video_info (dict): Video dictionary with video, quality, index, title
+            output_path (str): Output directory path
+            
+        Returns:
+            bool | Future: True if the video was downloaded, or its queued merge
+        """
+        self._update_queue_depth('download_waiting', -1)
+        if self.stop_flag:
+            return False
+        
+        video_index = video_info['index']
+        video = video_info['video']
+        quality_str = video_info['quality']
+        title = video_info['title']
+        self.current_video_index = video_index
+        
+        if self.should_skip(video, quality_str, video_info.get('audio', False), output_path):
+            if self.batch_progress_callback:
+                self.batch_progress_callback(
+                    video_index, 
+                    'skipped', 
+                    title,
+                    position,
+                    self.total_videos_in_batch
+                )
+            return True
+        
+        # Notify batch progress callback - starting download
+        if self.batch_progress_callback:
+            self.batch_progress_callback(
+                video_index, 
+                'downloading', 
+                title,
+                position,
+                self.total_videos_in_batch
+            )
+        
+        # Update main progress (concurrent batches keep the combined bar)
+        if self.progress_callback and self._batch_progress is None:
+            self.progress_callback(
+                0, 0, 0, 0, 0, 
+                f"Downloading {position}/{self.total_videos_in_batch}: {title[:40]}..."
+            )
+        
+        self._update_queue_depth('downloading', 1)
+        try:
+            merge = self.download_single_video(
+                video, 
+                quality_str, 
+                video_info.get('audio', False),
+                output_path
+            )
+        except KeyboardInterrupt:
+            # Cancelled - the batch thread reports it once all workers stopped
+            return False
+        except Exception as video_error:
+            # Notify batch progress callback - error
+            if self.batch_progress_callback:
+                self.batch_progress_callback(
+                    video_index, 
+                    'error', 
+                    f"{title} - Error: {str(video_error)}",
+                    position,
+                    self.total_videos_in_batch
+                )
+            print(f"Error downloading {title}: {video_error}")
+            # Other videos keep downloading
+            return False
+        finally:
+            self._update_queue_depth('downloading', -1)
+        
+        if merge is None:
+            self._report_batch_result(video_index, title, position)
+            return True
+        
+        # Downloaded - the merge pool finishes the job while the next video downloads
+        if self.batch_progress_callback:
+            self.batch_progress_callback(
+                video_index, 
+                'merging', 
+                title,
+                position,
+                self.total_videos_in_batch
+            )
+        merge.add_done_callback(
+            lambda future: self._report_batch_result(video_index, title, position, future)
+        )
+        return merge
+    
+    def _report_batch_result(self, video_index, title, position, merge=None):
+        """Report the final status of a batch job (after its merge, if one was queued)"""
+        error = merge.exception() if merge is not None else None
+        if isinstance(error, KeyboardInterrupt) or not self.batch_progress_callback:
+            return
+        
+        if error is not None:
+            print(f"Error merging {title}: {error}")
+            self.batch_progress_callback(
+                video_index, 
+                'error', 
+                f"{title} - Error: {str(error)}",
+                position,
+                self.total_videos_in_batch
+            )
+        else:
+            # Notify batch progress callback - completed
+            self.batch_progress_callback(
+                video_index, 
+                'completed', 
+                title,
+                position,
+                self.total_videos_in_batch
+            )
     
     def download_playlist(self, playlist_url, quality_str, is_audio, success_callback=None, error_callback=None):
         """
@@ -529,6 +993,9 @@ class DownloadManager:
                 if self.progress_callback:
                     self.progress_callback(0, 0, 0, 0, 0, f"Downloading {i+1} of {total_videos}")
                 
+                if self.should_skip(video, quality_str, is_audio, file_manager.get_download_path()):
+                    continue
+                
                 self.download_single_video(video, quality_str, is_audio, file_manager.get_download_path())
             
             if success_callback:
@@ -536,7 +1003,7 @@ class DownloadManager:
         
         except KeyboardInterrupt:
             # Clean up temp files from cancelled playlist download
-            self.ffmpeg_handler.cleanup_default_temp_files(file_manager.get_download_path())
+            self._cleanup_stale_temp_files(file_manager.get_download_path())
             if error_callback:
                 error_callback("Download cancelled")
         except Exception as e:
@@ -564,8 +1031,8 @@ class DownloadManager:
                 success_callback("Download completed!")
                 
         except KeyboardInterrupt:
-            # User cancelled the download - clean up all temp files
-            self.ffmpeg_handler.cleanup_default_temp_files(file_manager.get_download_path())
+            # User cancelled the download - clean up temp files no other job is using
+            self._cleanup_stale_temp_files(file_manager.get_download_path())
             if error_callback:
                 error_callback("Download cancelled")
             return
@@ -591,7 +1058,7 @@ class DownloadManager:
                 
                 except KeyboardInterrupt:
                     # User cancelled during retry - clean up
-                    self.ffmpeg_handler.cleanup_default_temp_files(file_manager.get_download_path())
+                    self._cleanup_stale_temp_files(file_manager.get_download_path())
                     if error_callback:
                         error_callback("Download cancelled")
                     return
@@ -619,7 +1086,7 @@ class DownloadManager:
                             raise Exception("yt-dlp fallback failed")
                     except KeyboardInterrupt:
                         # User cancelled during yt-dlp fallback - clean up
-                        self.ffmpeg_handler.cleanup_default_temp_files(file_manager.get_download_path())
+                        self._cleanup_stale_temp_files(file_manager.get_download_path())
                         if error_callback:
                             error_callback("Download cancelled")
                         return
@@ -3,7 +3,6 @@ File management utilities for download paths and file operations
 """
 
 import os
-from tkinter import filedialog
 
 
 class FileManager:
@@ -26,6 +25,8 @@ class FileManager:
             self._download_path = path
             return True
         else:
+            # Imported on demand so headless use does not need tkinter
+            from tkinter import filedialog
             folder = filedialog.askdirectory()
             if folder:
                 self._download_path = folder
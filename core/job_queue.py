@@ -0,0 +1,217 @@
+"""
+Persistent download job queue - jobs survive restarts in a SQLite database
+"""
+
+import time
+import sqlite3
+import threading
+
+# Job states
+QUEUED = 'queued'
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    url TEXT NOT NULL,
+    video_id TEXT,
+    quality TEXT NOT NULL,
+    audio INTEGER NOT NULL DEFAULT 0,
+    output_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    title TEXT,
+    error TEXT,
+    downloaded INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, id);
+"""
+
+
+class JobQueue:
+    """
+    Download jobs stored in SQLite, claimed in submission order
+
+    Jobs that were running when the process stopped are queued again on open;
+    their partial downloads resume from the resume journals next to them.
+    """
+
+    def __init__(self, db_path):
+        """
+        Args:
+            db_path (str | Path): SQLite database file (created if missing)
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+            # Jobs interrupted by a stop or crash run again
+            requeued = self._connection.execute(
+                "UPDATE jobs SET status = ?, updated = ? WHERE status = ?", (QUEUED, time.time(), RUNNING)
+            ).rowcount
+        if requeued:
+            print(f"🔁 Re-queued {requeued} interrupted job(s)")
+
+    @staticmethod
+    def _to_dict(row):
+        if row is None:
+            return None
+        job = dict(row)
+        job['audio'] = bool(job['audio'])
+        return job
+
+    def submit(self, url, quality, audio, output_path, video_id=None):
+        """
+        Add a job to the end of the queue
+
+        Args:
+            url (str): Video URL
+            quality (str): Quality string ("best", "1080p", "4K", ...)
+            audio (bool): Download audio only as MP3
+            output_path (str): Output directory
+            video_id (str, optional): YouTube video id (jobs of the same video never run together)
+
+        Returns:
+            dict: The new job
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO jobs (url, video_id, quality, audio, output_path, status, created, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, video_id, quality, int(bool(audio)), output_path, QUEUED, now, now)
+            )
+            return self._get(cursor.lastrowid)
+
+    def _get(self, job_id):
+        """Read a job (caller holds the lock)"""
+        row = self._connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row)
+
+    def get(self, job_id):
+        """
+        Get a job by id
+
+        Returns:
+            dict: Job, or None if unknown
+        """
+        with self._lock:
+            return self._get(job_id)
+
+    def list(self, status=None, limit=200):
+        """
+        List jobs, newest first
+
+        Args:
+            status (str, optional): Only jobs in this state
+            limit (int): Maximum number of jobs
+
+        Returns:
+            list: Job dictionaries
+        """
+        with self._lock:
+            if status:
+                rows = self._connection.execute(
+                    "SELECT * FROM jobs WHERE status = ? ORDER BY id DESC LIMIT ?", (status, limit)
+                ).fetchall()
+            else:
+                rows = self._connection.execute("SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def counts(self):
+        """
+        Count jobs per state
+
+        Returns:
+            dict: state -> number of jobs
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def claim_next(self, busy_video_ids=()):
+        """
+        Mark the oldest queued job as running
+
+        Args:
+            busy_video_ids (iterable): Video ids being downloaded (their jobs are skipped,
+                                       they would share temp files)
+
+        Returns:
+            dict: The claimed job, or None if no job is ready
+        """
+        busy = set(busy_video_ids)
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, video_id FROM jobs WHERE status = ? ORDER BY id", (QUEUED,)
+            ).fetchall()
+            for job_id, video_id in rows:
+                if video_id and video_id in busy:
+                    continue
+                self._connection.execute(
+                    "UPDATE jobs SET status = ?, attempts = attempts + 1, error = NULL, updated = ? WHERE id = ?",
+                    (RUNNING, time.time(), job_id)
+                )
+                return self._get(job_id)
+        return None
+
+    def update(self, job_id, **fields):
+        """
+        Update columns of a job (e.g. title, downloaded, total)
+
+        Returns:
+            dict: The updated job, or None if unknown
+        """
+        allowed = ('title', 'video_id', 'downloaded', 'total')
+        fields = {key: value for key, value in fields.items() if key in allowed}
+        with self._lock:
+            if fields:
+                assignments = ", ".join(f"{key} = ?" for key in fields)
+                self._connection.execute(
+                    f"UPDATE jobs SET {assignments}, updated = ? WHERE id = ?",
+                    (*fields.values(), time.time(), job_id)
+                )
+            return self._get(job_id)
+
+    def finish(self, job_id, status, error=None):
+        """
+        Move a job to a final state, or back to the queue with status=QUEUED
+
+        Returns:
+            dict: The updated job, or None if unknown
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, updated = ? WHERE id = ?",
+                (status, error, time.time(), job_id)
+            )
+            return self._get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job that has not started yet
+
+        Returns:
+            dict: The job (its status tells whether it was cancelled here), or None if unknown
+        """
+        with self._lock:
+            self._connection.execute(
+                "UPDATE jobs SET status = ?, updated = ? WHERE id = ? AND status = ?",
+                (CANCELLED, time.time(), job_id, QUEUED)
+            )
+            return self._get(job_id)
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._connection.close()
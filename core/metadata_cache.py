@@ -0,0 +1,210 @@
+"""
+Persistent metadata cache for resolved videos and playlists
+"""
+
+import os
+import json
+import time
+import threading
+from urllib.parse import urlparse, parse_qs
+from pytubefix import Playlist
+from config.user_settings import user_settings
+from config.settings import (
+    METADATA_CACHE_DIR, METADATA_TTL_DAYS,
+    PLAYLIST_CACHE_TTL_HOURS, STREAM_URL_EXPIRY_MARGIN
+)
+
+
+class CachedPlaylist(Playlist):
+    """Playlist whose video URLs and title come from the metadata cache"""
+
+    def __init__(self, url, video_urls, title=None):
+        """
+        Args:
+            url (str): Playlist URL
+            video_urls (list): Video URLs in playlist order
+            title (str, optional): Playlist title
+        """
+        super().__init__(url)
+        self._cached_video_urls = list(video_urls)
+        self._cached_title = title
+
+    @property
+    def video_urls(self):
+        return list(self._cached_video_urls)
+
+    @property
+    def title(self):
+        # Never touches the network - read from the UI thread (falls back to the playlist id)
+        return self._cached_title or self.playlist_id
+
+
+class MetadataCache:
+    """Disk-backed cache of video player responses and playlist contents"""
+
+    def __init__(self, cache_dir=None):
+        """
+        Args:
+            cache_dir (Path, optional): Cache directory (inside the user settings directory by default)
+        """
+        self.cache_dir = cache_dir or (user_settings.settings_dir / METADATA_CACHE_DIR)
+        self._purged = False
+
+    def _path(self, kind, key):
+        safe_key = "".join(c for c in str(key) if c.isalnum() or c in "-_")
+        return self.cache_dir / kind / f"{safe_key}.json"
+
+    def _read(self, kind, key):
+        """Read an entry (None if missing or unreadable)"""
+        try:
+            with open(self._path(kind, key), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, kind, key, entry):
+        """Write an entry atomically"""
+        path = self._path(kind, key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # Caching is best effort
+
+    def _delete(self, kind, key):
+        try:
+            os.remove(self._path(kind, key))
+        except OSError:
+            pass
+
+    @staticmethod
+    def _streams_expire(vid_info, fetched):
+        """
+        Find when the stream URLs of a player response stop working
+
+        Uses the smallest "expire" query parameter of the format URLs (signed or
+        still ciphered), falling back to streamingData.expiresInSeconds.
+        """
+        streaming_data = vid_info.get('streamingData') or {}
+        expires = []
+        for fmt in streaming_data.get('formats', []) + streaming_data.get('adaptiveFormats', []):
+            url = fmt.get('url')
+            if not url and fmt.get('signatureCipher'):
+                url = parse_qs(fmt['signatureCipher']).get('url', [''])[0]
+            expire = parse_qs(urlparse(url or '').query).get('expire')
+            if expire and expire[0].isdigit():
+                expires.append(int(expire[0]))
+        if expires:
+            return min(expires)
+        seconds = streaming_data.get('expiresInSeconds')
+        return fetched + int(seconds) if str(seconds or '').isdigit() else fetched
+
+    def put_video(self, video_id, client_name, vid_info):
+        """
+        Store the raw player response of a video
+
+        Args:
+            video_id (str): YouTube video id
+            client_name (str): Client that produced the response ("DEFAULT" for none)
+            vid_info (dict): Player response taken before streams were built
+        """
+        if not video_id or not vid_info:
+            return
+        if not self._purged:
+            # Drop entries of earlier sessions that outlived their TTL
+            self._purged = True
+            self.purge_expired()
+        now = time.time()
+        details = vid_info.get('videoDetails') or {}
+        thumbnails = (details.get('thumbnail') or {}).get('thumbnails') or []
+        entry = {
+            'video_id': video_id,
+            'fetched': now,
+            'client': client_name,
+            'metadata': {
+                'title': details.get('title'),
+                'author': details.get('author'),
+                'length': int(details.get('lengthSeconds') or 0),
+                'thumbnail_url': thumbnails[-1]['url'] if thumbnails else
+                    f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+            },
+            'streams_expire': self._streams_expire(vid_info, now) - STREAM_URL_EXPIRY_MARGIN,
+            'vid_info': vid_info
+        }
+        self._write('videos', video_id, entry)
+
+    def get_metadata(self, video_id):
+        """
+        Get cached static metadata (title, author, length, thumbnail_url)
+
+        Returns:
+            dict: Metadata, or None if unknown or older than METADATA_TTL_DAYS
+        """
+        entry = self._read('videos', video_id)
+        if not entry:
+            return None
+        if time.time() - entry.get('fetched', 0) > METADATA_TTL_DAYS * 86400:
+            self._delete('videos', video_id)
+            return None
+        return dict(entry['metadata'])
+
+    def get_player_response(self, video_id):
+        """
+        Get a cached player response whose stream URLs are still valid
+
+        Returns:
+            tuple: (client_name, vid_info) with a private copy of vid_info, or None
+        """
+        entry = self._read('videos', video_id)
+        if not entry or time.time() >= entry.get('streams_expire', 0):
+            return None
+        # Every read parses the file again, so the caller owns this copy
+        return entry.get('client'), entry['vid_info']
+
+    def invalidate_video(self, video_id):
+        """Forget a video (e.g. after its cached stream URLs were refused)"""
+        self._delete('videos', video_id)
+
+    def put_playlist(self, playlist_id, video_urls, title=None):
+        """Store the video URLs (and title) of a playlist"""
+        if not playlist_id:
+            return
+        self._write('playlists', playlist_id, {
+            'playlist_id': playlist_id,
+            'fetched': time.time(),
+            'title': title,
+            'video_urls': list(video_urls)
+        })
+
+    def get_playlist(self, playlist_id):
+        """
+        Get cached playlist contents
+
+        Returns:
+            dict: title and video_urls, or None if unknown or older than PLAYLIST_CACHE_TTL_HOURS
+        """
+        entry = self._read('playlists', playlist_id)
+        if not entry or time.time() - entry.get('fetched', 0) > PLAYLIST_CACHE_TTL_HOURS * 3600:
+            return None
+        return entry
+
+    def purge_expired(self):
+        """Delete entries whose static metadata has outlived its TTL"""
+        cutoff = time.time() - METADATA_TTL_DAYS * 86400
+        for kind in ('videos', 'playlists'):
+            folder = self.cache_dir / kind
+            if not folder.exists():
+                continue
+            for path in folder.glob('*.json'):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                except OSError:
+                    pass
+
+
+# Global metadata cache instance
+metadata_cache = MetadataCache()
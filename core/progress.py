@@ -0,0 +1,231 @@
+"""
+Progress tracking - combined progress of concurrent streams and the bus that carries it to the UI
+"""
+
+import threading
+from utils.rate_estimator import RateEstimator
+from config.settings import PROGRESS_MIN_INTERVAL_MS, PROGRESS_MAX_INTERVAL_MS, PROGRESS_LOAD_FACTOR
+
+
+class CombinedProgress:
+    """Merges byte progress from several concurrent streams into one progress callback"""
+
+    def __init__(self, progress_callback=None, stop_check=None, parent=None):
+        """
+        Args:
+            progress_callback (callable): Callback(downloaded, total, percentage, speed, elapsed)
+            stop_check (callable): Returns True when the download should be cancelled
+            parent (CombinedProgress, optional): Aggregator that also receives every chunk
+        """
+        self.progress_callback = progress_callback
+        self.stop_check = stop_check
+        self.parent = parent
+
+        self._lock = threading.Lock()
+        self._streams = {}  # key -> stream, held so its id cannot be reused while registered
+        self._totals = {}
+        self._downloaded = {}
+        self._aborted = False
+
+        # Smoothed rates of the combined transfer and of each stream
+        self.rate = RateEstimator()
+        self._stream_rates = {}
+
+    @staticmethod
+    def _key(stream):
+        """Identify a stream object (itags repeat across videos of a batch; the object is kept alive in _streams)"""
+        return id(stream)
+
+    def add_stream(self, stream, total_size):
+        """
+        Register a stream so its size counts towards the combined total
+
+        Args:
+            stream: YouTube stream object
+            total_size (int): Expected size in bytes (0 if unknown)
+        """
+        with self._lock:
+            key = self._key(stream)
+            self._streams[key] = stream
+            self._totals[key] = total_size or 0
+            self._downloaded.setdefault(key, 0)
+            self._stream_rates.setdefault(key, RateEstimator(total_size))
+        if self.parent:
+            self.parent.add_stream(stream, total_size)
+
+    def abort(self):
+        """Make every stream still downloading stop at its next chunk"""
+        self._aborted = True
+
+    def on_progress(self, stream, chunk, bytes_remaining):
+        """
+        pytubefix-compatible progress callback shared by all registered streams
+
+        Args:
+            stream: YouTube stream object
+            chunk: Downloaded chunk
+            bytes_remaining (int): Bytes remaining for this stream
+        """
+        if self._aborted or (self.stop_check and self.stop_check()):
+            # Raise KeyboardInterrupt to force stop the download stream
+            raise KeyboardInterrupt("Download cancelled by user")
+
+        with self._lock:
+            key = self._key(stream)
+            self._streams.setdefault(key, stream)
+            total = self._totals.get(key, 0)
+            if total <= 0:
+                total = getattr(stream, 'filesize', None) or 0
+                if total <= 0 and bytes_remaining is not None:
+                    total = bytes_remaining + len(chunk) + self._downloaded.get(key, 0)
+                self._totals[key] = total
+
+            if total > 0 and bytes_remaining is not None:
+                self._downloaded[key] = max(total - bytes_remaining, 0)
+            else:
+                self._downloaded[key] = self._downloaded.get(key, 0) + len(chunk)
+            self._stream_rates.setdefault(key, RateEstimator()).update(self._downloaded[key], total)
+
+            downloaded, total_size, percentage, speed_mbps, elapsed = self._snapshot()
+
+        if self.progress_callback:
+            self.progress_callback(downloaded, total_size, percentage, speed_mbps, elapsed)
+        if self.parent:
+            self.parent.on_progress(stream, chunk, bytes_remaining)
+
+    def _snapshot(self):
+        """Compute combined values (caller holds the lock)"""
+        downloaded = sum(self._downloaded.values())
+        total_size = sum(self._totals.values())
+        percentage = (downloaded / total_size) * 100 if total_size > 0 else 0
+
+        speed_mbps = self.rate.update(downloaded, total_size) / (1024 * 1024)
+        elapsed = int(self.rate.elapsed)
+        return downloaded, total_size, percentage, speed_mbps, elapsed
+
+    def get_stats(self):
+        """
+        Get smoothed rate statistics
+
+        Returns:
+            dict: Combined estimates (downloaded, total, rate, peak, mean, eta, elapsed)
+                plus 'streams', a list with the same estimates for each stream
+        """
+        with self._lock:
+            stream_rates = list(self._stream_rates.values())
+        stats = self.rate.get_stats()
+        stats['streams'] = [rate.get_stats() for rate in stream_rates]
+        return stats
+
+
+class ProgressBus:
+    """
+    Latest-value mailbox between download threads and the UI thread
+
+    Download threads publish every chunk; the UI thread takes at most one
+    snapshot per frame and only when something new arrived. The frame interval
+    follows the cost of the last redraw and backs off while nothing changes.
+    """
+
+    def __init__(self, min_interval_ms=PROGRESS_MIN_INTERVAL_MS,
+                 max_interval_ms=PROGRESS_MAX_INTERVAL_MS, load_factor=PROGRESS_LOAD_FACTOR):
+        """
+        Args:
+            min_interval_ms (int): Shortest time between two UI frames
+            max_interval_ms (int): Longest idle wait before the UI loop stops
+            load_factor (float): Frame interval as a multiple of the redraw cost
+        """
+        self.min_interval_ms = min_interval_ms
+        self.max_interval_ms = max_interval_ms
+        self.load_factor = load_factor
+
+        self._lock = threading.Lock()
+        self._latest = None
+        self._seq = 0
+        self._taken_seq = 0
+        self._running = False
+        self._interval_ms = min_interval_ms
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the counters (call when a download starts)"""
+        self.published = 0    # updates sent by download threads
+        self.frames = 0       # UI loop iterations
+        self.redraws = 0      # frames that changed the display
+        self.ui_time_ms = 0.0 # UI thread time spent in frames
+
+    def publish(self, *values):
+        """
+        Store the newest progress values (any thread)
+
+        Returns:
+            bool: True if the UI loop is stopped and must be started
+        """
+        with self._lock:
+            self._latest = values
+            self._seq += 1
+            self.published += 1
+            if self._running:
+                return False
+            self._running = True
+            self._interval_ms = self.min_interval_ms
+            return True
+
+    def take(self):
+        """
+        Get the newest values if they were not taken yet (UI thread)
+
+        Returns:
+            tuple: Published values, or None if nothing new arrived
+        """
+        with self._lock:
+            if self._seq == self._taken_seq:
+                return None
+            self._taken_seq = self._seq
+            return self._latest
+
+    def frame_done(self, changed, cost_ms):
+        """
+        Record a UI frame and get the delay until the next one
+
+        Args:
+            changed (bool): Whether the frame changed the display
+            cost_ms (float): UI thread time spent in the frame
+
+        Returns:
+            int: Delay in milliseconds, or None if the UI loop should stop
+        """
+        with self._lock:
+            self.frames += 1
+            self.ui_time_ms += cost_ms
+            if changed:
+                self.redraws += 1
+                # Keep progress drawing to a small share of the UI thread
+                self._interval_ms = max(self.min_interval_ms, int(cost_ms * self.load_factor))
+            elif self._seq == self._taken_seq:
+                if self._interval_ms >= self.max_interval_ms:
+                    self._running = False
+                    return None
+                self._interval_ms = min(self._interval_ms * 2, self.max_interval_ms)
+            return min(self._interval_ms, self.max_interval_ms)
+
+    def stop(self):
+        """Drop pending values and mark the UI loop as stopped"""
+        with self._lock:
+            self._latest = None
+            self._taken_seq = self._seq
+            self._running = False
+
+    def get_stats(self):
+        """
+        Get UI cost statistics of the current download
+
+        Returns:
+            dict: published, frames, redraws and ui_time_ms
+        """
+        return {
+            'published': self.published,
+            'frames': self.frames,
+            'redraws': self.redraws,
+            'ui_time_ms': self.ui_time_ms
+        }
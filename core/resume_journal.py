@@ -0,0 +1,129 @@
+"""
+Resume journal for partially downloaded streams
+"""
+
+import os
+import json
+import time
+import threading
+from config.settings import RESUME_JOURNAL_SUFFIX
+
+
+class ResumeJournal:
+    """Records the completed byte ranges of a partial file in a JSON file stored next to it"""
+
+    def __init__(self, file_path, video_id, itag, expected_size):
+        """
+        Args:
+            file_path (str): Path of the partial download
+            video_id (str): YouTube video id
+            itag (int): Stream itag
+            expected_size (int): Final file size in bytes
+        """
+        self.file_path = file_path
+        self.journal_path = file_path + RESUME_JOURNAL_SUFFIX
+        self.video_id = video_id
+        self.itag = itag
+        self.expected_size = expected_size
+        self.completed = []
+
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, file_path, video_id, itag, expected_size):
+        """
+        Load the journal for file_path, or start a fresh one if it does not match
+
+        A journal is only reused when it belongs to the same video, itag and size
+        and the partial file is still on disk at its preallocated size.
+
+        Returns:
+            ResumeJournal: Journal ready to use
+        """
+        journal = cls(file_path, video_id, itag, expected_size)
+        try:
+            with open(journal.journal_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            matches = (
+                data.get('video_id') == video_id
+                and data.get('itag') == itag
+                and data.get('expected_size') == expected_size
+                and os.path.exists(file_path)
+                and os.path.getsize(file_path) == expected_size
+            )
+            if matches:
+                journal.completed = [tuple(r) for r in data.get('completed', [])]
+                journal.completed = journal._merge(journal.completed)
+        except (OSError, ValueError, TypeError):
+            pass
+        return journal
+
+    @staticmethod
+    def _merge(ranges):
+        """Merge overlapping or adjacent inclusive ranges"""
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def completed_bytes(self):
+        """Return the number of bytes already on disk"""
+        with self._lock:
+            return sum(end - start + 1 for start, end in self.completed)
+
+    def is_complete(self):
+        """Check whether the whole file has been downloaded"""
+        return self.completed_bytes() >= self.expected_size
+
+    def missing_ranges(self):
+        """
+        Get the byte ranges still to download
+
+        Returns:
+            list: List of inclusive (start, end) tuples
+        """
+        with self._lock:
+            gaps = []
+            position = 0
+            for start, end in self.completed:
+                if start > position:
+                    gaps.append((position, start - 1))
+                position = max(position, end + 1)
+            if position < self.expected_size:
+                gaps.append((position, self.expected_size - 1))
+            return gaps
+
+    def add_range(self, start, end):
+        """Mark an inclusive byte range as written and persist the journal"""
+        if end < start:
+            return
+        with self._lock:
+            self.completed = self._merge(self.completed + [(start, end)])
+            self._save()
+
+    def _save(self):
+        """Write the journal atomically (caller holds the lock)"""
+        data = {
+            'video_id': self.video_id,
+            'itag': self.itag,
+            'expected_size': self.expected_size,
+            'completed': [list(r) for r in self.completed],
+            'updated': int(time.time())
+        }
+        temp_path = self.journal_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.journal_path)
+        except OSError:
+            pass  # Resume is best effort
+
+    def discard(self):
+        """Delete the journal file"""
+        try:
+            os.remove(self.journal_path)
+        except OSError:
+            pass
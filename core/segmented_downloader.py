@@ -0,0 +1,197 @@
+"""
+Multi-connection HTTP range downloader for large media streams
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from utils.network import network_manager
+from config.settings import (
+    SEGMENT_CONNECTIONS, SEGMENT_SIZE, SEGMENT_READ_SIZE, SEGMENT_POOL_SIZE,
+    MAX_RETRIES, REQUEST_TIMEOUT
+)
+
+# Range requests in flight across every download - never more than the pool keeps open
+_range_slots = threading.BoundedSemaphore(SEGMENT_POOL_SIZE)
+
+
+class RangeNotSupportedError(Exception):
+    """Raised when the server ignores Range requests"""
+
+
+class SegmentedDownloader:
+    """Downloads a URL as byte ranges fetched in parallel into a preallocated file"""
+
+    def __init__(self, connections=SEGMENT_CONNECTIONS, segment_size=SEGMENT_SIZE, session=None):
+        """
+        Args:
+            connections (int): Number of ranges fetched at the same time (at most SEGMENT_POOL_SIZE)
+            segment_size (int): Size of each byte range in bytes
+            session (requests.Session, optional): Session to use (pooled segment session by default)
+        """
+        self.connections = min(max(1, int(connections)), SEGMENT_POOL_SIZE)
+        self.segment_size = max(SEGMENT_READ_SIZE, int(segment_size))
+        self.session = session or network_manager.get_segment_session()
+
+        self._lock = threading.Lock()
+        self._abort = threading.Event()
+        self._downloaded = 0
+        self._journal = None
+
+    def plan_segments(self, total_size, gaps=None):
+        """
+        Split a file size (or the gaps still missing from it) into inclusive byte ranges
+
+        Args:
+            total_size (int): File size in bytes
+            gaps (list, optional): Inclusive (start, end) ranges to cover instead of the whole file
+
+        Returns:
+            list: List of (start, end) tuples
+        """
+        if gaps is None:
+            gaps = [(0, total_size - 1)]
+        segments = []
+        for gap_start, gap_end in gaps:
+            for start in range(gap_start, gap_end + 1, self.segment_size):
+                segments.append((start, min(start + self.segment_size - 1, gap_end)))
+        return segments
+
+    def download(self, url, file_path, total_size, on_progress=None, stream=None, stop_check=None, journal=None):
+        """
+        Download a URL into file_path using parallel range requests
+
+        Args:
+            url (str): Media URL (must honour HTTP Range)
+            file_path (str): Destination file path
+            total_size (int): Expected size in bytes
+            on_progress (callable): progress_tracker-compatible callback(stream, chunk, bytes_remaining)
+            stream: Stream object passed through to on_progress
+            stop_check (callable): Returns True when the download should be cancelled
+            journal (ResumeJournal, optional): Journal of completed ranges to resume from and update
+
+        Returns:
+            str: Path of the downloaded file
+
+        Raises:
+            RangeNotSupportedError: If the server does not return partial content
+            KeyboardInterrupt: If the download was cancelled
+        """
+        if not total_size or total_size <= 0:
+            raise ValueError("Segmented download needs a known file size")
+
+        gaps = journal.missing_ranges() if journal else None
+        segments = self.plan_segments(total_size, gaps)
+        if journal and not segments and os.path.exists(file_path):
+            return file_path
+        if journal and journal.completed:
+            print(f"⏯️ Resuming download at {journal.completed_bytes()}/{total_size} bytes")
+
+        self._journal = journal
+        self._abort.clear()
+        self._downloaded = total_size - sum(end - start + 1 for start, end in segments)
+
+        self._preallocate(file_path, total_size)
+
+        pending = list(segments)
+        workers = min(self.connections, len(pending)) or 1
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="segment") as pool:
+            futures = [
+                pool.submit(self._worker, url, file_path, total_size, pending, on_progress, stream, stop_check)
+                for _ in range(workers)
+            ]
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in done:
+                if future.exception() is not None:
+                    # Stop the remaining workers before re-raising
+                    self._abort.set()
+                    wait(futures)
+                    raise future.exception()
+
+        return file_path
+
+    @staticmethod
+    def _preallocate(file_path, total_size):
+        """Create the destination file at its final size (keeps existing data)"""
+        mode = 'r+b' if os.path.exists(file_path) else 'wb'
+        with open(file_path, mode) as f:
+            f.truncate(total_size)
+
+    def _next_segment(self, pending):
+        with self._lock:
+            return pending.pop(0) if pending else None
+
+    def _worker(self, url, file_path, total_size, pending, on_progress, stream, stop_check):
+        """Fetch segments from the shared queue until it is empty"""
+        with open(file_path, 'r+b') as f:
+            while not self._abort.is_set():
+                segment = self._next_segment(pending)
+                if segment is None:
+                    return
+                # Concurrent downloads share the pool: wait for a free connection
+                while not _range_slots.acquire(timeout=0.5):
+                    if self._abort.is_set() or (stop_check and stop_check()):
+                        raise KeyboardInterrupt("Download cancelled by user")
+                try:
+                    self._fetch_segment(url, f, segment, total_size, on_progress, stream, stop_check)
+                finally:
+                    _range_slots.release()
+                self._record(f, *segment)
+
+    def _record(self, f, start, end):
+        """Flush written bytes and mark the range as complete in the journal"""
+        if self._journal and end >= start:
+            f.flush()
+            self._journal.add_range(start, end)
+
+    def _fetch_segment(self, url, f, segment, total_size, on_progress, stream, stop_check):
+        """Fetch one byte range, resuming within the range on connection errors"""
+        start, end = segment
+        position = start
+        attempts = 0
+
+        while position <= end:
+            headers = network_manager.get_headers()
+            headers['Range'] = f"bytes={position}-{end}"
+            # Byte offsets only line up with an unencoded body
+            headers['Accept-Encoding'] = 'identity'
+            try:
+                with self.session.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT) as response:
+                    if response.status_code == 200 and not (position == 0 and end == total_size - 1):
+                        raise RangeNotSupportedError("Server ignored the Range header")
+                    response.raise_for_status()
+
+                    f.seek(position)
+                    for chunk in response.iter_content(chunk_size=SEGMENT_READ_SIZE):
+                        if self._abort.is_set() or (stop_check and stop_check()):
+                            raise KeyboardInterrupt("Download cancelled by user")
+                        if not chunk:
+                            continue
+                        chunk = chunk[:end - position + 1]
+                        f.write(chunk)
+                        position += len(chunk)
+                        self._report(chunk, total_size, on_progress, stream)
+                        if position > end:
+                            break
+
+                if position <= end:
+                    raise IOError(f"Connection closed early at byte {position} of range {start}-{end}")
+
+            except (KeyboardInterrupt, RangeNotSupportedError):
+                # Keep what was written so a later attempt can continue from here
+                self._record(f, start, position - 1)
+                raise
+            except Exception:
+                attempts += 1
+                if attempts > MAX_RETRIES or self._abort.is_set():
+                    self._record(f, start, position - 1)
+                    raise
+
+    def _report(self, chunk, total_size, on_progress, stream):
+        # Serialize callbacks so single-stream trackers see monotonic progress
+        with self._lock:
+            self._downloaded += len(chunk)
+            bytes_remaining = max(total_size - self._downloaded, 0)
+            if on_progress:
+                on_progress(stream, chunk, bytes_remaining)
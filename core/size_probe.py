@@ -0,0 +1,118 @@
+"""
+Stream size probing - exact sizes for a whole quality menu in one round trip
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+from utils.network import network_manager
+from config.settings import SIZE_PROBE_WORKERS, SIZE_PROBE_TIMEOUT, SIZE_PROBE_MAX_ENTRIES
+
+
+class SizeProbe:
+    """
+    Exact stream sizes, cached per (video_id, itag) in a bounded LRU
+
+    Sizes come from the manifest (contentLength or the URL's clen parameter)
+    when present. The remaining streams are probed with concurrent HEAD
+    requests over the pooled session.
+    """
+
+    def __init__(self, workers=SIZE_PROBE_WORKERS, timeout=SIZE_PROBE_TIMEOUT, max_entries=SIZE_PROBE_MAX_ENTRIES):
+        """
+        Args:
+            workers (int): Maximum number of concurrent HEAD requests
+            timeout (float): Timeout of one HEAD request in seconds
+            max_entries (int): Maximum number of cached sizes
+        """
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.max_entries = max(1, max_entries)
+        self._sizes = OrderedDict()  # (video_id, itag) -> bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def manifest_size(stream):
+        """
+        Size known without network access
+
+        Returns:
+            int: contentLength, else the clen URL parameter, else 0
+        """
+        size = getattr(stream, '_filesize', 0) or 0
+        if not size:
+            try:
+                clen = parse_qs(urlparse(getattr(stream, 'url', None) or "").query).get('clen')
+            except ValueError:
+                clen = None
+            if clen and clen[0].isdigit():
+                size = int(clen[0])
+        return size
+
+    def probe(self, video_id, streams):
+        """
+        Get the exact size of every stream, probing the unknown ones in parallel
+
+        Probed sizes are also stored on the streams, so stream.filesize does not
+        make another request later.
+
+        Args:
+            video_id (str): YouTube video id (part of the cache key)
+            streams (iterable): Streams to size
+
+        Returns:
+            dict: itag -> size in bytes (streams whose size is unknown are left out)
+        """
+        streams = [stream for stream in streams if stream is not None]
+        sizes = {}
+        pending = []
+        with self._lock:
+            for stream in streams:
+                key = (video_id, stream.itag)
+                size = self._sizes.get(key)
+                if size:
+                    self._sizes.move_to_end(key)
+                else:
+                    size = self.manifest_size(stream)
+                if size:
+                    sizes[stream.itag] = size
+                else:
+                    pending.append(stream)
+
+        if pending:
+            workers = min(self.workers, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="size-probe") as pool:
+                for stream, size in zip(pending, pool.map(self._head_size, pending)):
+                    if size:
+                        sizes[stream.itag] = size
+            print(f"📏 Probed {len(pending)} stream sizes in parallel")
+
+        with self._lock:
+            for stream in streams:
+                size = sizes.get(stream.itag)
+                if size:
+                    self._sizes[(video_id, stream.itag)] = size
+                    self._sizes.move_to_end((video_id, stream.itag))
+                    stream._filesize = size
+            while len(self._sizes) > self.max_entries:
+                self._sizes.popitem(last=False)
+        return sizes
+
+    def _head_size(self, stream):
+        """Content-Length of a stream URL (0 if the request fails)"""
+        try:
+            response = network_manager.get_session().head(
+                stream.url, headers=network_manager.get_headers(),
+                timeout=self.timeout, allow_redirects=True
+            )
+            if response.status_code >= 400:
+                return 0
+            return int(response.headers.get('Content-Length') or 0)
+        except Exception as e:
+            print(f"⚠️ Size probe failed for itag {getattr(stream, 'itag', '?')}: {str(e)[:50]}")
+            return 0
+
+
+# Global size probe instance
+size_probe = SizeProbe()
@@ -0,0 +1,132 @@
+"""
+Stream cache - bounded LRU of resolved streams that expires with their signed URLs
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse, parse_qs
+from config.settings import STREAM_CACHE_MAX_ENTRIES, STREAM_CACHE_DEFAULT_TTL, STREAM_URL_EXPIRY_MARGIN
+
+
+def url_expiry(url, now=None):
+    """
+    Get the time after which a stream URL should no longer be used
+
+    Args:
+        url (str): Signed googlevideo URL
+        now (float, optional): Current time (time.time() by default)
+
+    Returns:
+        float: The URL's "expire" parameter minus STREAM_URL_EXPIRY_MARGIN, or
+            now + STREAM_CACHE_DEFAULT_TTL if the URL has no expire parameter
+    """
+    now = time.time() if now is None else now
+    try:
+        expire = parse_qs(urlparse(url or "").query).get('expire')
+    except ValueError:
+        expire = None
+    if expire and expire[0].isdigit():
+        return int(expire[0]) - STREAM_URL_EXPIRY_MARGIN
+    return now + STREAM_CACHE_DEFAULT_TTL
+
+
+def is_stream_stale(stream, now=None):
+    """Check whether a stream's URL has expired (or is about to)"""
+    now = time.time() if now is None else now
+    return url_expiry(getattr(stream, 'url', None), now) <= now
+
+
+class StreamCache:
+    """
+    Resolved streams keyed by (video_id, kind, quality)
+
+    Entries expire together with their stream URL, and the least recently used
+    entry is evicted once max_entries is exceeded.
+    """
+
+    def __init__(self, max_entries=STREAM_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            max_entries (int): Maximum number of cached streams
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries = OrderedDict()  # key -> (stream, expires_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0    # dropped by the size cap
+        self.expirations = 0  # dropped because the stream URL expired
+
+    def get(self, key):
+        """
+        Get a cached stream whose URL is still valid
+
+        Returns:
+            Stream: Cached stream, or None on a miss (expired entries are dropped)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, stream):
+        """
+        Cache a stream until its URL expires
+
+        Returns:
+            bool: True if cached, False if the stream URL is already stale
+        """
+        now = time.time()
+        expires_at = url_expiry(getattr(stream, 'url', None), now)
+        if expires_at <= now:
+            return False
+        with self._lock:
+            self._entries[key] = (stream, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def invalidate_video(self, video_id):
+        """Drop every stream of a video"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == video_id]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop every cached stream (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """
+        Get cache statistics
+
+        Returns:
+            dict: entries, max_entries, hits, misses, evictions, expirations and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def __len__(self):
+        return len(self._entries)
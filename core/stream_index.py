@@ -0,0 +1,142 @@
+"""
+Stream index - one pass over a video's stream manifest answers every quality lookup
+"""
+
+from utils.helpers import resolution_key
+
+
+def _number(value):
+    """Integer part of values like "128kbps" (0 if there is none)"""
+    digits = "".join(filter(str.isdigit, str(value or "")))
+    return int(digits) if digits else 0
+
+
+class StreamIndex:
+    """
+    Lookup tables built from a single iteration over video.streams
+
+    Manifest order is kept where the old code used StreamQuery.first(), so a lookup
+    returns the same stream the equivalent filter chain did.
+    """
+
+    def __init__(self, streams, length=0):
+        """
+        Args:
+            streams (iterable): Streams of one video (e.g. video.streams)
+            length (int): Video duration in seconds, used for size estimates
+        """
+        self.length = length or 0
+        self.by_itag = {}
+        self.video_by_resolution = {}       # first MP4 adaptive video-only stream per resolution
+        self.best_video_by_resolution = {}  # highest bitrate MP4 adaptive video-only stream per resolution
+        self.progressive_by_resolution = {} # first progressive MP4 stream per resolution
+        self.by_codec = {}                  # video or audio codec -> streams
+        self.by_container = {}              # subtype ("mp4", "webm") -> streams
+        self.best_audio = None              # highest abr adaptive audio, MP4 preferred
+        self.audio_only = None              # highest abr MP4 audio (StreamQuery.get_audio_only)
+        self.first_adaptive_video = None    # first MP4 adaptive video-only stream
+
+        best_any_audio = None
+        for stream in streams:
+            self.by_itag[stream.itag] = stream
+            subtype = getattr(stream, 'subtype', None)
+            self.by_container.setdefault(subtype, []).append(stream)
+            codec = getattr(stream, 'video_codec', None) or getattr(stream, 'audio_codec', None)
+            if codec:
+                self.by_codec.setdefault(codec, []).append(stream)
+
+            is_mp4 = subtype == 'mp4'
+            resolution = getattr(stream, 'resolution', None)
+
+            if stream.includes_video_track and not stream.includes_audio_track:
+                if is_mp4 and stream.is_adaptive:
+                    if self.first_adaptive_video is None:
+                        self.first_adaptive_video = stream
+                    if resolution:
+                        self.video_by_resolution.setdefault(resolution, stream)
+                        best = self.best_video_by_resolution.get(resolution)
+                        if best is None or (stream.bitrate or 0) > (best.bitrate or 0):
+                            self.best_video_by_resolution[resolution] = stream
+
+            elif stream.includes_audio_track and not stream.includes_video_track:
+                if getattr(stream, 'abr', None) is None:
+                    continue  # order_by('abr') skips these too
+                abr = _number(stream.abr)
+                if stream.is_adaptive:
+                    # Ties keep the later stream, like order_by('abr').desc().first()
+                    if best_any_audio is None or abr >= _number(best_any_audio.abr):
+                        best_any_audio = stream
+                if is_mp4:
+                    if stream.is_adaptive and (self.best_audio is None or abr >= _number(self.best_audio.abr)):
+                        self.best_audio = stream
+                    if self.audio_only is None or abr >= _number(self.audio_only.abr):
+                        self.audio_only = stream
+
+            elif is_mp4 and stream.is_progressive and resolution:
+                self.progressive_by_resolution.setdefault(resolution, stream)
+
+        if self.best_audio is None:
+            self.best_audio = best_any_audio
+
+        # Adaptive MP4 video resolutions, highest first
+        self.resolutions = sorted(self.video_by_resolution, key=resolution_key, reverse=True)
+
+    @classmethod
+    def for_video(cls, video):
+        """
+        Get the index of a video, building it on first use
+
+        The index is kept on the video object, so every caller holding the same
+        YouTube object shares it.
+
+        Args:
+            video (YouTube): YouTube video object
+
+        Returns:
+            StreamIndex: Index of video.streams
+        """
+        index = getattr(video, '_stream_index', None)
+        if index is None:
+            index = cls(video.streams, getattr(video, 'length', 0))
+            video._stream_index = index
+        return index
+
+    def __len__(self):
+        return len(self.by_itag)
+
+    def get_video(self, resolution):
+        """First MP4 adaptive video-only stream of a resolution (None if missing)"""
+        return self.video_by_resolution.get(resolution)
+
+    def get_progressive(self, resolution):
+        """First progressive MP4 stream of a resolution (None if missing)"""
+        return self.progressive_by_resolution.get(resolution)
+
+    @staticmethod
+    def known_size(stream):
+        """Content length from the manifest (0 if unknown - never hits the network)"""
+        return getattr(stream, '_filesize', 0) or 0
+
+    def estimate_size(self, stream):
+        """
+        Estimate the size of a stream without network access
+
+        Returns:
+            int: Bytes from the manifest, else bitrate x duration (0 if unknown)
+        """
+        size = self.known_size(stream)
+        if not size and stream is not None and stream.bitrate and self.length:
+            size = stream.bitrate * self.length // 8
+        return size
+
+    def estimate_total_size(self, resolution):
+        """
+        Estimate the download size of a resolution (best video stream plus best audio)
+
+        Returns:
+            int: Bytes, 0 if the resolution is not available
+        """
+        stream = self.best_video_by_resolution.get(resolution)
+        if stream is None:
+            return 0
+        return self.estimate_size(stream) + self.estimate_size(self.best_audio)
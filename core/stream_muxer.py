@@ -0,0 +1,176 @@
+"""
+Streaming remux - adaptive video and audio bytes are piped straight into FFmpeg
+"""
+
+import os
+import struct
+import subprocess
+import threading
+from utils.network import network_manager
+from utils.ffmpeg_handler import FFmpegHandler
+from config.settings import FFMPEG_MOVFLAGS, REQUEST_TIMEOUT, STREAMING_HEADER_PROBE_SIZE
+
+
+class StreamingRemuxError(Exception):
+    """Raised when streams cannot be muxed through pipes (use the temp file path instead)"""
+
+
+class StreamingMuxer:
+    """Feeds two downloading streams into one FFmpeg process so the MP4 is written once"""
+
+    def can_stream(self, video_stream, audio_stream):
+        """
+        Check whether a stream pair can be muxed without temp files
+
+        Pipes are passed to FFmpeg as extra file descriptors, which needs POSIX.
+        MP4 inputs must carry their index (moov) before the media data, because
+        a pipe cannot seek forward to find it.
+
+        Args:
+            video_stream: Adaptive video-only stream
+            audio_stream: Adaptive audio-only stream
+
+        Returns:
+            bool: True if the streaming path can be used
+        """
+        if os.name != 'posix':
+            return False
+        for stream in (video_stream, audio_stream):
+            if getattr(stream, 'is_sabr', False):
+                return False
+            if getattr(stream, 'subtype', 'mp4') == 'mp4' and self._needs_seeking(stream.url):
+                print(f"ℹ️ itag {stream.itag} needs seeking, using temp files")
+                return False
+        return True
+
+    @staticmethod
+    def _needs_seeking(url):
+        """Read the first MP4 boxes and check that moov comes before mdat"""
+        headers = network_manager.get_headers()
+        headers['Range'] = f"bytes=0-{STREAMING_HEADER_PROBE_SIZE - 1}"
+        try:
+            response = network_manager.get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            data = response.content[:STREAMING_HEADER_PROBE_SIZE]
+        except Exception:
+            return True
+
+        offset = 0
+        while offset + 8 <= len(data):
+            size, box_type = struct.unpack('>I4s', data[offset:offset + 8])
+            if box_type == b'moov':
+                return False
+            if box_type in (b'mdat', b'moof'):
+                return True
+            if size == 1 and offset + 16 <= len(data):
+                size = struct.unpack('>Q', data[offset + 8:offset + 16])[0]
+            if size < 8:
+                break
+            offset += size
+        # Index not found in the probed window - be safe
+        return True
+
+    def mux(self, video_stream, audio_stream, output_file):
+        """
+        Download both streams into FFmpeg pipes and write the muxed file
+
+        Progress is reported through the streams' registered on_progress callback,
+        which can raise KeyboardInterrupt to cancel.
+
+        Args:
+            video_stream: Adaptive video-only stream
+            audio_stream: Adaptive audio-only stream
+            output_file (str): Path of the muxed output
+
+        Raises:
+            StreamingRemuxError: If FFmpeg could not mux the piped streams
+            KeyboardInterrupt: If the download was cancelled
+        """
+        ffmpeg_path = FFmpegHandler.get_ffmpeg_path()
+        if not ffmpeg_path:
+            raise StreamingRemuxError("FFmpeg not found")
+
+        video_read, video_write = os.pipe()
+        audio_read, audio_write = os.pipe()
+        cmd = [
+            ffmpeg_path,
+            '-hide_banner',
+            '-loglevel', 'error',
+            '-i', f'pipe:{video_read}',
+            '-i', f'pipe:{audio_read}',
+            '-map', '0:v:0',
+            '-map', '1:a:0',
+            '-c:v', 'copy',
+            '-c:a', 'copy',
+            '-movflags', FFMPEG_MOVFLAGS,
+            '-y', str(output_file)
+        ]
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                pass_fds=(video_read, audio_read)
+            )
+        except OSError as e:
+            for fd in (video_write, audio_write):
+                os.close(fd)
+            raise StreamingRemuxError(f"Could not start FFmpeg: {e}")
+        finally:
+            # FFmpeg holds its own copies of the read ends
+            os.close(video_read)
+            os.close(audio_read)
+
+        errors = []
+        writers = [
+            threading.Thread(
+                target=self._feed, args=(stream, fd, process, errors),
+                name=f"mux-{kind}", daemon=True
+            )
+            for kind, stream, fd in (('video', video_stream, video_write), ('audio', audio_stream, audio_write))
+        ]
+        for writer in writers:
+            writer.start()
+
+        _, stderr = process.communicate()
+        for writer in writers:
+            writer.join()
+
+        if any(isinstance(error, KeyboardInterrupt) for error in errors):
+            self._remove(output_file)
+            raise KeyboardInterrupt("Download cancelled by user")
+        if errors or process.returncode != 0:
+            self._remove(output_file)
+            detail = stderr.decode('utf-8', errors='ignore').strip()[-300:] if stderr else ''
+            reason = detail or (str(errors[0]) if errors else f"exit code {process.returncode}")
+            raise StreamingRemuxError(reason)
+
+        return output_file
+
+    @staticmethod
+    def _feed(stream, fd, process, errors):
+        """Writer thread - download one stream into its FFmpeg pipe"""
+        pipe = os.fdopen(fd, 'wb')
+        try:
+            stream.stream_to_buffer(pipe)
+        except BrokenPipeError as e:
+            # FFmpeg exited early; its exit status explains why
+            errors.append(e)
+        except BaseException as e:
+            errors.append(e)
+            # Kill first so a closed pipe is not mistaken for a finished input
+            process.kill()
+        finally:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _remove(path):
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,255 @@
+"""
+Two-tier thumbnail cache - decoded images in memory, encoded bytes on disk
+"""
+
+import os
+import re
+import time
+import hashlib
+import threading
+from io import BytesIO
+from collections import OrderedDict
+from PIL import Image
+from utils.network import network_manager
+from config.user_settings import user_settings
+from config.settings import THUMBNAIL_CACHE_DIR, THUMBNAIL_MEMORY_ITEMS, THUMBNAIL_CACHE_TTL_DAYS
+
+# YouTube thumbnail variants, smallest first
+THUMBNAIL_VARIANTS = [
+    ('default', (120, 90)),
+    ('mqdefault', (320, 180)),
+    ('hqdefault', (480, 360)),
+    ('sddefault', (640, 480)),
+    ('maxresdefault', (1280, 720)),
+]
+# 4:3 variants - 16:9 videos get black bars above and below in these
+LETTERBOXED_VARIANTS = {'default', 'hqdefault', 'sddefault'}
+LETTERBOX_MAX_LEVEL = 24  # brightest pixel (0-255) still counted as a black bar
+_VARIANT_URL = re.compile(
+    r'^(https?://(?:i\d?\.ytimg\.com|img\.youtube\.com)/vi(?:_webp)?/[\w-]+/)'
+    r'(?:default|mqdefault|hqdefault|sddefault|hq720|maxresdefault)(\.(?:jpg|webp))(\?.*)?$'
+)
+
+
+class ThumbnailCache:
+    """
+    Thumbnails keyed by URL and target size
+
+    Memory holds a bounded LRU of resized PIL images. Disk holds the downloaded
+    bytes (so other sizes need no network) and every resized variant (so a new
+    session needs no full-size decode).
+    """
+
+    def __init__(self, cache_dir=None, max_items=THUMBNAIL_MEMORY_ITEMS):
+        """
+        Args:
+            cache_dir (Path, optional): Cache directory (inside the user settings directory by default)
+            max_items (int): Number of decoded images kept in memory
+        """
+        self.cache_dir = cache_dir or (user_settings.settings_dir / THUMBNAIL_CACHE_DIR)
+        self.max_items = max_items
+        self._images = OrderedDict()  # (url, size) -> PIL.Image
+        self._lock = threading.Lock()
+        self._purged = False
+
+    def _path(self, url, size=None):
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        suffix = f"_{size[0]}x{size[1]}" if size else ""
+        return self.cache_dir / f"{digest}{suffix}.jpg"
+
+    def peek(self, url, size):
+        """
+        Get an image from memory only (safe to call on the UI thread)
+
+        Returns:
+            PIL.Image: Cached image, or None
+        """
+        key = (url, tuple(size))
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def get_image(self, url, size):
+        """
+        Get a thumbnail resized to size, from memory, disk or the network
+
+        The returned image is shared with the cache and must not be modified.
+
+        Args:
+            url (str): Thumbnail URL
+            size (tuple): Target size (width, height)
+
+        Returns:
+            PIL.Image: Resized thumbnail
+
+        Raises:
+            Exception: If the thumbnail could not be downloaded or decoded
+        """
+        size = tuple(size)
+        image = self.peek(url, size)
+        if image is not None:
+            return image
+
+        variant_path = self._path(url, size)
+        image = self._open(variant_path)
+        if image is None:
+            fetch_url = self.variant_url(url, size)
+            data = self._read(self._path(fetch_url))
+            if data is None:
+                try:
+                    data = self._download(fetch_url)
+                except Exception:
+                    if fetch_url == url:
+                        raise
+                    # Not every video has every variant - use the given URL
+                    fetch_url = url
+                    data = self._read(self._path(url)) or self._download(url)
+                self._write(self._path(fetch_url), data)
+            image = self.decode(data, size)
+            self._write_image(variant_path, image)
+
+        self._remember((url, size), image)
+        return image
+
+    @staticmethod
+    def variant_url(url, size):
+        """
+        Get the URL of the smallest native 16:9 YouTube thumbnail variant that covers size
+
+        Letterboxed 4:3 variants are skipped; mqdefault (320x180) covers every row thumbnail.
+
+        Args:
+            url (str): Thumbnail URL (any variant)
+            size (tuple): Target size (width, height)
+
+        Returns:
+            str: Variant URL, or url unchanged if it is not a known YouTube thumbnail
+        """
+        match = _VARIANT_URL.match(url)
+        if not match:
+            return url
+        for name, (width, height) in THUMBNAIL_VARIANTS:
+            if name in LETTERBOXED_VARIANTS:
+                continue
+            if width >= size[0] and height >= size[1]:
+                return f"{match.group(1)}{name}{match.group(2)}"
+        return url
+
+    @staticmethod
+    def decode(data, size):
+        """
+        Decode encoded image bytes straight to size
+
+        JPEGs are decoded at a reduced scale (draft mode, up to 1/8) that still
+        covers size, and the resample filter is chosen from the remaining scale.
+        Black letterbox bars of 4:3 variants are cropped away first.
+
+        Args:
+            data (bytes): Encoded image
+            size (tuple): Target size (width, height)
+
+        Returns:
+            PIL.Image: RGB image of exactly size
+        """
+        image = Image.open(BytesIO(data))
+        image.draft('RGB', size)
+        image = ThumbnailCache._crop_letterbox(image.convert('RGB'))
+        scale = min(image.width / size[0], image.height / size[1])
+        if scale >= 2:
+            # Large reductions: cheap filter after a fast integer pre-reduction
+            return image.resize(size, Image.BILINEAR, reducing_gap=2.0)
+        if scale > 1:
+            return image.resize(size, Image.BICUBIC)
+        return image.resize(size, Image.LANCZOS)  # Upscaling needs the sharpest filter
+
+    @staticmethod
+    def _crop_letterbox(image):
+        """Crop a 4:3 image to its 16:9 content if the bands above and below it are black"""
+        if abs(image.width * 3 - image.height * 4) > image.width // 20:
+            return image
+        content_height = round(image.width * 9 / 16)
+        bar = (image.height - content_height) // 2
+        if bar < 2:
+            return image
+        # Skip the rows next to the picture, where JPEG ringing brightens the bars
+        inset = max(bar // 4, 1)
+        for box in ((0, 0, image.width, bar - inset), (0, image.height - bar + inset, image.width, image.height)):
+            if image.crop(box).convert('L').getextrema()[1] > LETTERBOX_MAX_LEVEL:
+                return image  # A real 4:3 picture
+        return image.crop((0, bar, image.width, bar + content_height))
+
+    def _remember(self, key, image):
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_items:
+                self._images.popitem(last=False)
+
+    @staticmethod
+    def _download(url):
+        session = network_manager.get_session()
+        headers = network_manager.get_headers()
+        response = session.get(url, headers=headers, timeout=10)
+        response.raise_for_status()
+        return response.content
+
+    @staticmethod
+    def _open(path):
+        """Decode a cached variant (None if missing or unreadable)"""
+        try:
+            image = Image.open(path)
+            image.load()
+            return image
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write(self, path, data):
+        """Write bytes atomically"""
+        self._purge_once()
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # Caching is best effort
+
+    def _write_image(self, path, image):
+        buffer = BytesIO()
+        image.save(buffer, format='JPEG', quality=90)
+        self._write(path, buffer.getvalue())
+
+    def _purge_once(self):
+        """Drop files of earlier sessions that outlived THUMBNAIL_CACHE_TTL_DAYS"""
+        if self._purged:
+            return
+        self._purged = True
+        if not self.cache_dir.exists():
+            return
+        cutoff = time.time() - THUMBNAIL_CACHE_TTL_DAYS * 86400
+        for path in self.cache_dir.glob('*.jpg'):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def clear_memory(self):
+        """Forget all decoded images"""
+        with self._lock:
+            self._images.clear()
+
+
+# Global thumbnail cache instance
+thumbnail_cache = ThumbnailCache()
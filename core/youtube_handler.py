@@ -2,11 +2,16 @@
 YouTube API handling and video information retrieval
 """
 
-from pytubefix import YouTube, Playlist
+import copy
+import time
+from pytubefix import YouTube, Playlist, extract
 from utils.helpers import safe_filename, format_size, resolution_key
-from utils.network import network_manager
-from io import BytesIO
-from PIL import Image
+from core.client_strategy import client_scorer
+from core.metadata_cache import metadata_cache, CachedPlaylist
+from core.thumbnail_cache import thumbnail_cache
+from core.stream_index import StreamIndex
+from core.stream_cache import StreamCache, is_stream_stale
+from core.size_probe import size_probe
 
 
 class YouTubeHandler:
@@ -15,7 +20,34 @@ class YouTubeHandler:
     def __init__(self):
         self.current_video = None
         self.current_playlist = None
-        self.stream_cache = {}  # Cache streams by video URL for instant download
+        self.stream_cache = StreamCache()  # Resolved streams for instant download
+    
+    def _load_cached_video(self, url):
+        """
+        Rebuild a YouTube object from a cached player response (no network)
+        
+        Args:
+            url (str): YouTube video URL
+            
+        Returns:
+            YouTube: YouTube object, or None if nothing valid is cached
+        """
+        try:
+            video_id = extract.video_id(url)
+        except Exception:
+            return None
+        cached = metadata_cache.get_player_response(video_id)
+        if not cached:
+            return None
+        
+        client_name, vid_info = cached
+        client_config = {"use_oauth": False, "allow_oauth_cache": False}
+        if client_name and client_name != "DEFAULT":
+            client_config["client"] = client_name
+        video = YouTube(url, **client_config)
+        video._vid_info = vid_info
+        print(f"⚡ Loaded {video_id} from metadata cache")
+        return video
     
     def load_video_with_download_retry(self, url):
         """
@@ -32,6 +64,12 @@ class YouTubeHandler:
         """
         print("🔄 Loading video with download-optimized strategies...")
         
+        # The cached stream URLs may be what got refused
+        try:
+            metadata_cache.invalidate_video(extract.video_id(url))
+        except Exception:
+            pass
+        
         # Download-optimized client strategies for 403 errors
         download_clients = [
             # iOS client - often bypasses 403 restrictions
@@ -45,26 +83,32 @@ class YouTubeHandler:
             # TV_EMBED - last resort for 403 issues
             {"use_oauth": False, "allow_oauth_cache": False, "client": "TV_EMBED"},
         ]
+        # Clients that worked recently go first
+        download_clients = client_scorer.order(download_clients)
         
         last_error = None
         for i, client_config in enumerate(download_clients):
+            client_name = client_config.get("client", "DEFAULT")
+            started = time.time()
             try:
-                client_name = client_config.get("client", "DEFAULT")
                 print(f"🔄 Download retry {i+1}/{len(download_clients)}: {client_name}")
                 
                 video = YouTube(url, **client_config)
                 
-                # Test download capability by accessing streams
-                streams = video.streams.filter(file_extension='mp4')
+                # Test download capability by accessing streams (builds the stream index)
+                streams = self.get_stream_index(video).by_container.get('mp4', [])
                 if streams and len(streams) > 0:
                     print(f"✅ Download-optimized {client_name} successful with {len(streams)} streams")
+                    client_scorer.record(client_name, True, time.time() - started)
                     return video
                 else:
                     print(f"⚠️ {client_name} no streams available")
+                    client_scorer.record(client_name, False, time.time() - started)
                     continue
                     
             except Exception as e:
                 last_error = e
+                client_scorer.record(client_name, False, time.time() - started, e)
                 error_str = str(e)[:100]
                 print(f"❌ Download client {client_name} failed: {error_str}...")
                 continue
@@ -86,6 +130,11 @@ class YouTubeHandler:
             Exception: If video loading fails
         """
         try:
+            cached_video = self._load_cached_video(url)
+            if cached_video:
+                self.current_video = cached_video
+                return self.current_video
+            
             # Updated client strategies to handle YouTube's latest anti-bot measures  
             # Reordered to prioritize clients with better stream access
             clients_to_try = [
@@ -102,11 +151,14 @@ class YouTubeHandler:
                 # TV Embed client bypasses restrictions but often has stream issues (last)
                 {"use_oauth": False, "allow_oauth_cache": False, "client": "TV_EMBED"},
             ]
+            # Clients that worked recently go first
+            clients_to_try = client_scorer.order(clients_to_try)
             
             last_error = None
             for i, client_config in enumerate(clients_to_try):
+                client_name = client_config.get("client", "DEFAULT")
+                started = time.time()
                 try:
-                    client_name = client_config.get("client", "DEFAULT")
                     print(f"🔄 Trying client {i+1}/{len(clients_to_try)}: {client_name}")
                     
                     self.current_video = YouTube(url, **client_config)
@@ -119,17 +171,24 @@ class YouTubeHandler:
                     print(f"📹 Title: {title[:50]}...")
                     print(f"⏱️ Duration: {length}s")
                     
+                    # Keep the raw player response - building streams rewrites its URLs
+                    vid_info = copy.deepcopy(self.current_video.vid_info)
+                    
                     # Test stream access (critical for download functionality)
                     try:
-                        streams = self.current_video.streams.filter(file_extension='mp4')
+                        streams = self.get_stream_index(self.current_video).by_container.get('mp4', [])
                         if streams and len(streams) > 0:
                             print(f"🎬 {client_name} has {len(streams)} streams available")
+                            client_scorer.record(client_name, True, time.time() - started)
+                            metadata_cache.put_video(self.current_video.video_id, client_name, vid_info)
                             return self.current_video
                         else:
                             print(f"⚠️ {client_name} loaded video but no streams found, trying next client...")
+                            client_scorer.record(client_name, False, time.time() - started)
                             continue
                             
                     except Exception as stream_error:
+                        client_scorer.record(client_name, False, time.time() - started, stream_error)
                         print(f"❌ {client_name} video loaded but streams failed: {str(stream_error)[:50]}...")
                         # If this is TV_EMBED with stream issues, it's expected
                         if client_name == "TV_EMBED":
@@ -139,6 +198,7 @@ class YouTubeHandler:
                     
                 except Exception as e:
                     last_error = e
+                    client_scorer.record(client_name, False, time.time() - started, e)
                     error_msg = str(e)
                     print(f"❌ {client_name} client failed: {error_msg[:100]}...")
                     
@@ -174,11 +234,26 @@ class YouTubeHandler:
             Exception: If playlist loading fails
         """
         try:
-            # Use different client strategies for better compatibility
-            from pytubefix import Playlist
-            self.current_playlist = Playlist(url)
+            playlist = Playlist(url)
+            
+            # Re-opened playlists skip the page walk
+            cached = metadata_cache.get_playlist(playlist.playlist_id)
+            if cached and cached.get('title'):
+                print(f"⚡ Loaded playlist {playlist.playlist_id} from metadata cache")
+                self.current_playlist = CachedPlaylist(url, cached['video_urls'], cached['title'])
+                return self.current_playlist
+            
+            # Resolve the video list and title once, here on the worker thread;
+            # the title comes from the page the video list already fetched
+            video_urls = list(playlist.video_urls)
+            try:
+                title = playlist.title
+            except Exception:
+                title = None
+            metadata_cache.put_playlist(playlist.playlist_id, video_urls, title=title)
             
             # Don't pre-filter, let the UI handle errors during iteration
+            self.current_playlist = CachedPlaylist(url, video_urls, title)
             return self.current_playlist
             
         except Exception as e:
@@ -265,16 +340,48 @@ class YouTubeHandler:
                 'thumbnail_url': ''
             }
     
-    def safe_load_video_from_url(self, video_url):
+    def get_cached_video_info(self, url):
+        """
+        Get video information from the long-lived metadata cache (no network)
+        
+        Static metadata outlives the cached stream URLs, so a known video can be
+        previewed while its streams are resolved again.
+        
+        Args:
+            url (str): YouTube video URL
+            
+        Returns:
+            dict: Video information dictionary (same keys as get_video_info), or None if unknown
+        """
+        try:
+            video_id = extract.video_id(url)
+        except Exception:
+            return None
+        metadata = metadata_cache.get_metadata(video_id)
+        if not metadata or not metadata.get('title'):
+            return None
+        return {
+            'title': metadata['title'],
+            'author': metadata.get('author') or 'Unknown Author',
+            'length': metadata.get('length') or 0,
+            'thumbnail_url': metadata.get('thumbnail_url') or ''
+        }
+    
+    def safe_load_video_from_url(self, video_url, stop_check=None):
         """
         Safely load a video from URL with multiple client strategies
         
         Args:
             video_url (str): YouTube video URL
+            stop_check (callable, optional): Returns True to give up before trying the next client
             
         Returns:
             YouTube: YouTube object or None if failed
         """
+        cached_video = self._load_cached_video(video_url)
+        if cached_video:
+            return cached_video
+        
         # Use same improved client strategies as load_video
         clients_to_try = [
             {"use_oauth": False, "allow_oauth_cache": False, "client": "IOS"},
@@ -284,10 +391,15 @@ class YouTubeHandler:
             {"use_oauth": False, "allow_oauth_cache": False, "client": "ANDROID_MUSIC"},
             {"use_oauth": False, "allow_oauth_cache": False},
         ]
+        # Clients that worked recently go first
+        clients_to_try = client_scorer.order(clients_to_try)
         
         for i, client_config in enumerate(clients_to_try):
+            if stop_check and stop_check():
+                return None
+            client_name = client_config.get("client", "DEFAULT")
+            started = time.time()
             try:
-                client_name = client_config.get("client", "DEFAULT")
                 print(f"🔄 Safe load trying {client_name}...")
                 
                 video = YouTube(video_url, **client_config)
@@ -295,15 +407,30 @@ class YouTubeHandler:
                 _ = video.title  # This will fail if video is inaccessible
                 
                 print(f"✅ Safe load successful with {client_name}")
+                client_scorer.record(client_name, True, time.time() - started)
+                metadata_cache.put_video(video.video_id, client_name, copy.deepcopy(video.vid_info))
                 return video
                 
             except Exception as e:
+                client_scorer.record(client_name, False, time.time() - started, e)
                 print(f"❌ Safe load {client_name} failed: {str(e)[:50]}...")
                 continue
         
         print("❌ All safe load attempts failed")
         return None  # All clients failed
     
+    def get_stream_index(self, video):
+        """
+        Get the stream index of a video (built once per video object)
+        
+        Args:
+            video (YouTube): YouTube video object
+            
+        Returns:
+            StreamIndex: Resolution, codec, container and audio lookups
+        """
+        return StreamIndex.for_video(video)
+    
     def get_quality_options(self, video):
         """
         Get adaptive quality options for a video with sizes (highest quality)
@@ -318,7 +445,8 @@ class YouTubeHandler:
             # First, try to get streams with the current video object
             streams = None
             try:
-                streams = video.streams.filter(file_extension='mp4')
+                index = self.get_stream_index(video)
+                streams = index.by_container.get('mp4', [])
                 print(f"📊 Found {len(streams)} total streams")
             except Exception as e:
                 print(f"❌ Current client can't access streams: {e}")
@@ -340,11 +468,13 @@ class YouTubeHandler:
                         print(f"🔄 Trying {client_name} for streams...")
                         
                         temp_video = YouTube(video.watch_url, **client_config)
-                        streams = temp_video.streams.filter(file_extension='mp4')
+                        temp_index = self.get_stream_index(temp_video)
+                        streams = temp_index.by_container.get('mp4', [])
                         
                         if streams and len(streams) > 0:
                             print(f"✅ {client_name} provided {len(streams)} streams")
                             video = temp_video  # Use this client's video object
+                            index = temp_index
                             break
                     except Exception as client_error:
                         print(f"❌ {client_name} streams failed: {str(client_error)[:50]}...")
@@ -355,34 +485,20 @@ class YouTubeHandler:
             # If we have streams, process them
             if streams and len(streams) > 0:
                 try:
-                    # Get video-only streams (adaptive) - ONLY these for best quality
-                    adaptive_streams = streams.filter(adaptive=True, only_video=True)
-                    print(f"📹 Found {len(adaptive_streams)} adaptive video streams")
+                    # Video-only streams (adaptive) - ONLY these for best quality.
+                    # The index keeps the highest bitrate stream for each resolution.
+                    resolution_streams = index.best_video_by_resolution
                     
-                    # Debug: Print all available resolutions
                     print("🔍 Available resolutions from streams:")
-                    for stream in adaptive_streams:
-                        if hasattr(stream, 'resolution') and stream.resolution:
-                            bitrate_info = f" (bitrate: {stream.bitrate})" if hasattr(stream, 'bitrate') and stream.bitrate else ""
-                            print(f"   • {stream.resolution}{bitrate_info}")
-                    
-                    # Create a dictionary to store best stream for each resolution
-                    resolution_streams = {}
-                    
-                    for stream in adaptive_streams:
-                        if hasattr(stream, 'resolution') and stream.resolution:
-                            res = stream.resolution
-                            print(f"🎯 Processing {res} stream...")
-                            
-                            # Keep the stream with highest bitrate for each resolution
-                            if res not in resolution_streams:
-                                resolution_streams[res] = stream
-                            elif hasattr(stream, 'bitrate') and hasattr(resolution_streams[res], 'bitrate'):
-                                if stream.bitrate and stream.bitrate > resolution_streams[res].bitrate:
-                                    resolution_streams[res] = stream
+                    for res, stream in resolution_streams.items():
+                        bitrate_info = f" (bitrate: {stream.bitrate})" if stream.bitrate else ""
+                        print(f"   • {res}{bitrate_info}")
                     
                     print(f"📊 Processed {len(resolution_streams)} unique resolutions")
                     
+                    # Exact sizes for every resolution at once (manifest, else parallel HEAD)
+                    exact_sizes = size_probe.probe(video.video_id, resolution_streams.values())
+                    
                     # Convert to quality options with file sizes
                     for resolution, stream in resolution_streams.items():
                         try:
@@ -390,35 +506,24 @@ class YouTubeHandler:
                             
                             print(f"🔍 Processing resolution: {resolution}")
                             
-                            # Method 1: Try to get direct file size
-                            if hasattr(stream, 'filesize') and stream.filesize and stream.filesize > 0:
-                                size_info = f" ({format_size(stream.filesize)})"
+                            # Method 1: Exact size from the manifest or a HEAD probe
+                            exact_size = exact_sizes.get(stream.itag)
+                            if exact_size:
+                                size_info = f" ({format_size(exact_size)})"
                                 print(f"✅ {resolution}: Direct size {size_info}")
                             
-                            # Method 2: Try to force load file size by accessing stream properties
-                            elif hasattr(stream, 'filesize'):
-                                try:
-                                    # Sometimes filesize is None until accessed
-                                    _ = stream.url  # This can trigger size calculation
-                                    if stream.filesize and stream.filesize > 0:
-                                        size_info = f" ({format_size(stream.filesize)})"
-                                        print(f"✅ {resolution}: Loaded size {size_info}")
-                                except:
-                                    pass
-                            
-                            # Method 3: Calculate approximate size using bitrate
+                            # Method 2: Calculate approximate size using bitrate
                             if not size_info:
                                 try:
-                                    if (hasattr(video, 'length') and video.length and 
-                                        hasattr(stream, 'bitrate') and stream.bitrate):
-                                        # Calculate size: bitrate (bits/sec) * duration (sec) / 8 (bits to bytes)
-                                        estimated_bytes = (stream.bitrate * video.length) // 8
+                                    # bitrate (bits/sec) * duration (sec) / 8 (bits to bytes)
+                                    estimated_bytes = index.estimate_size(stream)
+                                    if estimated_bytes:
                                         size_info = f" (~{format_size(estimated_bytes)})"
                                         print(f"🔢 {resolution}: Calculated size {size_info}")
                                 except Exception as e:
                                     print(f"❌ Could not calculate size for {resolution}: {e}")
                             
-                            # Method 4: Try alternative bitrate calculation
+                            # Method 3: Try alternative bitrate calculation
                             if not size_info:
                                 try:
                                     # Try to get average bitrate based on resolution
@@ -597,20 +702,12 @@ class YouTubeHandler:
     def get_quality_options_fast(self, video):
         """Fast resolution list without size calculation to avoid delays."""
         try:
-            streams = video.streams.filter(file_extension='mp4')
-            adaptive_streams = streams.filter(adaptive=True, only_video=True)
-
-            available_resolutions = []
-            for stream in adaptive_streams:
-                res = getattr(stream, 'resolution', None)
-                if res and res not in available_resolutions:
-                    available_resolutions.append(res)
+            # Already sorted highest first
+            available_resolutions = self.get_stream_index(video).resolutions
 
             if not available_resolutions:
                 return self.get_simplified_quality_options(video)
 
-            available_resolutions.sort(key=resolution_key, reverse=True)
-
             options = []
             for resolution in available_resolutions:
                 label = ""
@@ -645,19 +742,8 @@ class YouTubeHandler:
             list: List of simplified quality options
         """
         try:
-            streams = video.streams.filter(file_extension='mp4')
-            available_resolutions = set()
-            
             # Get all available resolutions from adaptive streams only (best quality)
-            try:
-                # Adaptive streams (video-only) - ONLY these for best quality
-                adaptive_streams = streams.filter(adaptive=True, only_video=True)
-                for stream in adaptive_streams:
-                    if hasattr(stream, 'resolution') and stream.resolution:
-                        available_resolutions.add(stream.resolution)
-                        
-            except Exception as e:
-                print(f"Error getting adaptive streams: {e}")
+            available_resolutions = set(self.get_stream_index(video).resolutions)
             
             # Define the simplified quality options we want to show (comprehensive list)
             quality_mapping = {
@@ -739,7 +825,7 @@ class YouTubeHandler:
             Stream: Best matching adaptive stream or None
         """
         try:
-            streams = video.streams.filter(file_extension='mp4')
+            index = self.get_stream_index(video)
             
             # Map simplified quality to actual resolutions
             resolution_mapping = {
@@ -756,24 +842,13 @@ class YouTubeHandler:
             
             # Look for adaptive streams only (best quality)
             for target_res in target_resolutions:
-                adaptive_stream = streams.filter(adaptive=True, only_video=True, resolution=target_res).first()
+                adaptive_stream = index.get_video(target_res)
                 if adaptive_stream:
                     return adaptive_stream
             
             # If no exact match, find closest adaptive quality
-            # Get all available adaptive streams with resolutions
-            available_streams = []
-            adaptive_streams = streams.filter(adaptive=True, only_video=True)
-            for stream in adaptive_streams:
-                if stream.resolution:
-                    available_streams.append(stream)
-            
-            if not available_streams:
-                # Fallback: try any video-only stream
-                video_only_streams = streams.filter(only_video=True)
-                for stream in video_only_streams:
-                    if stream.resolution:
-                        available_streams.append(stream)
+            # (first stream of each resolution, in manifest order)
+            available_streams = list(index.video_by_resolution.values())
             
             if not available_streams:
                 return None
@@ -923,27 +998,78 @@ class YouTubeHandler:
     
     def get_thumbnail_image(self, thumbnail_url, size=(120, 90)):
         """
-        Download and process thumbnail image
+        Download and process thumbnail image (served from the thumbnail cache when possible)
         
         Args:
             thumbnail_url (str): URL of the thumbnail
             size (tuple): Target size (width, height)
             
         Returns:
-            PIL.Image: Processed thumbnail image
+            PIL.Image: Processed thumbnail image (shared with the cache, do not modify)
         """
         try:
-            session = network_manager.get_session()
-            headers = network_manager.get_headers()
-            response = session.get(thumbnail_url, headers=headers, timeout=10, verify=False)
-            img_data = BytesIO(response.content)
-            img = Image.open(img_data)
-            img = img.resize(size, Image.LANCZOS)
-            return img
+            return thumbnail_cache.get_image(thumbnail_url, size)
         except Exception as e:
             print(f"Error loading thumbnail: {e}")
             return None
     
+    def _cached_stream(self, video, key, label, lookup):
+        """
+        Get a stream from the stream cache, resolving it from the stream index on a miss
+        
+        A stream whose URL has expired is not returned: the video's streams are
+        reloaded first, so the download does not fail with a 403.
+        
+        Args:
+            video (YouTube): YouTube video object
+            key (tuple): Cache key (video_id, ...)
+            label (str): Stream description for log messages
+            lookup (callable): lookup(index) -> Stream or None
+            
+        Returns:
+            Stream: YouTube stream object or None
+        """
+        # Return cached stream if available (expired URLs are never returned)
+        stream = self.stream_cache.get(key)
+        if stream is not None:
+            print(f"⚡ Using cached {label} stream (0ms)")
+            return stream
+        
+        # Fetch from the stream index, refreshing it if its URLs went stale
+        stream = lookup(self.get_stream_index(video))
+        if stream is not None and is_stream_stale(stream):
+            print(f"⏰ {label} stream URL expired, refreshing streams...")
+            if self._refresh_streams(video):
+                stream = lookup(self.get_stream_index(video))
+        
+        # Cache for instant reuse
+        if stream is not None and self.stream_cache.put(key, stream):
+            print(f"💾 Cached {label} stream")
+        
+        return stream
+    
+    def _refresh_streams(self, video):
+        """
+        Reload the streams of a video whose stream URLs expired
+        
+        The fresh stream index replaces the one of the given video object, so
+        callers holding it get valid URLs without reloading anything themselves.
+        
+        Args:
+            video (YouTube): YouTube video object
+            
+        Returns:
+            bool: True if fresh streams were loaded
+        """
+        try:
+            fresh_video = self.load_video_with_download_retry(video.watch_url)
+        except Exception as e:
+            print(f"❌ Stream refresh failed: {str(e)[:100]}")
+            return False
+        self.stream_cache.invalidate_video(video.video_id)
+        video._stream_index = self.get_stream_index(fresh_video)
+        return True
+    
     def get_stream_by_quality(self, video, resolution, stream_type):
         """
         Get specific stream by quality and type - CACHED FOR INSTANT ACCESS
@@ -956,35 +1082,12 @@ class YouTubeHandler:
         Returns:
             Stream: YouTube stream object
         """
-        # Create cache key
-        cache_key = f"{video.watch_url}_{resolution}_{stream_type}"
-        
-        # Return cached stream if available
-        if cache_key in self.stream_cache:
-            print(f"⚡ Using cached {resolution} {stream_type} stream (0ms)")
-            return self.stream_cache[cache_key]
-        
-        # Fetch and cache stream
         if "Progressive" in stream_type:
-            stream = video.streams.filter(
-                progressive=True, 
-                file_extension='mp4', 
-                res=resolution
-            ).first()
+            lookup = lambda index: index.get_progressive(resolution)
         else:
-            stream = video.streams.filter(
-                adaptive=True, 
-                file_extension='mp4', 
-                res=resolution,
-                only_video=True
-            ).first()
-        
-        # Cache for instant reuse
-        if stream:
-            self.stream_cache[cache_key] = stream
-            print(f"💾 Cached {resolution} {stream_type} stream")
-        
-        return stream
+            lookup = lambda index: index.get_video(resolution)
+        return self._cached_stream(video, (video.video_id, resolution, stream_type),
+                                   f"{resolution} {stream_type}", lookup)
     
     def get_best_audio_stream(self, video):
         """
@@ -996,29 +1099,9 @@ class YouTubeHandler:
         Returns:
             Stream: Best audio stream
         """
-        # Create cache key
-        cache_key = f"{video.watch_url}_best_audio"
-        
-        # Return cached stream if available
-        if cache_key in self.stream_cache:
-            print("⚡ Using cached best audio stream (0ms)")
-            return self.stream_cache[cache_key]
-        
-        # Fetch and cache stream
-        audio_streams = video.streams.filter(adaptive=True, only_audio=True)
-        mp4_audio = audio_streams.filter(file_extension='mp4')
-        preferred = mp4_audio.order_by('abr').desc().first()
-        if preferred:
-            stream = preferred
-        else:
-            stream = audio_streams.order_by('abr').desc().first()
-        
-        # Cache for instant reuse
-        if stream:
-            self.stream_cache[cache_key] = stream
-            print("💾 Cached best audio stream")
-        
-        return stream
+        # Highest abr, MP4 preferred
+        return self._cached_stream(video, (video.video_id, 'best_audio'), "best audio",
+                                   lambda index: index.best_audio)
     
     def get_audio_only_stream(self, video):
         """
@@ -1030,20 +1113,14 @@ class YouTubeHandler:
         Returns:
             Stream: Audio-only stream
         """
-        # Create cache key
-        cache_key = f"{video.watch_url}_audio_only"
-        
-        # Return cached stream if available
-        if cache_key in self.stream_cache:
-            print("⚡ Using cached audio-only stream (0ms)")
-            return self.stream_cache[cache_key]
-        
-        # Fetch and cache stream
-        stream = video.streams.get_audio_only()
-        
-        # Cache for instant reuse
-        if stream:
-            self.stream_cache[cache_key] = stream
-            print("💾 Cached audio-only stream")
+        return self._cached_stream(video, (video.video_id, 'audio_only'), "audio-only",
+                                   lambda index: index.audio_only)
+    
+    def get_stream_cache_stats(self):
+        """
+        Get stream cache statistics
         
-        return stream
\ No newline at end of file
+        Returns:
+            dict: entries, hits, misses, evictions, expirations and hit_rate
+        """
+        return self.stream_cache.get_stats()
\ No newline at end of file
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+YouTube Downloader - Download Daemon
+
+One always-on downloader per machine: jobs are kept in a SQLite queue, run on a
+worker pool (one DownloadManager per worker) and controlled over a small HTTP
+API. Jobs that were queued or running when the daemon stopped run again on the
+next start, and partial downloads resume from their resume journals.
+
+Usage:
+    python daemon.py [--host 127.0.0.1] [--port 8765] [-j 2] [-o DIR] [--db PATH]
+
+HTTP API (JSON):
+    GET    /health              worker count and jobs per state
+    GET    /jobs[?status=...]   list jobs, newest first
+    POST   /jobs                {"url": ... | "urls": [...], "quality": "best", "audio": false}
+    GET    /jobs/<id>           one job
+    POST   /jobs/<id>/cancel    cancel a queued or running job (DELETE /jobs/<id> does the same)
+    GET    /events              Server-Sent Events stream of job and progress events
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import signal
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pytubefix import extract
+from config.settings import (
+    DAEMON_HOST, DAEMON_PORT, DAEMON_WORKERS, DAEMON_PROGRESS_INTERVAL,
+    JOB_DB_FILE, JOB_PROGRESS_SAVE_INTERVAL
+)
+from config.user_settings import user_settings
+from core import DownloadManager, YouTubeHandler
+from core.job_queue import JobQueue, QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED
+
+
+class EventHub:
+    """Fans events out to every connected event stream"""
+
+    def __init__(self, backlog=1000):
+        """
+        Args:
+            backlog (int): Events buffered per subscriber (a slow reader misses newer ones)
+        """
+        self.backlog = backlog
+        self._lock = threading.Lock()
+        self._subscribers = []
+
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=self.backlog)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, event, **fields):
+        """Send an event to every subscriber (never blocks)"""
+        message = dict(event=event, time=round(time.time(), 3), **fields)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                pass
+
+
+class DownloadDaemon:
+    """Runs queued jobs on a pool of workers, each with its own DownloadManager"""
+
+    def __init__(self, job_queue, output_path, workers=DAEMON_WORKERS):
+        """
+        Args:
+            job_queue (JobQueue): Persistent job queue
+            output_path (str): Directory downloads are saved to
+            workers (int): Number of jobs downloaded at the same time
+        """
+        self.job_queue = job_queue
+        self.output_path = output_path
+        self.workers = max(1, workers)
+        self.events = EventHub()
+        self.youtube_handler = YouTubeHandler()  # playlist expansion on submit
+
+        self._condition = threading.Condition()
+        self._running = {}  # job id -> (DownloadManager, job)
+        self._threads = []
+        self._stopping = threading.Event()
+
+    @property
+    def stopping(self):
+        """True once stop() was called"""
+        return self._stopping.is_set()
+
+    def start(self):
+        """Start the worker threads"""
+        for number in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"daemon-worker-{number + 1}", daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def stop(self, timeout=30):
+        """
+        Stop the workers; running jobs go back to the queue and resume on the next start
+
+        Args:
+            timeout (float): Seconds to wait for running downloads to stop
+        """
+        self._stopping.set()
+        with self._condition:
+            for manager, _ in self._running.values():
+                manager.cancel_download()
+            self._condition.notify_all()
+        deadline = time.time() + timeout
+        for thread in self._threads:
+            thread.join(max(deadline - time.time(), 0))
+
+    def submit(self, urls, quality='best', audio=False):
+        """
+        Queue downloads (playlist URLs become one job per video)
+
+        Args:
+            urls (list): Video or playlist URLs
+            quality (str): Quality string ("best", "1080p", "4K", ...)
+            audio (bool): Download audio only as MP3
+
+        Returns:
+            list: The new jobs
+        """
+        jobs = []
+        for url in urls:
+            if self.youtube_handler.is_playlist(url):
+                video_urls = self.youtube_handler.load_playlist(url).video_urls
+            else:
+                video_urls = [url]
+            for video_url in video_urls:
+                try:
+                    video_id = extract.video_id(video_url)
+                except Exception:
+                    video_id = None
+                job = self.job_queue.submit(video_url, quality, audio, self.output_path, video_id)
+                self.events.publish("job", job=job)
+                jobs.append(job)
+        with self._condition:
+            self._condition.notify_all()
+        return jobs
+
+    def cancel(self, job_id):
+        """
+        Cancel a job (a running download stops at its next chunk)
+
+        Returns:
+            dict: The job, or None if unknown
+        """
+        job = self.job_queue.cancel(job_id)
+        if job is None:
+            return None
+        with self._condition:
+            running = self._running.get(job_id)
+            if running is not None:
+                running[0].cancel_download()
+        if job['status'] == CANCELLED:
+            self.events.publish("job", job=job)
+        return job
+
+    def get_status(self):
+        """
+        Get worker and queue information
+
+        Returns:
+            dict: workers, running job ids and job counts per state
+        """
+        with self._condition:
+            running = sorted(self._running)
+        return {'workers': self.workers, 'running': running, 'jobs': self.job_queue.counts()}
+
+    def _busy_video_ids(self):
+        """Video ids of running jobs (caller holds the condition)"""
+        return [job['video_id'] for _, job in self._running.values() if job.get('video_id')]
+
+    def _worker(self):
+        while not self._stopping.is_set():
+            with self._condition:
+                job = self.job_queue.claim_next(self._busy_video_ids())
+                if job is None:
+                    self._condition.wait(timeout=5)
+                    continue
+                manager = DownloadManager()
+                manager.set_progress_callback(self._progress_reporter(job['id']))
+                self._running[job['id']] = (manager, job)
+
+            self.events.publish("job", job=job)
+            try:
+                self._run_job(job, manager)
+                job = self.job_queue.finish(job['id'], COMPLETED)
+            except KeyboardInterrupt:
+                # Stopping daemon: run again on the next start; otherwise the user cancelled
+                job = self.job_queue.finish(job['id'], QUEUED if self._stopping.is_set() else CANCELLED)
+            except Exception as e:
+                if manager.stop_flag:
+                    job = self.job_queue.finish(job['id'], QUEUED if self._stopping.is_set() else CANCELLED)
+                else:
+                    print(f"❌ Job {job['id']} failed: {e}")
+                    job = self.job_queue.finish(job['id'], FAILED, str(e))
+            finally:
+                with self._condition:
+                    self._running.pop(job['id'], None)
+                    # A finished job may unblock a queued job of the same video
+                    self._condition.notify_all()
+            self.events.publish("job", job=job)
+
+    def _run_job(self, job, manager):
+        """Download the video of one job with the worker's DownloadManager"""
+        handler = manager.youtube_handler
+        video = handler.safe_load_video_from_url(job['url'])
+        self._check_cancelled(manager)
+        if video is None:
+            raise Exception("Video could not be loaded")
+        quality = job['quality']
+        if quality == 'best' and not job['audio']:
+            resolutions = handler.get_stream_index(video).resolutions
+            quality = resolutions[0] if resolutions else '1080p'
+        job.update(self.job_queue.update(job['id'], title=video.title, video_id=video.video_id))
+        self.events.publish("job", job=job)
+
+        # Loading is not interruptible - a cancel that arrived meanwhile must not end as completed
+        self._check_cancelled(manager)
+        if manager.should_skip(video, quality, job['audio'], job['output_path']):
+            return
+
+        print(f"⬇️ Job {job['id']}: {video.title} ({'MP3' if job['audio'] else quality})")
+        try:
+            manager.download_single_video(video, quality, job['audio'], job['output_path'])
+        except Exception as e:
+            if manager.stop_flag or not ("403" in str(e) or "Forbidden" in str(e)):
+                raise
+            # Refused stream URLs: reload with the download-optimized clients once
+            print(f"🔄 Job {job['id']}: 403 error, retrying with download-optimized clients...")
+            video = handler.load_video_with_download_retry(job['url'])
+            self._check_cancelled(manager)
+            manager.download_single_video(video, quality, job['audio'], job['output_path'])
+
+    @staticmethod
+    def _check_cancelled(manager):
+        """Stop a job between steps once it was cancelled (or the daemon is stopping)"""
+        if manager.stop_flag:
+            raise KeyboardInterrupt("Download cancelled")
+
+    def _progress_reporter(self, job_id):
+        """Create the progress callback of one job (throttled events, rarer database writes)"""
+        last = {'event': 0, 'save': 0}
+
+        def report(downloaded, total, percentage, speed, elapsed, custom_text=None):
+            now = time.monotonic()
+            if custom_text is None and now - last['event'] < DAEMON_PROGRESS_INTERVAL:
+                return
+            last['event'] = now
+            self.events.publish(
+                "progress", job_id=job_id, downloaded=downloaded, total=total,
+                percent=round(percentage, 1), speed=round(speed, 2), elapsed=elapsed, text=custom_text
+            )
+            if total and now - last['save'] >= JOB_PROGRESS_SAVE_INTERVAL:
+                last['save'] = now
+                self.job_queue.update(job_id, downloaded=downloaded, total=total)
+
+        return report
+
+
+class ApiHandler(BaseHTTPRequestHandler):
+    """JSON HTTP API of the daemon (the daemon is server.download_daemon)"""
+
+    server_version = "YTDownloaderDaemon"
+    max_body_size = 1024 * 1024
+
+    @property
+    def daemon(self):
+        return self.server.download_daemon
+
+    def log_message(self, format, *args):
+        print(f"🌐 {self.address_string()} {format % args}")
+
+    def _send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status, message):
+        self._send_json(status, {'error': message})
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > self.max_body_size:
+            raise ValueError("Request body too large")
+        data = json.loads(self.rfile.read(length) or b'{}')
+        if not isinstance(data, dict):
+            raise ValueError("Request body must be a JSON object")
+        return data
+
+    def _route(self):
+        """Split the path into parts and the parsed query string"""
+        parsed = urlparse(self.path)
+        return [part for part in parsed.path.split('/') if part], parse_qs(parsed.query)
+
+    def _job_id(self, part):
+        try:
+            return int(part)
+        except ValueError:
+            return None
+
+    def do_GET(self):
+        parts, query = self._route()
+        if parts == ['health']:
+            self._send_json(200, self.daemon.get_status())
+        elif parts == ['jobs']:
+            status = query.get('status', [None])[0]
+            self._send_json(200, {'jobs': self.daemon.job_queue.list(status)})
+        elif len(parts) == 2 and parts[0] == 'jobs':
+            job = self.daemon.job_queue.get(self._job_id(parts[1]))
+            if job is None:
+                self._send_error(404, "Job not found")
+            else:
+                self._send_json(200, job)
+        elif parts == ['events']:
+            self._stream_events()
+        else:
+            self._send_error(404, "Not found")
+
+    def do_POST(self):
+        parts, _ = self._route()
+        if parts == ['jobs']:
+            try:
+                data = self._read_json()
+            except ValueError as e:
+                self._send_error(400, str(e))
+                return
+            urls = data.get('urls') or ([data['url']] if data.get('url') else [])
+            if not urls or not all(isinstance(url, str) for url in urls):
+                self._send_error(400, "Give a 'url' or a list of 'urls'")
+                return
+            try:
+                jobs = self.daemon.submit(urls, str(data.get('quality') or 'best'), bool(data.get('audio')))
+            except Exception as e:
+                self._send_error(400, str(e))
+                return
+            self._send_json(201, {'jobs': jobs})
+        elif len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'cancel':
+            self._cancel(parts[1])
+        else:
+            self._send_error(404, "Not found")
+
+    def do_DELETE(self):
+        parts, _ = self._route()
+        if len(parts) == 2 and parts[0] == 'jobs':
+            self._cancel(parts[1])
+        else:
+            self._send_error(404, "Not found")
+
+    def _cancel(self, part):
+        job = self.daemon.cancel(self._job_id(part))
+        if job is None:
+            self._send_error(404, "Job not found")
+        elif job['status'] in (QUEUED, RUNNING, CANCELLED):
+            self._send_json(202 if job['status'] == RUNNING else 200, job)
+        else:
+            self._send_error(409, f"Job already {job['status']}")
+
+    def _stream_events(self):
+        """Server-Sent Events: one "data:" line of JSON per event, keep-alive comments in between"""
+        subscriber = self.daemon.events.subscribe()
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            while not self.daemon.stopping:
+                try:
+                    message = subscriber.get(timeout=15)
+                    chunk = f"data: {json.dumps(message, ensure_ascii=False)}\n\n"
+                except queue.Empty:
+                    chunk = ": keep-alive\n\n"
+                self.wfile.write(chunk.encode('utf-8'))
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away
+        finally:
+            self.daemon.events.unsubscribe(subscriber)
+
+
+def _raise_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def main(argv=None):
+    """Daemon entry point"""
+    parser = argparse.ArgumentParser(prog="daemon.py", description="Queue-based YouTube download daemon with an HTTP API")
+    parser.add_argument('--host', default=DAEMON_HOST, help=f'address to listen on (default: {DAEMON_HOST})')
+    parser.add_argument('--port', type=int, default=DAEMON_PORT, help=f'port to listen on (default: {DAEMON_PORT})')
+    parser.add_argument('-j', '--workers', type=int, default=DAEMON_WORKERS,
+                        help=f'jobs downloaded at the same time (default: {DAEMON_WORKERS})')
+    parser.add_argument('-o', '--output', default='.', help='output directory (default: current directory)')
+    parser.add_argument('--db', default=str(user_settings.settings_dir / JOB_DB_FILE), help='job database file')
+    args = parser.parse_args(argv)
+
+    output_path = os.path.abspath(args.output)
+    os.makedirs(output_path, exist_ok=True)
+
+    job_queue = JobQueue(args.db)
+    daemon = DownloadDaemon(job_queue, output_path, args.workers)
+    server = ThreadingHTTPServer((args.host, args.port), ApiHandler)
+    server.daemon_threads = True
+    server.download_daemon = daemon
+
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+    daemon.start()
+    print(f"🚀 Download daemon on http://{args.host}:{server.server_port} "
+          f"({daemon.workers} workers, saving to {output_path})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("🛑 Stopping - running jobs resume on the next start")
+    finally:
+        daemon.stop()
+        server.server_close()
+        job_queue.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,4 +8,5 @@ from .progress_tracker import ProgressTracker
 from .quality_selector import QualitySelector
 from .settings_dialog import SettingsDialog
 from .loading_popup import LoadingPopup
-from .update_dialog import UpdateDialog
\ No newline at end of file
+from .update_dialog import UpdateDialog
+from .virtual_list import VirtualList
@@ -2,10 +2,18 @@
 Playlist panel component for displaying playlist information with selection controls
 """
 
+import time
+import threading
 import customtkinter as ctk
 from customtkinter import CTkImage
 from utils.helpers import safe_filename, format_time, resolution_key
-from utils.network import network_manager
+from utils.thumbnail_loader import ThumbnailLoader
+from core.thumbnail_cache import thumbnail_cache
+from config.settings import (
+    PLAYLIST_ROW_HEIGHT, PLAYLIST_ROW_OVERSCAN, PLAYLIST_RENDER_BUDGET_MS, PLAYLIST_DETAIL_WORKERS,
+    THUMBNAIL_WORKERS, THUMBNAIL_FLUSH_MS
+)
+from .virtual_list import VirtualList
 
 
 def get_theme_colors():
@@ -50,9 +58,31 @@ class PlaylistPanel(ctk.CTkFrame):
         self.grid_forget()
         
         # Selection state
-        self.video_items = []  # List of video item widgets
+        self.video_items = []  # Row data of every playlist entry (widgets only exist for visible rows)
+        self._youtube_handler = None
+        self.render_metrics = {}
+        self._populate_job = None
         self.select_all_var = ctk.BooleanVar()
         
+        # Thumbnails are loaded lazily for rows near the viewport
+        self._thumbnail_loader = ThumbnailLoader(
+            fetch=self._fetch_thumbnail,
+            on_loaded=self._on_thumbnail_loaded,
+            workers=THUMBNAIL_WORKERS
+        )
+        self._thumbnail_generation = 0  # Bumped whenever the items are replaced
+
+        # Sized quality options are loaded for rows while they are visible
+        self._details_loader = ThumbnailLoader(
+            fetch=self._fetch_quality_details,
+            on_loaded=self._on_quality_details_loaded,
+            workers=PLAYLIST_DETAIL_WORKERS,
+            name="quality-details"
+        )
+        self._loaded_thumbnails = []
+        self._thumbnail_lock = threading.Lock()
+        self._thumbnail_flush_scheduled = False
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -135,34 +165,40 @@ class PlaylistPanel(ctk.CTkFrame):
         )
         self.apply_bulk_button.pack(side="right")
         
-        # Scrollable frame for playlist items
-        self.scroll_frame = ctk.CTkScrollableFrame(self, fg_color="transparent")
-        self.scroll_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))  # Increased padding
-    
+
+        # Virtualized list for playlist items (widgets exist only for visible rows)
+        self.item_list = VirtualList(
+            self,
+            row_height=PLAYLIST_ROW_HEIGHT,
+            overscan=PLAYLIST_ROW_OVERSCAN,
+            create_row=self._create_row,
+            bind_row=self._bind_row,
+            unbind_row=self._unbind_row,
+            on_layout=self._on_rows_laid_out
+        )
+        self.item_list.pack(fill="both", expand=True, padx=20, pady=(0, 20))  # Increased padding
+
     def show_playlist(self, playlist, youtube_handler, progress_callback=None):
         """
         Show playlist with all its videos and quality options
-        
+
         Args:
             playlist: YouTube Playlist object
             youtube_handler: YouTubeHandler instance for getting quality options
             progress_callback: Function to call with progress updates (current, total, status, title)
         """
         # Note: Grid positioning is now handled by the main window layout methods
-        
+
         # Update header
         self.header_label.configure(text=f"Playlist: {playlist.title}")
-        
+
         # Clear previous items
         self.clear_items()
-        
-        # Add playlist items
-        session = network_manager.get_session()
-        headers = network_manager.get_headers()
-        
+        self._youtube_handler = youtube_handler
+
         # Collect all unique quality options for bulk selector
         all_quality_options = set()
-        
+
         # Add progress tracking - use video_urls instead of videos to avoid errors
         try:
             video_urls = list(playlist.video_urls)
@@ -171,556 +207,627 @@ class PlaylistPanel(ctk.CTkFrame):
             print(f"Error getting playlist URLs: {e}")
             total_videos = 0
             video_urls = []
-        
+
         print(f"📋 Processing {total_videos} videos in playlist...")
-        
+
         # Report total to progress callback
         if progress_callback:
             progress_callback(0, total_videos, "Initializing playlist...", "")
-        
+
         successful_items = 0
-        
+
         for i, video_url in enumerate(video_urls):
             try:
-                # Check for cancellation via progress callback
                 if progress_callback:
-                    # Get video title first for progress display
-                    try:
-                        temp_video = youtube_handler.safe_load_video_from_url(video_url)
-                        if temp_video:
-                            video_title = temp_video.title
-                        else:
-                            video_title = f"Video {i+1}"
-                    except:
-                        video_title = f"Video {i+1}"
-                    
-                    # Update progress
-                    progress_callback(i, total_videos, "Loading video info...", video_title)
-                
+                    progress_callback(i, total_videos, "Loading video info...", f"Video {i+1}")
+
                 print(f"📝 Loading video {i+1}/{total_videos}...")
-                
-                # Safely load video using the new method
+
+                # Resolve once - the same video feeds the progress display and the item
                 video = youtube_handler.safe_load_video_from_url(video_url)
-                
+
                 if video is None:
                     raise Exception("Video is not accessible")
-                
+
                 # Get video info safely
                 video_info = youtube_handler.get_video_info(video)
                 print(f"📝 Processing: {video_info['title'][:50]}...")
-                
+
                 # Update progress with current video
                 if progress_callback:
                     progress_callback(i+1, total_videos, "Processing video...", video_info['title'])
-                
-                # Get detailed quality options for individual video (with sizes and types)
-                quality_options = youtube_handler.get_quality_options(video)
+
+                # Resolution list only - sizes are fetched when the quality dropdown is opened
+                quality_options = youtube_handler.get_quality_options_fast(video)
                 all_quality_options.update(quality_options)
-                self._add_playlist_item(video, i, session, headers, quality_options)
+                self._add_playlist_item(video, i, quality_options)
                 successful_items += 1
                 print(f"✅ Added video {i+1}")
-                
+
             except Exception as e:
                 print(f"❌ Error with video {i+1}: {str(e)[:100]}...")
                 # Add error placeholder item
                 self._add_error_playlist_item(i, str(e))
                 continue
-        
+
         print(f"🎯 Successfully processed {successful_items}/{total_videos} videos")
-        
+
         # Final progress update
         if progress_callback:
             progress_callback(total_videos, total_videos, "Completed!", f"Loaded {successful_items}/{total_videos} videos")
-        
+
         self._update_selection_count()
 
-    def populate_items(self, items_data, progress_callback=None, on_complete=None):
-        """Populate playlist UI from preloaded item data without blocking."""
+    def populate_items(self, items_data, progress_callback=None, on_complete=None, youtube_handler=None):
+        """Populate playlist UI from preloaded item data without blocking.
+
+        With a youtube_handler, each item loads sized quality options when its dropdown is first opened.
+        """
         self.clear_items()
+        self._youtube_handler = youtube_handler
         self._pending_items = items_data or []
         self._populate_index = 0
         self._populate_total = len(self._pending_items)
         self._populate_progress_callback = progress_callback
         self._populate_on_complete = on_complete
+        self._populate_started = time.perf_counter()
+        self.render_metrics = {
+            'items': self._populate_total,
+            'ticks': 0,
+            'first_visible_ms': None,
+            'total_ms': None
+        }
 
-        self._populate_next_item()
+        self._populate_next_batch()
 
-    def _populate_next_item(self):
-        if self._populate_index >= self._populate_total:
-            if self._populate_on_complete:
-                self._populate_on_complete()
-            self._update_selection_count()
-            return
+    def _populate_next_batch(self):
+        """Add as many items as fit in the frame budget, then yield to the event loop"""
+        self._populate_job = None
+        tick_started = time.perf_counter()
+        budget = PLAYLIST_RENDER_BUDGET_MS / 1000
+        first_idx = self._populate_index
+
+        while self._populate_index < self._populate_total:
+            self._add_playlist_item_data(self._pending_items[self._populate_index], update_list=False)
+            self._populate_index += 1
+            if time.perf_counter() - tick_started >= budget:
+                break
 
-        item = self._pending_items[self._populate_index]
-        idx = self._populate_index
+        if self._populate_index > first_idx:
+            # One layout pass per tick binds whichever rows are visible
+            self.item_list.set_count(len(self.video_items))
 
-        if self._populate_progress_callback:
+        elapsed_ms = (time.perf_counter() - self._populate_started) * 1000
+        self.render_metrics['ticks'] += 1
+        if self.render_metrics['first_visible_ms'] is None and self.item_list.bound_rows():
+            self.render_metrics['first_visible_ms'] = round(elapsed_ms, 1)
+
+        # Coalesced progress - one update per tick
+        if self._populate_progress_callback and self._populate_index > first_idx:
+            idx = self._populate_index - 1
             self._populate_progress_callback(
                 idx + 1,
                 self._populate_total,
                 "Rendering items...",
-                item.get("title", f"Video {idx+1}")
+                self._pending_items[idx].get("title", f"Video {idx+1}")
             )
 
-        self._add_playlist_item_data(item)
-        self._populate_index += 1
+        if self._populate_index >= self._populate_total:
+            self.render_metrics['total_ms'] = round(elapsed_ms, 1)
+            print(f"⏱️ Rendered {self._populate_total} items in {elapsed_ms:.0f} ms "
+                  f"({self.render_metrics['ticks']} ticks, first visible after "
+                  f"{self.render_metrics['first_visible_ms']} ms)")
+            if self._populate_on_complete:
+                self._populate_on_complete()
+            self._update_selection_count()
+            return
+
+        self._populate_job = self.after(1, self._populate_next_batch)
 
-        self.after(1, self._populate_next_item)
+    def get_render_metrics(self):
+        """
+        Get timings of the last populate_items run
 
-    def _add_playlist_item_data(self, item):
+        Returns:
+            dict: items, ticks, first_visible_ms and total_ms (None until known)
+        """
+        return dict(self.render_metrics)
+
+    def _add_playlist_item_data(self, item, update_list=True):
         """Add a single playlist item from preloaded data."""
-        video = item.get("video")
-        index = item.get("index", 0)
-        title = item.get("title", "")
-        length = item.get("length", 0)
-        views = item.get("views", None)
-        thumb_img = item.get("thumbnail")
         quality_options = item.get("quality_options", [])
+        self._append_item({
+            'video': item.get("video"),
+            'index': item.get("index", 0),
+            'title': item.get("title", ""),
+            'length': item.get("length", 0),
+            'views': item.get("views", None),
+            'thumbnail': item.get("thumbnail"),
+            'thumbnail_url': item.get("thumbnail_url"),
+            'quality_options': quality_options,
+            'quality': quality_options[0] if quality_options else ""
+        }, update_list)
+
+    def _add_playlist_item(self, video, index, quality_options):
+        """
+        Add a single playlist item with selection and quality controls
+
+        Args:
+            video: YouTube video object
+            index (int): Video index in playlist
+            quality_options (list): Available quality options for this video
+        """
+        # Set default to best 720p adaptive option (highest quality)
+        quality = ""
+        if quality_options:
+            # Look for 720p adaptive options first
+            best_720p = None
+            for option in quality_options:
+                if '720p' in option and 'Adaptive' in option:
+                    best_720p = option
+                    break
+
+            if best_720p:
+                quality = best_720p
+            else:
+                # Fallback to first adaptive option available, else first available
+                quality = next((option for option in quality_options if 'Adaptive' in option), quality_options[0])
+
+        self._append_item({
+            'video': video,
+            'index': index,
+            'title': video.title,
+            'length': video.length,
+            'views': getattr(video, 'views', None),
+            'thumbnail': None,  # Loaded into the thumbnail cache when the row comes near the viewport
+            'thumbnail_url': video.thumbnail_url,
+            'quality_options': quality_options,
+            'quality': quality
+        })
+
+    def _add_error_playlist_item(self, index, error_message):
+        """Add a placeholder item for videos that couldn't be processed"""
+        self._append_item({
+            'video': None,
+            'index': index,
+            'error': True,
+            'error_message': error_message
+        })
+
+    def _append_item(self, item, update_list=True):
+        """
+        Add row data to the list
+
+        Args:
+            item (dict): Row data (video, index, title, quality options, ...)
+            update_list (bool): Refresh the list view now (batch callers refresh once at the end)
+        """
+        item.setdefault('error', False)
+        item['thumbnail_failed'] = False
+        item['selected'] = False
+        item['status'] = None  # "DOWN" / "DONE" while a batch runs
+        item['details_requested'] = False
+        item['position'] = len(self.video_items)
+        self.video_items.append(item)
+        if update_list:
+            self.item_list.set_count(len(self.video_items))
+
+    def _create_row(self, parent):
+        """
+        Create one reusable row widget (bound to data by _bind_row)
+
+        Args:
+            parent: Viewport frame of the item list
+
+        Returns:
+            CTkFrame: Row frame with its child widgets as attributes
+        """
+        colors = get_theme_colors()
 
         # Main item container
-        item_frame = ctk.CTkFrame(
-            self.scroll_frame, 
-            fg_color=get_theme_colors()['item_bg'],
+        row = ctk.CTkFrame(
+            parent,
+            fg_color=colors['item_bg'],  # Theme-aware background
             corner_radius=0,
             border_width=0,
             height=120
         )
-        item_frame.pack(fill="x", pady=(0, 15))
-        item_frame.pack_propagate(False)
+        row.pack_propagate(False)  # Maintain fixed height
+        row.position = None
 
-        top_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        top_frame.pack(fill="x", padx=2, pady=(8, 5))
+        # Normal content
+        row.content_frame = ctk.CTkFrame(row, fg_color="transparent")
 
-        select_var = ctk.BooleanVar()
-        select_checkbox = ctk.CTkCheckBox(
+        # Top row: Checkbox, thumbnail, and video info
+        top_frame = ctk.CTkFrame(row.content_frame, fg_color="transparent")
+        top_frame.pack(fill="x", padx=2, pady=(8, 5))  # Reduced left padding
+
+        # Selection checkbox
+        row.select_var = ctk.BooleanVar()
+        row.checkbox = ctk.CTkCheckBox(
             top_frame,
             text="",
-            variable=select_var,
+            variable=row.select_var,
             width=20,
-            command=self._on_item_selection_change,
+            command=lambda: self._on_row_toggled(row),
             corner_radius=4,
             border_width=2
         )
-        select_checkbox.pack(side="left", padx=(0, 6))
-
-        # Thumbnail
-        if thumb_img:
-            thumb_ctk = CTkImage(
-                light_image=thumb_img,
-                dark_image=thumb_img,
-                size=(80, 60)
-            )
-            thumb_label = ctk.CTkLabel(top_frame, image=thumb_ctk, text="", width=80, height=60)
-            thumb_label.image = thumb_ctk
-            thumb_label.pack(side="left", padx=(0, 8))
-        else:
-            thumb_placeholder = ctk.CTkLabel(
-                top_frame,
-                text="VIDEO",
-                width=80,
-                height=60,
-                font=("Arial", 10),
-                fg_color=get_theme_colors()['secondary_bg'],
-                text_color=get_theme_colors()['text_primary']
-            )
-            thumb_placeholder.pack(side="left", padx=(0, 8))
+        row.checkbox.pack(side="left", padx=(0, 6))
+
+        # Thumbnail, or placeholder text when the item has none
+        row.thumb_label = ctk.CTkLabel(
+            top_frame,
+            text="VIDEO",
+            width=80,
+            height=60,
+            font=("Arial", 10),
+            fg_color=colors['secondary_bg'],
+            text_color=colors['text_primary']
+        )
+        row.thumb_label.pack(side="left", padx=(0, 8))
 
+        # Video information container with fixed height to prevent overlap
         info_frame = ctk.CTkFrame(top_frame, fg_color="transparent", height=50)
         info_frame.pack(side="left", fill="x", expand=True)
-        info_frame.pack_propagate(False)
-
-        title_text = f"{index + 1}. {safe_filename(title)}"
-        if len(title_text) > 60:
-            title_text = title_text[:57] + "..."
+        info_frame.pack_propagate(False)  # Prevent frame from shrinking
 
-        title_label = ctk.CTkLabel(
+        row.title_label = ctk.CTkLabel(
             info_frame,
-            text=title_text,
+            text="",
             font=("Arial", 12, "bold"),
             anchor="w",
             justify="left",
-            height=25
+            height=25  # Fixed height
         )
-        title_label.pack(anchor="w", fill="x", pady=(2, 0))
-
-        duration_str = format_time(length)
-        info_text = f"Duration: {duration_str}"
-        if views:
-            info_text += f" • Views: {views:,}"
+        row.title_label.pack(anchor="w", fill="x", pady=(2, 0))
 
-        duration_label = ctk.CTkLabel(
+        row.info_label = ctk.CTkLabel(
             info_frame,
-            text=info_text,
+            text="",
             font=("Arial", 10),
-            text_color=get_theme_colors()['text_secondary'],
+            text_color=colors['text_secondary'],
             anchor="w",
-            height=20
+            height=20  # Fixed height
         )
-        duration_label.pack(anchor="w", pady=(0, 3))
+        row.info_label.pack(anchor="w", pady=(0, 3))
 
-        bottom_frame = ctk.CTkFrame(item_frame, fg_color="transparent", height=40)
+        # Bottom row: Quality selector with proper spacing
+        bottom_frame = ctk.CTkFrame(row.content_frame, fg_color="transparent", height=40)
         bottom_frame.pack(fill="x", padx=2, pady=(8, 8))
-        bottom_frame.pack_propagate(False)
+        bottom_frame.pack_propagate(False)  # Prevent frame from shrinking
 
         quality_label = ctk.CTkLabel(
             bottom_frame,
             text="Quality:",
             font=("Arial", 11, "bold"),
-            text_color=get_theme_colors()['text_accent']
+            text_color=colors['text_accent']
         )
-        quality_label.pack(side="left", padx=(88, 10))
+        quality_label.pack(side="left", padx=(88, 10))  # Align with video title
 
-        quality_combo = ctk.CTkComboBox(
+        row.quality_combo = ctk.CTkComboBox(
             bottom_frame,
-            values=quality_options,
+            values=[],
             height=32,
             width=250,
             font=("Arial", 11),
-            dropdown_hover_color=get_theme_colors()['dropdown_hover'],
-            button_hover_color=get_theme_colors()['button_hover'],
+            dropdown_hover_color=colors['dropdown_hover'],
+            button_hover_color=colors['button_hover'],
+            command=lambda value: self._on_row_quality_change(row, value),
             corner_radius=8,
             border_width=0
         )
-        quality_combo.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        row.quality_combo.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        row.quality_values = None
 
-        if quality_options:
-            quality_combo.set(quality_options[0])
-
-        self.video_items.append({
-            'frame': item_frame,
-            'video': video,
-            'index': index,
-            'selected': select_var,
-            'quality_combo': quality_combo,
-            'checkbox': select_checkbox
-        })
-    
-    def _add_playlist_item(self, video, index, session, headers, quality_options):
-        """
-        Add a single playlist item with selection and quality controls
-        
-        Args:
-            video: YouTube video object
-            index (int): Video index in playlist
-            session: HTTP session for thumbnail download
-            headers (dict): HTTP headers
-            quality_options (list): Available quality options for this video
-        """
-        # Main item container (increased height for better readability and dropdown space)
-        item_frame = ctk.CTkFrame(
-            self.scroll_frame, 
-            fg_color=get_theme_colors()['item_bg'],  # Theme-aware background
-            corner_radius=0,
-            border_width=0,
-            height=120  # Increased from 110 to 120 for more space
+        # Error content
+        row.error_frame = ctk.CTkFrame(row, fg_color="transparent")
+        row.error_label = ctk.CTkLabel(
+            row.error_frame,
+            text="",
+            font=("Arial", 14, "bold")
         )
-        item_frame.pack(fill="x", pady=(0, 15))  # Increased padding between items for dropdown space
-        item_frame.pack_propagate(False)  # Maintain fixed height
-        
-        # Top row: Checkbox, thumbnail, and video info
-        top_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        top_frame.pack(fill="x", padx=2, pady=(8, 5))  # Reduced left padding
-        
-        # Selection checkbox
-        select_var = ctk.BooleanVar()
-        select_checkbox = ctk.CTkCheckBox(
-            top_frame,
+        row.error_label.pack(anchor="w")
+        row.details_label = ctk.CTkLabel(
+            row.error_frame,
             text="",
-            variable=select_var,
-            width=20,
-            command=self._on_item_selection_change,
-            corner_radius=4,
-            border_width=2
+            font=("Arial", 10),
+            text_color=colors['text_secondary']
         )
-        select_checkbox.pack(side="left", padx=(0, 6))
-        
-        # Thumbnail (larger size)
-        try:
-            thumb_response = session.get(
-                video.thumbnail_url, 
-                headers=headers, 
-                timeout=10, 
-                verify=False
-            )
-            from io import BytesIO
-            from PIL import Image
-            
-            thumb_data = BytesIO(thumb_response.content)
-            thumb_img = Image.open(thumb_data)
-            thumb_img = thumb_img.resize((80, 60), Image.LANCZOS)
-            thumb_ctk = CTkImage(
-                light_image=thumb_img, 
-                dark_image=thumb_img, 
-                size=(80, 60)
-            )
-            
-            thumb_label = ctk.CTkLabel(
-                top_frame, 
-                image=thumb_ctk, 
-                text="", 
-                width=80, 
-                height=60
-            )
-            thumb_label.image = thumb_ctk  # Keep reference
-            thumb_label.pack(side="left", padx=(0, 8))
-            
-        except Exception:
-            # Fallback to placeholder if thumbnail fails
-            thumb_placeholder = ctk.CTkLabel(
-                top_frame, 
-                text="VIDEO", 
-                width=80,
-                height=60,
-                font=("Arial", 10),  # Larger font
-                fg_color=get_theme_colors()['secondary_bg'],  # Theme-aware background
-                text_color=get_theme_colors()['text_primary']  # Theme-aware text
-            )
-            thumb_placeholder.pack(side="left", padx=(0, 8))
-        
-        # Video information container with fixed height to prevent overlap
-        info_frame = ctk.CTkFrame(top_frame, fg_color="transparent", height=50)
-        info_frame.pack(side="left", fill="x", expand=True)
-        info_frame.pack_propagate(False)  # Prevent frame from shrinking
-        
-        # Title (controlled height to prevent overlap)
-        title_text = f"{index + 1}. {safe_filename(video.title)}"
+        row.details_label.pack(anchor="w", pady=(5, 0))
+
+        return row
+
+    def _bind_row(self, row, position):
+        """Show the item at position in a pooled row widget"""
+        item = self.video_items[position]
+        row.position = position
+
+        if item['error']:
+            self._bind_error_row(row, item)
+            return
+
+        row.error_frame.pack_forget()
+        row.content_frame.pack(fill="both", expand=True)
+        row.configure(fg_color=get_theme_colors()['item_bg'])
+
+        row.select_var.set(item['selected'])
+        if item['status']:
+            row.checkbox.configure(text=item['status'], text_color="#4CAF50", font=("Arial", 8))
+        else:
+            row.checkbox.configure(text="")
+
+        thumb_img = self._row_thumbnail(item)
+        if thumb_img is not None:
+            thumb_ctk = CTkImage(light_image=thumb_img, dark_image=thumb_img, size=(80, 60))
+            row.thumb_label.configure(image=thumb_ctk, text="", fg_color="transparent")
+        else:
+            row.thumb_label.configure(image="", text="VIDEO", fg_color=get_theme_colors()['secondary_bg'])
+
+        title_text = f"{item['index'] + 1}. {safe_filename(item['title'])}"
         # Truncate long titles to prevent layout issues
         if len(title_text) > 60:
             title_text = title_text[:57] + "..."
-            
-        title_label = ctk.CTkLabel(
-            info_frame, 
-            text=title_text, 
-            font=("Arial", 12, "bold"),  # Larger and bold font
-            anchor="w", 
-            justify="left",
-            height=25  # Fixed height
-        )
-        title_label.pack(anchor="w", fill="x", pady=(2, 0))
-        
-        # Duration and more info
-        duration_str = format_time(video.length)
-        info_text = f"Duration: {duration_str}"
-        if hasattr(video, 'views') and video.views:
-            info_text += f" • Views: {video.views:,}"
-            
-        duration_label = ctk.CTkLabel(
-            info_frame, 
-            text=info_text, 
-            font=("Arial", 10), 
-            text_color=get_theme_colors()['text_secondary'],  # Theme-aware secondary text
-            anchor="w",
-            height=20  # Fixed height
-        )
-        duration_label.pack(anchor="w", pady=(0, 3))
-        
-        # Bottom row: Quality selector with proper spacing
-        bottom_frame = ctk.CTkFrame(item_frame, fg_color="transparent", height=40)
-        bottom_frame.pack(fill="x", padx=2, pady=(8, 8))
-        bottom_frame.pack_propagate(False)  # Prevent frame from shrinking
-        
-        # Quality label and selector
-        quality_label = ctk.CTkLabel(
-            bottom_frame,
-            text="Quality:",
-            font=("Arial", 11, "bold"),  # Larger and bold
-            text_color=get_theme_colors()['text_accent']  # Theme-aware accent text
-        )
-        quality_label.pack(side="left", padx=(88, 10))  # Align with video title
-        
-        # Quality combo box (improved positioning)
-        quality_combo = ctk.CTkComboBox(
-            bottom_frame,
-            values=quality_options,
-            height=32,     # Increased from 25 to 32
-            width=250,     # Increased from 150 to 250
-            font=("Arial", 11),  # Larger font
-            dropdown_hover_color=get_theme_colors()['dropdown_hover'],  # Theme-aware hover
-            button_hover_color=get_theme_colors()['button_hover'],       # Better visibility
-            corner_radius=8,
-            border_width=0
+        row.title_label.configure(text=title_text)
+
+        info_text = f"Duration: {format_time(item['length'])}"
+        if item['views']:
+            info_text += f" • Views: {item['views']:,}"
+        row.info_label.configure(text=info_text)
+
+        # Rebuilding the dropdown menu is the expensive part of a rebind
+        if row.quality_values is not item['quality_options']:
+            row.quality_combo.configure(values=item['quality_options'])
+            row.quality_values = item['quality_options']
+        row.quality_combo.set(item['quality'])
+
+    def _bind_error_row(self, row, item):
+        """Show an error placeholder in a pooled row widget"""
+        row.content_frame.pack_forget()
+        row.error_frame.pack(fill="both", expand=True, padx=8, pady=8)
+
+        dark = ctk.get_appearance_mode() == "Dark"
+        row.configure(fg_color="#4A1F1F" if dark else "#FFE6E6")  # Theme-aware error background
+        row.error_label.configure(
+            text=f"❌ Video {item['index']+1}: Access Restricted",
+            text_color="#FF6B6B" if dark else "#CC0000"  # Theme-aware error text
         )
-        quality_combo.pack(side="left", fill="x", expand=True, padx=(0, 10))
-        
-        # Set default to best 720p adaptive option (highest quality)
-        if quality_options:
-            # Look for 720p adaptive options first
-            best_720p = None
-            for option in quality_options:
-                if '720p' in option and 'Adaptive' in option:
-                    best_720p = option
-                    break
-            
-            if best_720p:
-                quality_combo.set(best_720p)
-            else:
-                # Fallback to first adaptive option available
-                for option in quality_options:
-                    if 'Adaptive' in option:
-                        quality_combo.set(option)
-                        break
-                else:
-                    # If no adaptive found, use first available
-                    quality_combo.set(quality_options[0])
-        
-        # Store item data
-        item_data = {
-            'frame': item_frame,
-            'video': video,
-            'index': index,
-            'selected': select_var,
-            'quality_combo': quality_combo,
-            'checkbox': select_checkbox
-        }
-        
-        self.video_items.append(item_data)
-    
+
+        error_message = item['error_message']
+        short_error = error_message[:60] + "..." if len(error_message) > 60 else error_message
+        row.details_label.configure(text=f"Reason: {short_error}")
+
+    def _unbind_row(self, row, position):
+        """Keep a typed quality before the row widget is reused"""
+        if position < len(self.video_items) and not self.video_items[position]['error']:
+            self.video_items[position]['quality'] = row.quality_combo.get()
+        row.position = None
+
+    def _store_visible_quality(self):
+        """Copy the quality text of visible rows back into their items"""
+        for position, row in self.item_list.bound_rows():
+            if not self.video_items[position]['error']:
+                self.video_items[position]['quality'] = row.quality_combo.get()
+
+    def _on_row_toggled(self, row):
+        """Handle a row checkbox click"""
+        if row.position is not None:
+            self.video_items[row.position]['selected'] = row.select_var.get()
+        self._on_item_selection_change()
+
+    def _on_row_quality_change(self, row, value):
+        """Handle a quality picked from a row dropdown"""
+        if row.position is not None:
+            self.video_items[row.position]['quality'] = value
+
+    def _on_rows_laid_out(self):
+        """Queue the lazy per-row work for the rows now on screen"""
+        self._request_visible_thumbnails()
+        self._request_visible_details()
+
+    def _request_visible_details(self):
+        """Queue sized quality options for the visible rows that have none yet (scrolled-away rows drop out)"""
+        if not self._youtube_handler:
+            return
+        first, last = self.item_list.visible_range()
+        wanted = {}
+        for position in range(first, min(last + 1, len(self.video_items))):
+            item = self.video_items[position]
+            if item['error'] or item['details_requested'] or not item['video']:
+                continue
+            wanted[(self._thumbnail_generation, position)] = (item, position - first)
+        self._details_loader.set_wanted(wanted)
+
+    def _fetch_quality_details(self, item):
+        """Worker thread - fetch the sized quality options of one item (once per item)"""
+        youtube_handler = self._youtube_handler
+        if not youtube_handler or item['details_requested']:
+            return None
+        item['details_requested'] = True
+        try:
+            return youtube_handler.get_quality_options(item['video'])
+        except Exception as e:
+            print(f"Error loading quality details: {e}")
+            return None
+
+    def _on_quality_details_loaded(self, key, options):
+        """Worker thread - hand finished options to the UI thread"""
+        if options:
+            self.after(0, lambda: self._apply_loaded_quality_details(key, options))
+
+    def _apply_loaded_quality_details(self, key, options):
+        generation, position = key
+        if generation != self._thumbnail_generation or position >= len(self.video_items):
+            return  # Items were replaced meanwhile
+        self._apply_quality_details(self.video_items[position], options)
+
+    def _apply_quality_details(self, item, options):
+        """Swap in detailed options, keeping the chosen resolution selected"""
+        position = item['position']
+        if position >= len(self.video_items) or self.video_items[position] is not item:
+            return  # Playlist was replaced meanwhile
+        row = dict(self.item_list.bound_rows()).get(position)
+        current = row.quality_combo.get() if row else item['quality']
+        resolution = current.split(' ')[0] if current else ''
+        match = next((option for option in options if option.split(' ')[0] == resolution and 'Adaptive' in option), None)
+        item['quality_options'] = options
+        item['quality'] = match or current or options[0]
+        self.item_list.refresh_index(position)
+
+    @staticmethod
+    def _row_thumbnail(item):
+        """Get the thumbnail of an item if it is in memory (preloaded or in the thumbnail cache)"""
+        if item['thumbnail'] is not None:
+            return item['thumbnail']
+        if item.get('thumbnail_url'):
+            return thumbnail_cache.peek(item['thumbnail_url'], (80, 60))
+        return None
+
+    def _request_visible_thumbnails(self):
+        """Queue thumbnails for the bound rows - visible rows first, then by distance to the viewport"""
+        if not self._youtube_handler:
+            return
+        first, last = self.item_list.visible_range()
+        wanted = {}
+        for position, _ in self.item_list.bound_rows():
+            item = self.video_items[position]
+            if item['error'] or item['thumbnail_failed'] or not item.get('thumbnail_url'):
+                continue
+            if self._row_thumbnail(item) is not None:
+                continue
+            distance = first - position if position < first else max(0, position - last)
+            wanted[(self._thumbnail_generation, position)] = (item['thumbnail_url'], distance)
+        self._thumbnail_loader.set_wanted(wanted)
+
+    def _fetch_thumbnail(self, url):
+        """Worker thread - download and decode one row thumbnail"""
+        youtube_handler = self._youtube_handler
+        if not youtube_handler:
+            return None
+        return youtube_handler.get_thumbnail_image(url, size=(80, 60))
+
+    def _on_thumbnail_loaded(self, key, image):
+        """Worker thread - collect a finished thumbnail for the next UI flush"""
+        with self._thumbnail_lock:
+            self._loaded_thumbnails.append((key, image))
+            if self._thumbnail_flush_scheduled:
+                return
+            self._thumbnail_flush_scheduled = True
+        self.after(THUMBNAIL_FLUSH_MS, self._flush_thumbnails)
+
+    def _flush_thumbnails(self):
+        """Show all thumbnails that finished since the last flush"""
+        with self._thumbnail_lock:
+            loaded, self._loaded_thumbnails = self._loaded_thumbnails, []
+            self._thumbnail_flush_scheduled = False
+        for (generation, position), image in loaded:
+            if generation != self._thumbnail_generation or position >= len(self.video_items):
+                continue  # Items were replaced meanwhile
+            # Images stay in the bounded thumbnail cache, items only remember failures
+            self.video_items[position]['thumbnail_failed'] = image is None
+            self.item_list.refresh_index(position)
+
     def clear_items(self):
         """Clear all playlist items"""
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
+        if self._populate_job:
+            # Stop a populate run that is still in progress
+            self.after_cancel(self._populate_job)
+            self._populate_job = None
+        self._thumbnail_generation += 1
+        self._thumbnail_loader.cancel_all()
+        self._details_loader.cancel_all()
         self.video_items = []
+        self.item_list.set_count(0)
         self.select_all_var.set(False)
         self._update_selection_count()
-    
+
     def hide_playlist(self):
         """Hide the playlist panel"""
         self.grid_forget()  # Use grid_forget instead of pack_forget
         self.clear_items()
         self.header_label.configure(text="Playlist")
-    
+
     def _on_select_all(self):
         """Handle Select All checkbox"""
         select_all = self.select_all_var.get()
         for item in self.video_items:
-            item['selected'].set(select_all)
+            if not item['error']:
+                item['selected'] = select_all
+        self.item_list.refresh()
         self._update_selection_count()
-    
+
     def _on_item_selection_change(self):
         """Handle individual item selection change"""
-        selected_count = sum(1 for item in self.video_items if item['selected'].get())
+        selected_count = sum(1 for item in self.video_items if item['selected'])
         total_count = len(self.video_items)
-        
+
         # Update Select All checkbox state
         if selected_count == 0:
             self.select_all_var.set(False)
         elif selected_count == total_count:
             self.select_all_var.set(True)
-        
+
         self._update_selection_count()
-    
+
     def _update_selection_count(self):
         """Update the selection count display"""
-        selected_count = sum(1 for item in self.video_items if item['selected'].get())
+        selected_count = sum(1 for item in self.video_items if item['selected'])
         total_count = len(self.video_items)
         self.count_label.configure(text=f"{selected_count}/{total_count} selected")
-    
+
     def get_selected_videos(self):
         """
         Get list of selected videos with their quality settings
-        
+
         Returns:
             list: List of dictionaries containing video, quality, and index
         """
+        self._store_visible_quality()
         selected = []
         for item in self.video_items:
-            # Skip error items (they don't have selectable checkboxes)
-            if item.get('error', False):
+            # Skip error items (they can't be selected)
+            if item['error']:
                 continue
-                
-            if item['selected'].get():
+
+            if item['selected']:
                 selected.append({
                     'video': item['video'],
-                    'quality': item['quality_combo'].get(),
+                    'quality': item['quality'],
                     'index': item['index'],
                     'title': item['video'].title
                 })
         return selected
-    
+
     def has_selected_videos(self):
         """
         Check if any videos are selected
-        
+
         Returns:
             bool: True if at least one video is selected
         """
-        return any(item['selected'].get() for item in self.video_items if not item.get('error', False))
-    
+        return any(item['selected'] for item in self.video_items if not item['error'])
+
     def set_downloading_state(self, video_index, is_downloading=True):
         """
         Update UI to show which video is currently downloading
-        
+
         Args:
             video_index (int): Index of video being downloaded
             is_downloading (bool): Whether download is in progress
         """
         for item in self.video_items:
-            if item['index'] == video_index:
-                checkbox = item['checkbox']
-                if is_downloading:
-                    checkbox.configure(text="DOWN", text_color="#4CAF50", font=("Arial", 8))  # Downloading indicator
-                else:
-                    checkbox.configure(text="DONE", text_color="#4CAF50", font=("Arial", 8))   # Completed indicator
+            if item['index'] == video_index and not item['error']:
+                item['status'] = "DOWN" if is_downloading else "DONE"  # Downloading / completed indicator
+                self.item_list.refresh_index(item['position'])
                 break
-    
-    def _add_error_playlist_item(self, index, error_message):
-        """Add a placeholder item for videos that couldn't be processed"""
-        colors = get_theme_colors()
-        
-        # Main item container with error styling
-        error_bg = "#4A1F1F" if ctk.get_appearance_mode() == "Dark" else "#FFE6E6"  # Theme-aware error background
-        item_frame = ctk.CTkFrame(
-            self.scroll_frame, 
-            fg_color=error_bg,  # Theme-aware error background
-            corner_radius=5, 
-            height=80
-        )
-        item_frame.pack(fill="x", pady=(0, 10))
-        item_frame.pack_propagate(False)
-        
-        # Error content
-        error_frame = ctk.CTkFrame(item_frame, fg_color="transparent")
-        error_frame.pack(fill="both", expand=True, padx=8, pady=8)
-        
-        # Error icon and message
-        error_text_color = "#FF6B6B" if ctk.get_appearance_mode() == "Dark" else "#CC0000"  # Theme-aware error text
-        error_label = ctk.CTkLabel(
-            error_frame,
-            text=f"❌ Video {index+1}: Access Restricted",
-            font=("Arial", 14, "bold"),
-            text_color=error_text_color  # Theme-aware error text color
-        )
-        error_label.pack(anchor="w")
-        
-        # Error details
-        short_error = error_message[:60] + "..." if len(error_message) > 60 else error_message
-        details_label = ctk.CTkLabel(
-            error_frame,
-            text=f"Reason: {short_error}",
-            font=("Arial", 10),
-            text_color=get_theme_colors()['text_secondary']  # Theme-aware secondary text
-        )
-        details_label.pack(anchor="w", pady=(5, 0))
-        
-        # Add to items list but mark as error
-        self.video_items.append({
-            'frame': item_frame,
-            'checkbox': None,
-            'select_var': None,
-            'quality_combo': None,
-            'video': None,
-            'index': index,
-            'error': True
-        })
-                
+
     def _quality_sort_key(self, quality_string):
         """
         Generate sort key for quality options
-        
+
         Args:
             quality_string (str): Quality option string
-            
+
         Returns:
             tuple: Sort key (resolution_num, is_adaptive)
         """
@@ -733,28 +840,29 @@ class PlaylistPanel(ctk.CTkFrame):
                 return (0, False)
         except:
             return (0, False)
-    
+
     def _on_bulk_quality_change(self, selected_quality):
         """Handle bulk quality selector change and apply to all videos immediately"""
         if selected_quality == "Select Quality":
             return
-        
+
+        from core.youtube_handler import YouTubeHandler
+        youtube_handler = self._youtube_handler or YouTubeHandler()
+
         # Apply to ALL videos (not just selected ones)
         applied_count = 0
         for item in self.video_items:
-            if not item.get('error', False) and item['quality_combo']:
+            if not item['error']:
                 try:
                     # Convert simplified quality to best matching detailed quality for this video
                     video = item['video']
                     if video:
-                        from core.youtube_handler import YouTubeHandler
-                        youtube_handler = YouTubeHandler()
                         detailed_quality = youtube_handler.convert_simplified_to_detailed_quality(video, selected_quality)
-                        
+
                         # Check if this detailed quality is available in the dropdown
-                        available_qualities = item['quality_combo'].cget("values")
+                        available_qualities = item['quality_options']
                         if detailed_quality in available_qualities:
-                            item['quality_combo'].set(detailed_quality)
+                            item['quality'] = detailed_quality
                             applied_count += 1
                         else:
                             # Find the closest match by resolution
@@ -764,82 +872,81 @@ class PlaylistPanel(ctk.CTkFrame):
                                 if target_res.replace('p', '') in qual:
                                     best_match = qual
                                     break
-                            
+
                             if best_match:
-                                item['quality_combo'].set(best_match)
+                                item['quality'] = best_match
                                 applied_count += 1
                             else:
                                 # Fallback to first available quality
                                 if available_qualities:
-                                    item['quality_combo'].set(available_qualities[0])
+                                    item['quality'] = available_qualities[0]
                                     applied_count += 1
                 except Exception as e:
                     print(f"Error applying quality to video: {e}")
                     continue
-        
+
+        self.item_list.refresh()
+
         if applied_count > 0:
             print(f"✅ Applied {selected_quality} quality to {applied_count} videos")
-            
+
             # Show temporary feedback
             original_text = self.bulk_quality_combo.cget("values")
             temp_values = [f"✅ Applied to {applied_count} videos"]
             self.bulk_quality_combo.configure(values=temp_values)
             self.bulk_quality_combo.set(temp_values[0])
-            
+
             # Reset after 2 seconds
             def reset_dropdown():
                 quality_options = ['4K', '2K', '1080p', '720p', '480p', '360p', '144p']
                 self.bulk_quality_combo.configure(values=quality_options)
                 self.bulk_quality_combo.set(selected_quality)
-            
+
             self.after(2000, reset_dropdown)
-    
+
     def _apply_bulk_quality(self):
         """Apply the selected bulk quality to all selected videos"""
         bulk_quality = self.bulk_quality_var.get()
-        
+
         if bulk_quality == "Select Quality":
             return
-        
+
         # Apply to all selected videos
         applied_count = 0
         for item in self.video_items:
-            if item['selected'].get():
+            if item['selected']:
                 # Check if this quality is available for this video
-                available_qualities = item['quality_combo'].cget("values")
-                if bulk_quality in available_qualities:
-                    item['quality_combo'].set(bulk_quality)
+                if bulk_quality in item['quality_options']:
+                    item['quality'] = bulk_quality
                     applied_count += 1
-        
+
         if applied_count > 0:
+            self.item_list.refresh()
             # Show feedback
             self.apply_bulk_button.configure(text=f"Applied to {applied_count}")
             self.after(2000, lambda: self.apply_bulk_button.configure(text="Apply to Selected"))
-    
+
     def refresh_theme(self):
         """Refresh colors when theme changes"""
         colors = get_theme_colors()
-        
+
         # Update main frame background
         self.configure(fg_color=colors['frame_bg'])
-        
+
         # Update header text color
         if hasattr(self, 'header_label'):
             self.header_label.configure(text_color=colors['text_primary'])
-        
-        # Update count label text color  
+
+        # Update count label text color
         if hasattr(self, 'count_label'):
             self.count_label.configure(text_color=colors['text_accent'])
-        
-        # Update all video item colors
-        for item in self.video_items:
-            if item.get('error', False):
-                # Error items
-                error_bg = "#4A1F1F" if ctk.get_appearance_mode() == "Dark" else "#FFE6E6"
-                item['frame'].configure(fg_color=error_bg)
-            else:
-                # Normal items
-                item['frame'].configure(fg_color=colors['item_bg'])
-        
+
+        # Update pooled row colors (bound rows pick up item specific colors below)
+        for row in self.item_list.rows():
+            row.configure(fg_color=colors['item_bg'])
+            row.info_label.configure(text_color=colors['text_secondary'])
+            row.details_label.configure(text_color=colors['text_secondary'])
+        self.item_list.refresh()
+
         # Force update
-        self.update_idletasks()
\ No newline at end of file
+        self.update_idletasks()
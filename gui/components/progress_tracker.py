@@ -4,7 +4,7 @@ Progress tracking component for download progress display
 
 import customtkinter as ctk
 from utils.helpers import format_size, format_time
-from config.settings import COLORS
+from config.settings import COLORS, PROGRESS_BAR_STEP
 
 
 class ProgressTracker(ctk.CTkFrame):
@@ -13,6 +13,10 @@ class ProgressTracker(ctk.CTkFrame):
     def __init__(self, parent, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         
+        # Values currently on screen (unchanged values are not redrawn)
+        self._shown_fraction = None
+        self._shown_text = None
+        
         self._setup_ui()
         self.reset()
         
@@ -117,13 +121,17 @@ class ProgressTracker(ctk.CTkFrame):
             speed (float): Download speed in MB/s
             elapsed (int): Elapsed time in seconds
             custom_text (str, optional): Custom text to display instead of default
+            
+        Returns:
+            bool: True if anything on screen changed
         """
-        # Update progress bar
-        self.progress_bar.set(max(0, min(1, percentage / 100)))
+        # Progress bar moves in PROGRESS_BAR_STEP increments
+        fraction = max(0, min(1, percentage / 100))
+        changed = self._set_fraction(round(fraction / PROGRESS_BAR_STEP) * PROGRESS_BAR_STEP)
         
         # Update info text
         if custom_text:
-            self.info_label.configure(text=custom_text)
+            text = custom_text
         elif total > 0:
             eta_seconds = 0
             if speed > 0:
@@ -141,20 +149,37 @@ class ProgressTracker(ctk.CTkFrame):
             # Add batch info if in batch mode
             if self.is_batch_mode and self.batch_info["current"] > 0:
                 batch_prefix = f"[{self.batch_info['current']}/{self.batch_info['total']}] "
-                self.info_label.configure(text=batch_prefix + base_info)
+                text = batch_prefix + base_info
             else:
-                self.info_label.configure(text=base_info)
+                text = base_info
         else:
-            base_info = (
+            text = (
                 f"Downloaded: {format_size(downloaded)} "
                 f"• Speed: {speed:.1f} MB/s • Elapsed: {format_time(elapsed)}"
             )
-            self.info_label.configure(text=base_info)
+        
+        return self._set_text(text) or changed
+    
+    def _set_fraction(self, fraction):
+        """Set the progress bar (returns False if it already shows fraction)"""
+        if fraction == self._shown_fraction:
+            return False
+        self._shown_fraction = fraction
+        self.progress_bar.set(fraction)
+        return True
+    
+    def _set_text(self, text, **kwargs):
+        """Set the info text (returns False if it already shows text and no options are given)"""
+        if text == self._shown_text and not kwargs:
+            return False
+        self._shown_text = text
+        self.info_label.configure(text=text, **kwargs)
+        return True
     
     def reset(self):
         """Reset progress to initial state"""
-        self.progress_bar.set(0)
-        self.info_label.configure(text="Ready to download", text_color=COLORS['text_secondary'])
+        self._set_fraction(0)
+        self._set_text("Ready to download", text_color=COLORS['text_secondary'])
         self.set_batch_mode(False)
     
     def set_error(self, error_message):
@@ -164,10 +189,7 @@ class ProgressTracker(ctk.CTkFrame):
         Args:
             error_message (str): Error message to display
         """
-        self.info_label.configure(
-            text=f"Error: {error_message}", 
-            text_color=COLORS['danger']
-        )
+        self._set_text(f"Error: {error_message}", text_color=COLORS['danger'])
     
     def set_success(self, success_message):
         """
@@ -176,11 +198,8 @@ class ProgressTracker(ctk.CTkFrame):
         Args:
             success_message (str): Success message to display
         """
-        self.progress_bar.set(1.0)  # Full progress
-        self.info_label.configure(
-            text=success_message, 
-            text_color=COLORS['primary']
-        )
+        self._set_fraction(1.0)  # Full progress
+        self._set_text(success_message, text_color=COLORS['primary'])
     
     def set_status(self, status_text):
         """
@@ -189,4 +208,4 @@ class ProgressTracker(ctk.CTkFrame):
         Args:
             status_text (str): Status message to display
         """
-        self.info_label.configure(text=status_text)
\ No newline at end of file
+        self._set_text(status_text)
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Virtualized list component - only rows near the viewport have widgets
+"""
+
+import sys
+import tkinter as tk
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """
+    Scrollable list of fixed-height rows backed by a small pool of recycled row widgets
+
+    Rows are created on demand for the visible range plus an overscan margin and
+    re-bound to other indices while scrolling, so the widget count depends on the
+    viewport height instead of the number of rows.
+    """
+
+    def __init__(self, parent, row_height, create_row, bind_row, unbind_row=None, overscan=3,
+                 on_layout=None, **kwargs):
+        """
+        Args:
+            parent: Parent widget
+            row_height (int): Distance between the tops of two rows (row widget height plus spacing)
+            create_row (callable): create_row(parent) -> new row widget of fixed height
+            bind_row (callable): bind_row(row, index) fills a row with the data at index
+            unbind_row (callable, optional): unbind_row(row, index) before a row is reused
+            overscan (int): Rows kept bound above and below the viewport
+            on_layout (callable, optional): Called after the visible range was laid out
+        """
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(parent, **kwargs)
+
+        self.row_height = row_height
+        self.overscan = overscan
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._unbind_row = unbind_row
+        self._on_layout = on_layout
+
+        self._count = 0
+        self._offset = 0
+        self._pool = []   # Every row widget ever created
+        self._bound = {}  # index -> row widget
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._viewport = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self._viewport.grid(row=0, column=0, sticky="nsew")
+        self._viewport.bind("<Configure>", lambda event: self._layout())
+
+        self._scrollbar = ctk.CTkScrollbar(self, orientation="vertical", command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # Wheel events go to the widget under the pointer, so listen application wide
+        # while the pointer is over the list (tk-level bind: CTkFrame.bind targets its canvas)
+        self._wheel_bindings = []  # (sequence, funcid) of our bind_all handlers
+        tk.Frame.bind(self, "<Enter>", self._bind_mouse_wheel, add=True)
+        tk.Frame.bind(self, "<Leave>", self._on_leave, add=True)
+
+    def set_count(self, count):
+        """Set the number of rows and redraw the visible range"""
+        self._count = max(0, count)
+        for index in [i for i in self._bound if i >= self._count]:
+            self._release(index)
+        self._layout()
+
+    def get_count(self):
+        return self._count
+
+    def refresh(self):
+        """Re-bind all visible rows (after their data changed)"""
+        for index, row in list(self._bound.items()):
+            self._bind_row(row, index)
+
+    def refresh_index(self, index):
+        """Re-bind a single row if it is currently visible"""
+        row = self._bound.get(index)
+        if row is not None:
+            self._bind_row(row, index)
+
+    def bound_rows(self):
+        """
+        Get the rows that currently have data
+
+        Returns:
+            list: List of (index, row) tuples
+        """
+        return list(self._bound.items())
+
+    def rows(self):
+        """Get every pooled row widget (bound or idle)"""
+        return list(self._pool)
+
+    def visible_range(self):
+        """
+        Get the rows actually inside the viewport (without overscan)
+
+        Returns:
+            tuple: (first, last) inclusive indices, (0, -1) when empty
+        """
+        if not self._count:
+            return 0, -1
+        first = int(self._offset // self.row_height)
+        last = int((self._offset + self._viewport_height() - 1) // self.row_height)
+        return first, min(last, self._count - 1)
+
+    def scroll_to(self, index):
+        """Scroll so that the row at index is at the top"""
+        self._offset = index * self.row_height
+        self._layout()
+
+    def _viewport_height(self):
+        return self._reverse_widget_scaling(self._viewport.winfo_height())
+
+    def _content_height(self):
+        return self._count * self.row_height
+
+    def _layout(self):
+        """Bind rows to the visible index range and position them"""
+        height = self._viewport_height()
+        max_offset = max(0, self._content_height() - height)
+        self._offset = min(max(0, self._offset), max_offset)
+
+        if self._count:
+            first = max(0, int(self._offset // self.row_height) - self.overscan)
+            last = min(self._count - 1, int((self._offset + height) // self.row_height) + self.overscan)
+        else:
+            first, last = 0, -1
+
+        for index in [i for i in self._bound if i < first or i > last]:
+            self._release(index)
+
+        idle = [row for row in self._pool if row not in self._bound.values()]
+        for index in range(first, last + 1):
+            row = self._bound.get(index)
+            if row is None:
+                row = idle.pop() if idle else self._new_row()
+                self._bound[index] = row
+                self._bind_row(row, index)
+            row.place(x=0, y=index * self.row_height - self._offset, relwidth=1)
+
+        self._update_scrollbar(height)
+        if self._on_layout:
+            self._on_layout()
+
+    def _new_row(self):
+        row = self._create_row(self._viewport)
+        self._pool.append(row)
+        return row
+
+    def _release(self, index):
+        row = self._bound.pop(index)
+        if self._unbind_row:
+            self._unbind_row(row, index)
+        row.place_forget()
+
+    def _update_scrollbar(self, height):
+        total = self._content_height()
+        if total <= height or total == 0:
+            self._scrollbar.set(0, 1)
+        else:
+            self._scrollbar.set(self._offset / total, (self._offset + height) / total)
+
+    def _scroll_by(self, pixels):
+        self._offset += pixels
+        self._layout()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        """Scrollbar command ('moveto', fraction) or ('scroll', count, 'units'/'pages')"""
+        if action == "moveto":
+            self._offset = float(value) * self._content_height()
+            self._layout()
+        elif action == "scroll":
+            step = self._viewport_height() if unit == "pages" else self.row_height / 3
+            self._scroll_by(int(value) * step)
+
+    def destroy(self):
+        self._unbind_mouse_wheel()
+        super().destroy()
+
+    def _bind_mouse_wheel(self, event=None):
+        if self._wheel_bindings:
+            return
+        sequences = ("<Button-4>", "<Button-5>") if "linux" in sys.platform else ("<MouseWheel>",)
+        for sequence in sequences:
+            self._wheel_bindings.append((sequence, self.bind_all(sequence, self._on_mouse_wheel, add=True)))
+
+    def _unbind_mouse_wheel(self):
+        """Remove only our handlers (unbind_all would drop other widgets' wheel bindings too)"""
+        for sequence, funcid in self._wheel_bindings:
+            try:
+                script = self.tk.call("bind", "all", sequence)
+                kept = [line for line in script.split("\n") if funcid not in line]
+                self.tk.call("bind", "all", sequence, "\n".join(kept))
+                self.deletecommand(funcid)
+            except tk.TclError:
+                pass
+        self._wheel_bindings = []
+
+    def _on_leave(self, event):
+        # Moving onto a row also leaves the frame itself - keep listening while still inside
+        try:
+            if self._is_inside(self.winfo_containing(event.x_root, event.y_root)):
+                return
+        except (KeyError, tk.TclError):
+            pass
+        self._unbind_mouse_wheel()
+
+    def _on_mouse_wheel(self, event):
+        if not self._is_inside(event.widget):
+            return
+        if sys.platform.startswith("win"):
+            units = -event.delta / 120 * 3
+        elif sys.platform == "darwin":
+            units = -event.delta
+        else:
+            units = -1 if event.num == 4 else 1
+        self._scroll_by(units * self.row_height / 3)
+
+    def _is_inside(self, widget):
+        """Check whether a wheel event happened over this list"""
+        try:
+            path, own_path = str(widget), str(self)
+            return path == own_path or path.startswith(own_path + ".")
+        except Exception:
+            return False
@@ -3,12 +3,15 @@ Main application window for YouTube Downloader
 """
 
 import sys
+import time
 import customtkinter as ctk
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from tkinter import messagebox
-from config.settings import APP_TITLE, APP_VERSION, WINDOW_GEOMETRY, COLORS
+from config.settings import APP_TITLE, APP_VERSION, WINDOW_GEOMETRY, COLORS, PLAYLIST_RESOLVE_WORKERS
 from config.user_settings import user_settings
 from core import file_manager, YouTubeHandler, DownloadManager
+from core.progress import ProgressBus
 from gui.components import VideoPreview, PlaylistPanel, ProgressTracker, QualitySelector, SettingsDialog, LoadingPopup, UpdateDialog
 from utils.update_manager import update_download_libraries, check_library_updates
 from utils.app_updater import AppUpdater
@@ -29,8 +32,8 @@ class MainWindow(ctk.CTk):
         self.download_manager.set_progress_callback(self._on_progress_update)
         self.download_manager.set_batch_progress_callback(self._on_batch_progress_update)
         
-        # Progress update data (thread-safe storage)
-        self._latest_progress = None
+        # Progress updates from download threads (coalesced, drawn on the UI thread)
+        self.progress_bus = ProgressBus()
         self._progress_refresh_timer = None
         
         # Set up responsive window
@@ -947,6 +950,11 @@ class MainWindow(ctk.CTk):
     def _load_single_video_threaded(self, url):
         """Load a single video in background thread"""
         try:
+            # Known videos are previewed from cached metadata while their streams load
+            video_info = self.youtube_handler.get_cached_video_info(url)
+            if video_info:
+                self._show_single_video_preview(video_info)
+            
             # Load video (this runs in background thread)
             video = self.youtube_handler.load_video(url)
             
@@ -954,14 +962,8 @@ class MainWindow(ctk.CTk):
             self.download_manager.cached_video = video
             self.download_manager.cached_video_url = url
             
-            # Get video info and thumbnail
-            video_info = self.youtube_handler.get_video_info(video)
-            thumbnail_image = self.youtube_handler.get_thumbnail_image(
-                video_info['thumbnail_url']
-            )
-
-            # Show preview immediately on main thread
-            self.after(0, lambda: self._update_single_video_preview(video_info, thumbnail_image))
+            if not video_info:
+                self._show_single_video_preview(self.youtube_handler.get_video_info(video))
 
             # Get quality options with timeout fallback
             quality_options = self._get_quality_options_with_timeout(video, timeout_seconds=8)
@@ -973,6 +975,13 @@ class MainWindow(ctk.CTk):
             # Schedule error handling on main thread
             self.after(0, lambda: self._handle_load_error(str(e)))
     
+    def _show_single_video_preview(self, video_info):
+        """Fetch the thumbnail and show the preview on the main thread (called from a worker)"""
+        thumbnail_image = self.youtube_handler.get_thumbnail_image(
+            video_info['thumbnail_url']
+        )
+        self.after(0, lambda: self._update_single_video_preview(video_info, thumbnail_image))
+    
     def _get_quality_options_with_timeout(self, video, timeout_seconds=4):
         """Get quality options but fall back quickly if slow."""
         quality_options = {}
@@ -1099,68 +1108,59 @@ class MainWindow(ctk.CTk):
             self._handle_playlist_processing_error(str(e))
     
     def _process_playlist_items(self, playlist, total_videos):
-        """Process playlist items in background thread"""
+        """Process playlist items in background thread (entries are resolved concurrently)"""
         try:
-            successful_items = 0
-            first_video_info = None
-            thumbnail_image = None
-            quality_options = []
-            items_data = []
+            video_urls = list(playlist.video_urls)
+            workers = max(1, int(user_settings.get("playlist_resolve_workers", PLAYLIST_RESOLVE_WORKERS)))
+            items_by_index = {}
+            finished = 0
             
-            # Process each video with progress updates
-            for i, video_url in enumerate(list(playlist.video_urls)):
-                # Check for cancellation
-                if hasattr(self, 'loading_popup') and self.loading_popup.is_cancelled():
-                    self.after(0, lambda: self._handle_playlist_cancellation())
-                    return
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="playlist-resolve")
+            try:
+                futures = [
+                    pool.submit(self._resolve_playlist_item, i, video_url)
+                    for i, video_url in enumerate(video_urls)
+                ]
                 
-                try:
-                    # Update progress
-                    self.after(0, lambda idx=i: self.loading_popup.update_progress(
-                        idx, f"Loading video {idx+1}/{total_videos}...", f"Video {idx+1}"
-                    ))
-                    
-                    # Load video
-                    video = self.youtube_handler.safe_load_video_from_url(video_url)
+                # Results arrive out of order; each carries its playlist index.
+                # Wake up regularly so Cancel works while slow resolves are in flight.
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
                     
-                    if video is None:
-                        continue
+                    # Check for cancellation
+                    if self._playlist_cancelled():
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        self.after(0, lambda: self._handle_playlist_cancellation())
+                        return
                     
-                    # Get video info
-                    video_info = self.youtube_handler.get_video_info(video)
-                    
-                    # Update progress with video title
-                    self.after(0, lambda idx=i+1, title=video_info['title']: 
-                              self.loading_popup.update_progress(
-                                  idx, f"Processing video {idx}/{total_videos}...", title
-                              ))
-                    
-                    # Store first video for preview
-                    if successful_items == 0:
-                        first_video_info = video_info
-                        thumbnail_image = self.youtube_handler.get_thumbnail_image(
-                            video_info['thumbnail_url']
-                        )
-                        quality_options = self._get_quality_options_with_timeout(video, timeout_seconds=4)
-
-                    # Prepare item data for UI (fast quality list)
-                    item_thumb = self.youtube_handler.get_thumbnail_image(video_info['thumbnail_url'])
-                    item_quality = self.youtube_handler.get_quality_options_fast(video)
-                    items_data.append({
-                        "video": video,
-                        "index": i,
-                        "title": video_info.get("title", ""),
-                        "length": video_info.get("length", 0),
-                        "views": getattr(video, "views", None),
-                        "thumbnail": item_thumb,
-                        "quality_options": item_quality
-                    })
-                    
-                    successful_items += 1
-                    
-                except Exception as e:
-                    print(f"Error processing video {i+1}: {e}")
-                    continue
+                    for future in done:
+                        finished += 1
+                        item = future.result()
+                        title = item["title"] if item else ""
+                        if item:
+                            items_by_index[item["index"]] = item
+                        
+                        # Update progress
+                        self.after(0, lambda done=finished, title=title: self.loading_popup.update_progress(
+                            done, f"Loaded video {done}/{total_videos}...", title
+                        ))
+            finally:
+                pool.shutdown(wait=False)
+            
+            # Keep playlist order
+            items_data = [items_by_index[index] for index in sorted(items_by_index)]
+            successful_items = len(items_data)
+            first_video_info = None
+            thumbnail_image = None
+            quality_options = []
+            
+            # Store first video for preview
+            if items_data:
+                first_item = items_data[0]
+                first_video_info = first_item["video_info"]
+                thumbnail_image = self.youtube_handler.get_thumbnail_image(first_video_info['thumbnail_url'])
+                quality_options = self._get_quality_options_with_timeout(first_item["video"], timeout_seconds=4)
             
             # Complete processing on main thread
             self.after(0, lambda: self._complete_playlist_processing(
@@ -1170,6 +1170,48 @@ class MainWindow(ctk.CTk):
         except Exception as e:
             self.after(0, lambda: self._handle_playlist_processing_error(str(e)))
     
+    def _playlist_cancelled(self):
+        """Check whether the user cancelled loading the playlist (safe from any thread)"""
+        return hasattr(self, 'loading_popup') and self.loading_popup.is_cancelled()
+    
+    def _resolve_playlist_item(self, index, video_url):
+        """
+        Resolve one playlist entry (runs on a pool worker)
+        
+        Args:
+            index (int): Position of the entry in the playlist
+            video_url (str): Video URL
+            
+        Returns:
+            dict: Item data for the playlist panel, or None if the video could not be loaded
+        """
+        if self._playlist_cancelled():
+            return None
+        
+        try:
+            # Load video (stops trying further clients once the user cancelled)
+            video = self.youtube_handler.safe_load_video_from_url(video_url, stop_check=self._playlist_cancelled)
+            if video is None or self._playlist_cancelled():
+                return None
+            
+            # Get video info
+            video_info = self.youtube_handler.get_video_info(video)
+            
+            # Prepare item data for UI (fast quality list)
+            return {
+                "video": video,
+                "index": index,
+                "title": video_info.get("title", ""),
+                "length": video_info.get("length", 0),
+                "views": getattr(video, "views", None),
+                "thumbnail_url": video_info['thumbnail_url'],  # Fetched by the panel when the row is shown
+                "quality_options": self.youtube_handler.get_quality_options_fast(video),
+                "video_info": video_info
+            }
+        except Exception as e:
+            print(f"Error processing video {index+1}: {e}")
+            return None
+    
     def _complete_playlist_processing(self, playlist, successful_items, total_videos, 
                                     first_video_info, thumbnail_image, quality_options, items_data):
         """Complete playlist processing on main thread"""
@@ -1191,7 +1233,9 @@ class MainWindow(ctk.CTk):
                 self.after(1500, self._close_loading_popup)
 
             # Populate playlist items without blocking UI
-            self.playlist_panel.populate_items(items_data, progress_callback, on_populate_complete)
+            self.playlist_panel.populate_items(
+                items_data, progress_callback, on_populate_complete, self.youtube_handler
+            )
             self.is_playlist_loaded = True
             
             # Update download buttons
@@ -1280,6 +1324,7 @@ class MainWindow(ctk.CTk):
         self._set_download_state(True)
         
         # Initialize progress display immediately
+        self.progress_bus.reset_stats()
         self.progress_tracker.reset()
         self.progress_tracker.update_progress(0, 0, 0, 0, 0, "Starting download...")
         self.update_idletasks()  # Force immediate UI refresh
@@ -1325,6 +1370,7 @@ class MainWindow(ctk.CTk):
         self.progress_tracker.set_batch_mode(True, 0, len(selected_videos))
         
         # Initialize progress display immediately
+        self.progress_bus.reset_stats()
         self.progress_tracker.update_progress(0, 0, 0, 0, 0, "Starting batch download...")
         self.update_idletasks()  # Force immediate UI refresh
         
@@ -1367,31 +1413,31 @@ class MainWindow(ctk.CTk):
             self.load_button.configure(state="normal")
     
     def _start_progress_refresh_loop(self):
-        """Start a loop that continuously refreshes the progress display"""
+        """Start the loop that draws progress published on the progress bus"""
         def refresh_loop():
-            if self._latest_progress is not None:
-                # Update UI with latest progress data
-                downloaded, total, percentage, speed, elapsed, custom_text = self._latest_progress
-                self.progress_tracker.update_progress(
-                    downloaded, total, percentage, speed, elapsed, custom_text
-                )
-                # Force UI to process the update
-                self.update_idletasks()
-                
-                # Continue loop every 16ms (~60 FPS)
-                self._progress_refresh_timer = self.after(16, refresh_loop)
+            started = time.perf_counter()
+            progress = self.progress_bus.take()
+            changed = False
+            if progress is not None:
+                # Only values that differ from the screen are redrawn
+                changed = self.progress_tracker.update_progress(*progress)
+            delay = self.progress_bus.frame_done(changed, (time.perf_counter() - started) * 1000)
+            
+            if delay is not None:
+                self._progress_refresh_timer = self.after(delay, refresh_loop)
             else:
-                # No more progress data, stop loop
+                # Nothing new for a while - the next publish restarts the loop
                 self._progress_refresh_timer = None
         
-        refresh_loop()
+        if self._progress_refresh_timer is None:
+            refresh_loop()
     
     def _stop_progress_refresh_loop(self):
         """Stop the progress refresh loop"""
         if self._progress_refresh_timer is not None:
             self.after_cancel(self._progress_refresh_timer)
             self._progress_refresh_timer = None
-        self._latest_progress = None
+        self.progress_bus.stop()
     
     def _on_batch_progress_update(self, video_index, status, video_title, current, total):
         """
@@ -1399,7 +1445,7 @@ class MainWindow(ctk.CTk):
         
         Args:
             video_index (int): Index of current video
-            status (str): Status ('downloading', 'completed', 'error')
+            status (str): Status ('downloading', 'merging', 'completed', 'error')
             video_title (str): Title of current video
             current (int): Current video number
             total (int): Total videos in batch
@@ -1416,7 +1462,7 @@ class MainWindow(ctk.CTk):
         if self.is_playlist_loaded:
             if status == 'downloading':
                 self.playlist_panel.set_downloading_state(video_index, True)
-            elif status == 'completed':
+            elif status in ('completed', 'skipped'):
                 self.playlist_panel.set_downloading_state(video_index, False)
     
     def _cancel_download(self):
@@ -1439,12 +1485,9 @@ class MainWindow(ctk.CTk):
             elapsed (int): Elapsed time in seconds
             custom_text (str, optional): Custom status text
         """
-        # Store the latest progress data (thread-safe)
-        self._latest_progress = (downloaded, total, percentage, speed, elapsed, custom_text)
-        
-        # Start refresh loop if not already running
-        if self._progress_refresh_timer is None:
-            self._start_progress_refresh_loop()
+        # Store the latest progress data (thread-safe); the UI loop picks it up
+        if self.progress_bus.publish(downloaded, total, percentage, speed, elapsed, custom_text):
+            self.after(0, self._start_progress_refresh_loop)
     
     def _on_download_success(self, message):
         """Handle successful download completion"""
@@ -1464,6 +1507,9 @@ class MainWindow(ctk.CTk):
         """
         # Stop the progress refresh loop
         self._stop_progress_refresh_loop()
+        stats = self.progress_bus.get_stats()
+        print(f"📊 Progress UI: {stats['published']} updates, {stats['redraws']} redraws "
+              f"in {stats['frames']} frames, {stats['ui_time_ms']:.1f} ms on the UI thread")
         
         # Reset cancel button state first (in case it was disabled)
         self.cancel_button.configure(state="normal", text="Cancel")
@@ -0,0 +1,170 @@
+"""
+Tests for the multi-connection range downloader against a local HTTP server
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+import requests
+
+from core.segmented_downloader import SegmentedDownloader, RangeNotSupportedError
+from core.resume_journal import ResumeJournal
+from utils.network import NetworkManager
+from config.settings import SEGMENT_READ_SIZE, SEGMENT_POOL_SIZE
+
+BLOB = os.urandom(SEGMENT_READ_SIZE * 16 + 12345)
+SEGMENT_SIZE = SEGMENT_READ_SIZE * 2  # smallest size the downloader accepts is one read
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves BLOB, honouring single Range headers unless the server disables them"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive, so pooled connections are reused
+
+    def do_GET(self):
+        with self.server.log_lock:
+            self.server.in_flight += 1
+            self.server.peak = max(self.server.peak, self.server.in_flight)
+        try:
+            self._serve()
+        finally:
+            with self.server.log_lock:
+                self.server.in_flight -= 1
+
+    def _serve(self):
+        match = re.match(r'bytes=(\d+)-(\d*)$', self.headers.get('Range', ''))
+        if match and self.server.honour_range:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else len(BLOB) - 1
+            with self.server.log_lock:
+                self.server.ranges.append((start, end))
+            self.send_response(206)
+            self.send_header('Content-Range', f"bytes {start}-{end}/{len(BLOB)}")
+        else:
+            start, end = 0, len(BLOB) - 1
+            self.send_response(200)
+        self.send_header('Content-Length', str(end - start + 1))
+        self.end_headers()
+        try:
+            if self.server.delay:
+                time.sleep(self.server.delay)
+            self.wfile.write(BLOB[start:end + 1])
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client cancelled mid-range
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+    httpd.daemon_threads = True
+    httpd.honour_range = True
+    httpd.ranges = []
+    httpd.in_flight = 0
+    httpd.peak = 0
+    httpd.delay = 0
+    httpd.log_lock = threading.Lock()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/stream"
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def session():
+    with requests.Session() as s:
+        yield s
+
+
+def covered(ranges):
+    """Merge inclusive ranges into the byte spans they cover"""
+    return ResumeJournal._merge(ranges)
+
+
+def test_segments_reassemble_byte_exact(server, session, tmp_path):
+    file_path = str(tmp_path / "video.mp4")
+    reports = []
+    downloader = SegmentedDownloader(connections=4, segment_size=SEGMENT_SIZE, session=session)
+
+    downloader.download(
+        server.url, file_path, len(BLOB),
+        on_progress=lambda stream, chunk, remaining: reports.append(remaining)
+    )
+
+    with open(file_path, 'rb') as f:
+        assert f.read() == BLOB
+    assert len(server.ranges) == len(downloader.plan_segments(len(BLOB)))
+    assert reports == sorted(reports, reverse=True) and reports[-1] == 0
+
+
+def test_server_without_range_support_raises(server, session, tmp_path):
+    server.honour_range = False
+    downloader = SegmentedDownloader(connections=2, segment_size=SEGMENT_SIZE, session=session)
+
+    with pytest.raises(RangeNotSupportedError):
+        downloader.download(server.url, str(tmp_path / "video.mp4"), len(BLOB))
+
+
+def test_cancel_leaves_journal_and_resume_fetches_only_missing_ranges(server, session, tmp_path):
+    file_path = str(tmp_path / "video.mp4")
+    journal = ResumeJournal.load(file_path, "abc123", 137, len(BLOB))
+    downloaded = []
+
+    def stop_check():
+        return sum(downloaded) >= len(BLOB) // 3
+
+    with pytest.raises(KeyboardInterrupt):
+        SegmentedDownloader(connections=2, segment_size=SEGMENT_SIZE, session=session).download(
+            server.url, file_path, len(BLOB),
+            on_progress=lambda stream, chunk, remaining: downloaded.append(len(chunk)),
+            stop_check=stop_check, journal=journal
+        )
+
+    assert os.path.exists(journal.journal_path)
+    resumed = ResumeJournal.load(file_path, "abc123", 137, len(BLOB))
+    done_bytes = resumed.completed_bytes()
+    missing = resumed.missing_ranges()
+    assert 0 < done_bytes < len(BLOB)
+
+    server.ranges.clear()
+    SegmentedDownloader(connections=2, segment_size=SEGMENT_SIZE, session=session).download(
+        server.url, file_path, len(BLOB), journal=resumed
+    )
+
+    with open(file_path, 'rb') as f:
+        assert f.read() == BLOB
+    assert covered(server.ranges) == missing
+    assert sum(end - start + 1 for start, end in server.ranges) == len(BLOB) - done_bytes
+    assert resumed.is_complete()
+
+
+def test_concurrent_downloads_stay_within_the_segment_pool(server, tmp_path, caplog):
+    server.delay = 0.1  # long enough for every worker to hold a connection at once
+    session = NetworkManager().get_segment_session()
+    downloads = SEGMENT_POOL_SIZE // 4 + 4  # more connections requested than the pool holds
+
+    def download(number):
+        file_path = str(tmp_path / f"video{number}.mp4")
+        SegmentedDownloader(connections=4, segment_size=SEGMENT_SIZE, session=session).download(
+            server.url, file_path, len(BLOB)
+        )
+        with open(file_path, 'rb') as f:
+            return f.read() == BLOB
+
+    with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+        with ThreadPoolExecutor(max_workers=downloads) as pool:
+            assert all(pool.map(download, range(downloads)))
+    session.close()
+
+    assert server.peak <= SEGMENT_POOL_SIZE
+    assert "Connection pool is full" not in caplog.text
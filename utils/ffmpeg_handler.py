@@ -9,6 +9,8 @@ import zipfile
 import requests
 import json
 import shutil
+import time
+import threading
 from pathlib import Path
 from config.settings import (
     FFMPEG_VIDEO_CODEC, FFMPEG_AUDIO_CODEC,
@@ -17,13 +19,18 @@ from config.settings import (
     FFMPEG_TV_MAX_WIDTH, FFMPEG_TV_MAX_HEIGHT, FFMPEG_TV_CRF,
     FFMPEG_TV_VIDEO_PROFILE, FFMPEG_TV_VIDEO_LEVEL,
     FFMPEG_TV_AUDIO_BITRATE, FFMPEG_TV_AUDIO_CHANNELS,
-    FFMPEG_TV_AUDIO_SAMPLERATE, FFMPEG_TV_VSYNC_MODE
+    FFMPEG_TV_AUDIO_SAMPLERATE, FFMPEG_TV_VSYNC_MODE,
+    RESUME_JOURNAL_SUFFIX, RESUME_JOURNAL_MAX_AGE_DAYS
 )
 
 
 class FFmpegHandler:
     """Handles FFmpeg operations for video and audio merging with smart setup"""
     
+    # Process-wide resolution cache, re-validated only when the binary changes
+    _resolve_lock = threading.RLock()
+    _resolved = None
+    
     @staticmethod
     def detect_system_architecture():
         """
@@ -144,9 +151,104 @@ class FFmpegHandler:
         """
         Get the path to FFmpeg executable with auto-setup
         
+        The binary is validated once per process; later calls only compare its
+        mtime and size with the cached fingerprint.
+        
         Returns:
             str: Path to FFmpeg executable (local first, then system PATH)
         """
+        with FFmpegHandler._resolve_lock:
+            cached = FFmpegHandler._get_cached_resolution()
+            if cached:
+                return cached['path']
+            
+            ffmpeg_path = FFmpegHandler._resolve_ffmpeg_path()
+            if ffmpeg_path:
+                FFmpegHandler._resolved = {
+                    'path': ffmpeg_path,
+                    'fingerprint': FFmpegHandler._binary_fingerprint(ffmpeg_path),
+                    'ffprobe': None,
+                    'capabilities': None
+                }
+            return ffmpeg_path
+    
+    @staticmethod
+    def _get_cached_resolution():
+        """Return the cached resolution if the binary is unchanged, otherwise None."""
+        cached = FFmpegHandler._resolved
+        if not cached:
+            return None
+        fingerprint = FFmpegHandler._binary_fingerprint(cached['path'])
+        if fingerprint is None or fingerprint != cached['fingerprint']:
+            print("🔄 FFmpeg binary changed, validating again")
+            FFmpegHandler._resolved = None
+            return None
+        return cached
+    
+    @staticmethod
+    def _binary_fingerprint(ffmpeg_path):
+        """Identify a binary by resolved path, mtime and size (None if missing)."""
+        resolved = ffmpeg_path if os.path.exists(ffmpeg_path) else shutil.which(ffmpeg_path)
+        if not resolved:
+            return None
+        try:
+            stat = os.stat(resolved)
+        except OSError:
+            return None
+        return (os.path.realpath(resolved), stat.st_mtime_ns, stat.st_size)
+    
+    @staticmethod
+    def get_ffmpeg_capabilities():
+        """
+        Get version, encoders and hardware accelerations of the resolved FFmpeg (cached)
+        
+        Returns:
+            dict: version (str), encoders (set) and hwaccels (list); empty if FFmpeg is missing
+        """
+        ffmpeg_path = FFmpegHandler.get_ffmpeg_path()
+        if not ffmpeg_path:
+            return {}
+        with FFmpegHandler._resolve_lock:
+            cached = FFmpegHandler._resolved
+            if cached and cached['capabilities'] is not None:
+                return cached['capabilities']
+        
+        def run(*args):
+            try:
+                result = subprocess.run(
+                    [ffmpeg_path, '-hide_banner', *args],
+                    capture_output=True, text=True, encoding='utf-8', errors='ignore', timeout=10,
+                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                )
+                return result.stdout or ''
+            except (OSError, subprocess.SubprocessError):
+                return ''
+        
+        version_lines = run('-version').splitlines()
+        version = version_lines[0] if version_lines else ''
+        # Encoder lines follow a "------" separator: " V....D libx264   H.264 / AVC ..."
+        encoders = set()
+        listing = False
+        for line in run('-encoders').splitlines():
+            parts = line.split()
+            if not listing:
+                listing = line.strip().startswith('---')
+                continue
+            if len(parts) >= 2:
+                encoders.add(parts[1])
+        hwaccels = [
+            line.strip() for line in run('-hwaccels').splitlines()[1:] if line.strip()
+        ]
+        capabilities = {'version': version, 'encoders': encoders, 'hwaccels': hwaccels}
+        
+        with FFmpegHandler._resolve_lock:
+            if FFmpegHandler._resolved and FFmpegHandler._resolved['path'] == ffmpeg_path:
+                FFmpegHandler._resolved['capabilities'] = capabilities
+        return capabilities
+    
+    @staticmethod
+    def _resolve_ffmpeg_path():
+        """Locate and test FFmpeg (local first, downloading a compatible build if needed)."""
         # First, try the local FFmpeg installation
         project_root = Path(__file__).parent.parent
         local_ffmpeg = project_root / "ffmpeg" / "ffmpeg.exe"
@@ -209,6 +311,10 @@ class FFmpegHandler:
         Returns:
             bool: True if FFmpeg is available, False otherwise
         """
+        with FFmpegHandler._resolve_lock:
+            if FFmpegHandler._get_cached_resolution():
+                return True
+        
         # First, try the local FFmpeg installation
         project_root = Path(__file__).parent.parent
         local_ffmpeg = project_root / "ffmpeg" / "ffmpeg.exe"
@@ -378,36 +484,65 @@ class FFmpegHandler:
         return cmd
     
     @staticmethod
-    def cleanup_temp_files(*file_paths):
+    def cleanup_temp_files(*file_paths, keep_resumable=False):
         """
-        Clean up temporary files
+        Clean up temporary files (and their resume journals)
         
         Args:
             *file_paths: Variable number of file paths to delete
+            keep_resumable (bool): Keep partial files that have a resume journal
         """
         for file_path in file_paths:
             if not file_path:
                 continue
-            try:
-                path_obj = Path(file_path)
-                if path_obj.exists():
-                    path_obj.unlink()
-            except PermissionError:
+            journal_path = Path(str(file_path) + RESUME_JOURNAL_SUFFIX)
+            if keep_resumable and journal_path.exists():
+                continue
+            for path in (file_path, journal_path):
                 try:
-                    os.remove(file_path)
-                except OSError:
-                    pass
+                    path_obj = Path(path)
+                    if path_obj.exists():
+                        path_obj.unlink()
+                except PermissionError:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
 
     @staticmethod
-    def cleanup_default_temp_files(directory):
-        """Remove default temp files (video_temp/audio_temp) and yt-dlp partial downloads inside directory."""
+    def _is_resumable(temp_file):
+        """Check if a temp file is a resume journal or a partial download that still has one"""
+        name = temp_file.name
+        if name.endswith(RESUME_JOURNAL_SUFFIX) or name.endswith(RESUME_JOURNAL_SUFFIX + '.tmp'):
+            journal = temp_file if name.endswith(RESUME_JOURNAL_SUFFIX) else temp_file.with_name(name[:-4])
+            # Journals whose partial file is gone are orphans
+            if not journal.with_name(journal.name[:-len(RESUME_JOURNAL_SUFFIX)]).exists():
+                return False
+        else:
+            journal = temp_file.with_name(name + RESUME_JOURNAL_SUFFIX)
+        try:
+            age_days = (time.time() - journal.stat().st_mtime) / 86400
+        except OSError:
+            return False
+        # Journals nobody resumed for a long time are treated as plain temp files
+        return age_days <= RESUME_JOURNAL_MAX_AGE_DAYS
+
+    @staticmethod
+    def cleanup_default_temp_files(directory, keep_resumable=True, in_use=None):
+        """
+        Remove default temp files (video_temp/audio_temp) and yt-dlp partial downloads inside directory.
+        
+        Partial downloads with a recent resume journal are kept unless keep_resumable is False.
+        Temp files whose name contains one of the in_use ids (video ids of running jobs) are kept.
+        """
+        in_use = [item for item in (in_use or ()) if item]
         if not directory:
             return
         dir_path = Path(directory)
         if not dir_path.exists():
             return
         # Patterns for temp files:
-        # - video_temp*, audio_temp* (our adaptive download temps)
+        # - video_temp*, audio_temp* (our adaptive download temps and their resume journals)
         # - *.part (yt-dlp partial downloads)
         # - *.f*.mp4, *.f*.webm, *.f*.m4a (yt-dlp fragment files)
         # - *.ytdl (yt-dlp download info files)
@@ -436,32 +571,29 @@ class FFmpegHandler:
             else:
                 for temp_file in dir_path.glob(pattern):
                     try:
-                        if temp_file.is_file():
-                            temp_file.unlink()
+                        if not temp_file.is_file():
+                            continue
+                        if keep_resumable and pattern.endswith("_temp*") and FFmpegHandler._is_resumable(temp_file):
+                            continue
+                        if pattern.endswith("_temp*") and any(item in temp_file.name for item in in_use):
+                            continue
+                        temp_file.unlink()
                     except OSError:
                         pass
 
     @staticmethod
-    def _run_ffmpeg_command(cmd, progress_callback, stage_label):
-        """Run FFmpeg command with consistent progress handling."""
-        try:
-            if progress_callback:
-                progress_callback(0, f"Starting {stage_label}...")
-                process = subprocess.Popen(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    encoding='utf-8',
-                    errors='ignore',
-                    creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
-                )
-                progress_callback(25, f"Processing streams ({stage_label})...")
-                stdout, stderr = process.communicate(timeout=MERGE_TIMEOUT)
-                progress_callback(75, f"Finalizing ({stage_label})...")
-                if process.returncode != 0:
-                    raise subprocess.CalledProcessError(process.returncode, cmd, stderr)
-            else:
+    def _run_ffmpeg_command(cmd, progress_callback, stage_label, duration=None):
+        """
+        Run FFmpeg command with real progress parsed from its -progress output.
+        
+        Args:
+            cmd (list): FFmpeg command (output path last)
+            progress_callback (callable): Optional callback(percentage, stage)
+            stage_label (str): Label used in the stage text
+            duration (float, optional): Media duration in seconds (probed from the inputs if omitted)
+        """
+        if not progress_callback:
+            try:
                 subprocess.run(
                     cmd,
                     check=True,
@@ -472,8 +604,139 @@ class FFmpegHandler:
                     errors='ignore',
                     creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
                 )
-        except subprocess.TimeoutExpired:
+            except subprocess.TimeoutExpired:
+                raise subprocess.TimeoutExpired(cmd[0], MERGE_TIMEOUT, "FFmpeg took too long to process the video")
+            return
+        
+        progress_callback(0, f"Starting {stage_label}...")
+        if duration is None:
+            duration = FFmpegHandler._probe_input_duration(cmd)
+        
+        # Machine-readable key=value progress blocks on stdout
+        progress_cmd = [cmd[0], '-progress', 'pipe:1', '-nostats'] + list(cmd[1:])
+        process = subprocess.Popen(
+            progress_cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='ignore',
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+        )
+        
+        # Drain stderr on the side so a chatty FFmpeg never blocks on a full pipe
+        stderr_lines = []
+        stderr_thread = threading.Thread(
+            target=lambda: stderr_lines.extend(process.stderr), daemon=True
+        )
+        stderr_thread.start()
+        
+        timed_out = threading.Event()
+        def on_timeout():
+            timed_out.set()
+            process.kill()
+        watchdog = threading.Timer(MERGE_TIMEOUT, on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        
+        try:
+            block = {}
+            for line in process.stdout:
+                key, sep, value = line.strip().partition('=')
+                if not sep:
+                    continue
+                block[key] = value
+                if key == 'progress':
+                    percentage, stage = FFmpegHandler._parse_progress_block(block, duration, stage_label)
+                    progress_callback(percentage, stage)
+                    block = {}
+            process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                # Reading the pipe or the callback failed - never leave FFmpeg holding the output
+                process.kill()
+                process.wait()
+            stderr_thread.join(timeout=5)
+        
+        if timed_out.is_set():
             raise subprocess.TimeoutExpired(cmd[0], MERGE_TIMEOUT, "FFmpeg took too long to process the video")
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, cmd, stderr=''.join(stderr_lines[-20:]))
+
+    @staticmethod
+    def _parse_progress_block(block, duration, stage_label):
+        """
+        Turn one FFmpeg -progress block into a percentage and stage text.
+        
+        Args:
+            block (dict): Key/value pairs up to and including "progress"
+            duration (float): Media duration in seconds (0 if unknown)
+            stage_label (str): Label used in the stage text
+            
+        Returns:
+            tuple: (percentage, stage)
+        """
+        if block.get('progress') == 'end':
+            return 99, f"Finalizing ({stage_label})..."
+        
+        # out_time_ms is in microseconds despite its name
+        out_time_us = block.get('out_time_us') or block.get('out_time_ms') or ''
+        try:
+            out_seconds = int(out_time_us) / 1_000_000
+        except ValueError:
+            out_seconds = 0
+        percentage = min(out_seconds / duration * 100, 99) if duration else 0
+        
+        details = []
+        try:
+            fps = float(block.get('fps') or 0)
+        except ValueError:
+            fps = 0
+        if fps > 0:
+            details.append(f"{fps:.0f} fps")
+        speed = (block.get('speed') or '').strip()
+        if speed and speed != 'N/A':
+            details.append(f"{speed} realtime")
+        
+        stage = f"{stage_label} {percentage:.0f}%" if duration else f"{stage_label}..."
+        if details:
+            stage += f" ({', '.join(details)})"
+        return percentage, stage
+
+    @staticmethod
+    def _probe_input_duration(cmd):
+        """Get the longest input duration (seconds) of an FFmpeg command using ffprobe."""
+        ffprobe_path = FFmpegHandler._get_ffprobe_path(cmd[0])
+        inputs = [cmd[i + 1] for i, arg in enumerate(cmd[:-1]) if arg == '-i']
+        durations = [FFmpegHandler._probe_duration(str(path), ffprobe_path) for path in inputs]
+        return max(durations, default=0)
+
+    @staticmethod
+    def _probe_duration(file_path, ffprobe_path):
+        """Probe media duration in seconds using ffprobe (0 if unknown)."""
+        if not file_path or not os.path.exists(file_path):
+            return 0
+        cmd = [
+            ffprobe_path,
+            '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            file_path
+        ]
+        try:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='ignore',
+                timeout=10,
+                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            )
+            return float((result.stdout or '').strip() or 0)
+        except (OSError, ValueError, subprocess.SubprocessError):
+            return 0
 
     @staticmethod
     def _safe_delete(path_obj):
@@ -485,7 +748,21 @@ class FFmpegHandler:
 
     @staticmethod
     def _get_ffprobe_path(ffmpeg_path):
-        """Return matching ffprobe binary path."""
+        """Return matching ffprobe binary path (memoized with the resolved FFmpeg)."""
+        with FFmpegHandler._resolve_lock:
+            cached = FFmpegHandler._resolved
+            if cached and cached['path'] == ffmpeg_path and cached['ffprobe']:
+                return cached['ffprobe']
+        ffprobe_path = FFmpegHandler._find_ffprobe(ffmpeg_path)
+        with FFmpegHandler._resolve_lock:
+            cached = FFmpegHandler._resolved
+            if cached and cached['path'] == ffmpeg_path:
+                cached['ffprobe'] = ffprobe_path
+        return ffprobe_path
+
+    @staticmethod
+    def _find_ffprobe(ffmpeg_path):
+        """Look for ffprobe next to FFmpeg, then on PATH."""
         try:
             ffmpeg_path_obj = Path(ffmpeg_path)
             if ffmpeg_path_obj.exists():
@@ -8,7 +8,8 @@ from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 from config.settings import (
     MAX_RETRIES, RETRY_BACKOFF_FACTOR, REQUEST_TIMEOUT,
-    POOL_CONNECTIONS, POOL_MAX_SIZE, RETRY_STATUS_CODES, DEFAULT_HEADERS
+    POOL_CONNECTIONS, POOL_MAX_SIZE, RETRY_STATUS_CODES, DEFAULT_HEADERS,
+    SEGMENT_POOL_SIZE
 )
 
 # Disable insecure request warnings
@@ -20,6 +21,7 @@ class NetworkManager:
     
     def __init__(self):
         self._session = None
+        self._segment_session = None
     
     def create_session(self):
         """
@@ -28,6 +30,26 @@ class NetworkManager:
         Returns:
             requests.Session: Configured session with retry logic
         """
+        self._session = self._build_session(POOL_MAX_SIZE)
+        return self._session
+    
+    def get_segment_session(self):
+        """
+        Get the session of segmented downloads, create one if it doesn't exist
+        
+        Its pool keeps SEGMENT_POOL_SIZE connections per host, so parallel range
+        requests reuse connections instead of opening and discarding extra ones.
+        
+        Returns:
+            requests.Session: Session for range requests
+        """
+        if self._segment_session is None:
+            self._segment_session = self._build_session(SEGMENT_POOL_SIZE)
+        return self._segment_session
+    
+    @staticmethod
+    def _build_session(pool_maxsize):
+        """Create a session with retries and a connection pool of pool_maxsize per host"""
         session = requests.Session()
         
         # Configure retries
@@ -40,15 +62,13 @@ class NetworkManager:
         adapter = HTTPAdapter(
             max_retries=retry_strategy, 
             pool_connections=POOL_CONNECTIONS, 
-            pool_maxsize=POOL_MAX_SIZE
+            pool_maxsize=pool_maxsize
         )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         # Set longer timeouts
         session.timeout = REQUEST_TIMEOUT
-        
-        self._session = session
         return session
     
     def get_session(self):
@@ -72,10 +92,13 @@ class NetworkManager:
         return DEFAULT_HEADERS.copy()
     
     def close_session(self):
-        """Close the current session"""
+        """Close the current sessions"""
         if self._session:
             self._session.close()
             self._session = None
+        if self._segment_session:
+            self._segment_session.close()
+            self._segment_session = None
 
 
 # Global network manager instance
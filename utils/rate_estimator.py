@@ -0,0 +1,114 @@
+"""
+Transfer rate estimation - time-weighted moving average of download speed with ETA
+"""
+
+import math
+import time
+import threading
+from config.settings import RATE_HALF_LIFE, RATE_SAMPLE_INTERVAL
+
+
+class RateEstimator:
+    """
+    Smoothed transfer rate of one download (a stream, a stream pair or a batch)
+
+    Byte counts are sampled at most every sample_interval seconds, and each
+    sample is weighted by the time it covers: a sample half_life seconds old
+    counts half as much as a new one, however often progress is reported.
+    """
+
+    def __init__(self, total=0, half_life=RATE_HALF_LIFE, sample_interval=RATE_SAMPLE_INTERVAL, clock=time.monotonic):
+        """
+        Args:
+            total (int): Expected size in bytes (0 if unknown)
+            half_life (float): Seconds after which a sample has half its weight
+            sample_interval (float): Minimum seconds between two samples
+            clock (callable): Time source in seconds
+        """
+        self.half_life = half_life
+        self.sample_interval = sample_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset(total)
+
+    def reset(self, total=0):
+        """Start over for a new transfer"""
+        with self._lock:
+            self.total = total or 0
+            self.downloaded = 0
+            self.rate = 0.0   # smoothed bytes per second
+            self.peak = 0.0   # highest smoothed rate
+            self.samples = 0
+            self._start = self._clock()
+            self._sample_time = self._start
+            self._sample_bytes = 0
+
+    def update(self, downloaded, total=None):
+        """
+        Record the number of bytes transferred so far
+
+        Args:
+            downloaded (int): Bytes transferred since the start
+            total (int, optional): Expected size, if it became known
+
+        Returns:
+            float: Smoothed rate in bytes per second
+        """
+        now = self._clock()
+        with self._lock:
+            if total:
+                self.total = total
+            self.downloaded = downloaded
+            elapsed = now - self._sample_time
+            if elapsed < self.sample_interval:
+                return self.rate
+
+            instant = max(downloaded - self._sample_bytes, 0) / elapsed
+            if self.samples == 0:
+                self.rate = instant
+            else:
+                # Weight follows the time the sample covers, not the number of callbacks
+                alpha = 1 - math.exp(-elapsed * math.log(2) / self.half_life)
+                self.rate += alpha * (instant - self.rate)
+            self.samples += 1
+            self.peak = max(self.peak, self.rate)
+            self._sample_time = now
+            self._sample_bytes = downloaded
+            return self.rate
+
+    @property
+    def elapsed(self):
+        """Seconds since the transfer started"""
+        return self._clock() - self._start
+
+    @property
+    def mean(self):
+        """Average rate over the whole transfer in bytes per second"""
+        elapsed = self.elapsed
+        return self.downloaded / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """Seconds left at the smoothed rate (None if the size or rate is unknown)"""
+        if self.total <= 0 or self.rate <= 0:
+            return None
+        return max(self.total - self.downloaded, 0) / self.rate
+
+    def get_stats(self):
+        """
+        Get the current estimates
+
+        Returns:
+            dict: downloaded, total, rate, peak and mean (bytes per second),
+                eta and elapsed (seconds; eta is None if unknown)
+        """
+        with self._lock:
+            return {
+                'downloaded': self.downloaded,
+                'total': self.total,
+                'rate': self.rate,
+                'peak': self.peak,
+                'mean': self.mean,
+                'eta': self.eta,
+                'elapsed': self.elapsed
+            }
@@ -0,0 +1,93 @@
+"""
+Background thumbnail loading - a small worker pool fetches the thumbnails the UI currently wants
+"""
+
+import heapq
+import itertools
+import threading
+
+
+class ThumbnailLoader:
+    """Fetches and decodes thumbnails on a bounded pool, lowest priority value first"""
+
+    def __init__(self, fetch, on_loaded, workers=3, name="thumbnail-loader"):
+        """
+        Args:
+            fetch (callable): fetch(url) -> PIL.Image or None, runs on a worker thread
+            on_loaded (callable): on_loaded(key, image) called on the worker thread (image is None on failure)
+            workers (int): Maximum number of concurrent fetches
+            name (str): Worker thread name, also used in error messages
+        """
+        self._fetch = fetch
+        self._on_loaded = on_loaded
+        self._workers = max(1, workers)
+        self._name = name
+
+        self._condition = threading.Condition()
+        self._queue = []    # heap of (priority, seq, key)
+        self._wanted = {}   # key -> (url, priority) of queued requests
+        self._in_flight = set()
+        self._threads = []
+        self._seq = itertools.count()
+
+    def set_wanted(self, wanted):
+        """
+        Replace the queued requests (thumbnails already being fetched still finish)
+
+        Args:
+            wanted (dict): key -> (url, priority); lower priority values are fetched first
+        """
+        with self._condition:
+            self._wanted = {key: value for key, value in wanted.items() if key not in self._in_flight}
+            self._queue = [(priority, next(self._seq), key) for key, (_, priority) in self._wanted.items()]
+            heapq.heapify(self._queue)
+            if self._queue:
+                self._start_workers()
+                self._condition.notify_all()
+
+    def cancel_all(self):
+        """Drop every queued request"""
+        self.set_wanted({})
+
+    def _start_workers(self):
+        """Start worker threads up to the limit (caller holds the lock)"""
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < min(self._workers, len(self._queue) + len(self._in_flight)):
+            thread = threading.Thread(target=self._worker, name=self._name, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_request(self):
+        """Pop the most urgent request, or None after a short idle wait"""
+        with self._condition:
+            if not self._queue:
+                self._condition.wait(timeout=5)
+            while self._queue:
+                _, _, key = heapq.heappop(self._queue)
+                request = self._wanted.pop(key, None)
+                if request is not None:
+                    self._in_flight.add(key)
+                    return key, request[0]
+            return None
+
+    def _worker(self):
+        while True:
+            request = self._next_request()
+            if request is None:
+                with self._condition:
+                    if not self._queue:
+                        # Idle workers exit; set_wanted starts new ones when needed
+                        self._threads = [t for t in self._threads if t is not threading.current_thread()]
+                        return
+                continue
+
+            key, url = request
+            try:
+                image = self._fetch(url)
+            except Exception as e:
+                print(f"Error in {self._name}: {e}")
+                image = None
+            finally:
+                with self._condition:
+                    self._in_flight.discard(key)
+            self._on_loaded(key, image)